@@ -0,0 +1,494 @@
+"""
+End-to-End Benchmark
+
+Runs the API (uvicorn) against the local fake OpenAI server and drives
+realistic workloads over HTTP, so /upload and /ask performance can be
+measured offline and without API costs:
+
+- single_upload: documents uploaded one at a time
+- bulk_upload: documents uploaded concurrently
+- concurrent_ask: questions about the last document, concurrently
+
+Per workload it reports throughput and end-to-end latency percentiles,
+the fake server's per-call latencies (embeddings, extraction, answers),
+and the server-side stage timings recorded in /metrics/json meanwhile.
+
+With --output the results are written as JSON; with --baseline a
+previous output is compared against, and the run fails when a p95
+latency or throughput regresses by more than --tolerance.
+
+Usage:
+    python -m benchmarks.e2e_benchmark
+    python -m benchmarks.e2e_benchmark --asks 500 --concurrency 16 --chat-latency-ms 800
+    python -m benchmarks.e2e_benchmark --output base.json
+    python -m benchmarks.e2e_benchmark --baseline base.json --tolerance 0.2
+"""
+
+from typing import Dict, Any, List, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import requests
+
+REPO_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Interval at which each API worker writes its metrics for the others
+METRICS_FLUSH_INTERVAL_SECONDS: float = 0.25
+
+QUESTIONS: List[str] = [
+    "What is the weight?",
+    "Who is the carrier?",
+    "Who is the shipper?",
+    "Who is the consignee?",
+    "What is the load ID?",
+    "When is the pickup date?",
+    "When will it be delivered?",
+    "What is the rate?",
+    "How many pallets of item 3 are there?",
+    "Are there any special instructions?",
+]
+
+
+def make_document(number: int, line_items: int) -> str:
+    """
+    Synthetic bill of lading.
+
+    Args:
+        number (int): Document number, varies the field values.
+        line_items (int): Line item rows in the body.
+
+    Returns:
+        str
+    """
+
+    rng: random.Random = random.Random(number)
+
+    lines: List[str] = [
+        "BILL OF LADING",
+        f"Load ID: LD-{100000 + number}",
+        f"Shipper: Shipper {rng.randint(1, 500)} Corp",
+        f"Consignee: Consignee {rng.randint(1, 500)} LLC",
+        f"Carrier: Carrier {rng.randint(1, 50)} Trucking",
+        f"Pickup Date: 2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        f"Delivery Date: 2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        f"Weight: {rng.randint(1000, 45000)} lbs",
+        f"Rate: {rng.randint(500, 5000)} USD",
+        "Equipment Type: Dry Van 53ft",
+        "",
+        "LINE ITEMS",
+    ]
+
+    for item in range(1, line_items + 1):
+        lines.append(
+            f"Item {item}: {rng.randint(1, 30)} pallets of SKU-{rng.randint(1000, 9999)}"
+            f", {rng.randint(100, 2000)} lbs, freight class {rng.choice([50, 70, 85])}"
+        )
+
+    lines += ["", "Special instructions: call consignee 1 hour before delivery."]
+
+    return "\n".join(lines)
+
+
+def free_port() -> int:
+    """
+    An unused local TCP port.
+
+    Returns:
+        int
+    """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(url: str, timeout: float = 60.0) -> None:
+    """
+    Poll a URL until it answers.
+
+    Args:
+        url (str)
+        timeout (float): Seconds before giving up.
+    """
+
+    deadline: float = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url, timeout=1.0)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+
+    raise SystemExit(f"{url} did not come up within {timeout:.0f}s")
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    """
+    p50/p95/p99 of latencies, in milliseconds.
+
+    Args:
+        latencies (List[float]): Seconds.
+
+    Returns:
+        Dict[str, float]
+    """
+
+    if not latencies:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+
+    return {
+        f"p{q}_ms": 1000.0 * float(np.percentile(latencies, q)) for q in (50, 95, 99)
+    }
+
+
+def summaries(api_url: str) -> Dict[str, Dict[str, float]]:
+    """
+    Server-side summaries (count/sum) from the /metrics/json endpoint.
+
+    Args:
+        api_url (str)
+
+    Returns:
+        Dict[str, Dict[str, float]]
+    """
+
+    # With several workers, let the others flush what they recorded
+    time.sleep(2 * METRICS_FLUSH_INTERVAL_SECONDS)
+
+    response = requests.get(f"{api_url}/metrics/json", timeout=10)
+
+    return response.json().get("summaries", {})
+
+
+def run_workload(
+    api_url: str,
+    fake_url: str,
+    calls: List[Callable[[requests.Session], requests.Response]],
+    concurrency: int,
+) -> Dict[str, Any]:
+    """
+    Run calls on a thread pool and measure them.
+
+    Args:
+        api_url (str): API under test.
+        fake_url (str): Fake OpenAI server.
+        calls (List[Callable[[requests.Session], requests.Response]]):
+            One HTTP request each.
+        concurrency (int): Requests in flight.
+
+    Returns:
+        Dict[str, Any]: Throughput, latency percentiles, errors, upstream
+            call latencies and server stage means.
+    """
+
+    requests.post(f"{fake_url}/stats/reset", timeout=10)
+    stages_before: Dict[str, Dict[str, float]] = summaries(api_url)
+
+    sessions: threading.local = threading.local()
+
+    def timed(call: Callable[[requests.Session], requests.Response]) -> Tuple:
+        if not hasattr(sessions, "session"):
+            sessions.session = requests.Session()
+
+        start: float = time.perf_counter()
+        response: requests.Response = call(sessions.session)
+        elapsed: float = time.perf_counter() - start
+
+        ok: bool = response.ok and "error" not in response.json()
+
+        return elapsed, ok
+
+    start: float = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes: List[Tuple] = list(executor.map(timed, calls))
+
+    wall_seconds: float = time.perf_counter() - start
+
+    stages_after: Dict[str, Dict[str, float]] = summaries(api_url)
+
+    stages: Dict[str, Dict[str, float]] = {}
+
+    for name, after in stages_after.items():
+        before: Dict[str, float] = stages_before.get(name, {"count": 0, "sum": 0})
+        count: float = after["count"] - before["count"]
+
+        if count:
+            stages[name] = {
+                "count": count,
+                "mean_ms": 1000.0 * (after["sum"] - before["sum"]) / count,
+            }
+
+    return {
+        "requests": len(calls),
+        "concurrency": concurrency,
+        "errors": sum(not ok for _, ok in outcomes),
+        "throughput_rps": len(calls) / wall_seconds,
+        **percentiles([elapsed for elapsed, _ in outcomes]),
+        "upstream": requests.get(f"{fake_url}/stats", timeout=10).json(),
+        "stages": stages,
+    }
+
+
+def upload_call(
+    api_url: str, number: int, line_items: int
+) -> Callable[[requests.Session], requests.Response]:
+    """
+    Request uploading synthetic document number.
+
+    Args:
+        api_url (str)
+        number (int)
+        line_items (int)
+
+    Returns:
+        Callable[[requests.Session], requests.Response]
+    """
+
+    document: bytes = make_document(number, line_items).encode("utf-8")
+
+    # Distinct names: uploads are staged under their file name
+    return lambda session: session.post(
+        f"{api_url}/upload",
+        files={"file": (f"bol-{number}.txt", document, "text/plain")},
+        data={"api_key": "benchmark"},
+        timeout=600,
+    )
+
+
+def ask_call(
+    api_url: str, number: int
+) -> Callable[[requests.Session], requests.Response]:
+    """
+    Request asking question number (from QUESTIONS, round robin).
+
+    Args:
+        api_url (str)
+        number (int)
+
+    Returns:
+        Callable[[requests.Session], requests.Response]
+    """
+
+    params: Dict[str, str] = {
+        "query": QUESTIONS[number % len(QUESTIONS)],
+        "api_key": "benchmark",
+        "session_id": f"benchmark-{number % 32}",
+    }
+
+    return lambda session: session.post(f"{api_url}/ask", params=params, timeout=600)
+
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    """
+    Print one workload's results.
+
+    Args:
+        name (str): Workload name.
+        result (Dict[str, Any])
+    """
+
+    print(
+        f"\n{name}: {result['requests']} requests, concurrency "
+        f"{result['concurrency']}, {result['errors']} errors, "
+        f"{result['throughput_rps']:.2f} req/s, p50 {result['p50_ms']:.0f} ms, "
+        f"p95 {result['p95_ms']:.0f} ms, p99 {result['p99_ms']:.0f} ms"
+    )
+
+    for kind, stats in sorted(result["upstream"].items()):
+        print(
+            f"  upstream {kind}: {stats['count']:.0f} calls, "
+            f"p50 {1000 * stats['p50']:.0f} ms, p95 {1000 * stats['p95']:.0f} ms"
+        )
+
+    for stage, stats in sorted(result["stages"].items()):
+        print(
+            f"  stage {stage}: {stats['count']:.0f} observations, "
+            f"mean {stats['mean_ms']:.1f} ms"
+        )
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Regressions against a baseline run.
+
+    Args:
+        results (Dict[str, Any]): This run, per workload.
+        baseline (Dict[str, Any]): Baseline run, per workload.
+        tolerance (float): Allowed relative regression.
+
+    Returns:
+        List[str]: One message per regression.
+    """
+
+    regressions: List[str] = []
+
+    for name, result in results.items():
+        reference: Dict[str, Any] = baseline.get(name)
+
+        if not reference:
+            continue
+
+        if result["p95_ms"] > reference["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.0f} ms vs {reference['p95_ms']:.0f} ms"
+            )
+
+        if result["throughput_rps"] < reference["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['throughput_rps']:.2f} req/s vs "
+                f"{reference['throughput_rps']:.2f} req/s"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--uploads", type=int, default=3)
+    parser.add_argument("--bulk-uploads", type=int, default=8)
+    parser.add_argument("--asks", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--line-items", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--state-backend", default="memory")
+    parser.add_argument("--chat-latency-ms", type=float, default=300.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--dimension", type=int, default=3072)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.workers > 1 and args.state_backend == "memory":
+        raise SystemExit("Several workers need --state-backend sqlite.")
+
+    fake_url: str = f"http://127.0.0.1:{free_port()}"
+    api_url: str = f"http://127.0.0.1:{free_port()}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        environment: Dict[str, str] = {
+            **os.environ,
+            "PYTHONPATH": REPO_ROOT,
+            "OPENAI_BASE_URL": f"{fake_url}/v1",
+            "STATE_BACKEND": args.state_backend,
+            "STATE_DB_PATH": os.path.join(directory, "state.db"),
+            "STATE_INDEX_DIR": os.path.join(directory, "indexes"),
+            "METRICS_FLUSH_INTERVAL_SECONDS": str(METRICS_FLUSH_INTERVAL_SECONDS),
+        }
+
+        processes: List[subprocess.Popen] = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.fake_openai",
+                    "--port",
+                    fake_url.rsplit(":", 1)[1],
+                    "--chat-latency-ms",
+                    str(args.chat_latency_ms),
+                    "--embedding-latency-ms",
+                    str(args.embedding_latency_ms),
+                    "--jitter-ms",
+                    str(args.jitter_ms),
+                    "--dimension",
+                    str(args.dimension),
+                ],
+                cwd=REPO_ROOT,
+                env=environment,
+            ),
+            # Uploads are staged in the working directory
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "uvicorn",
+                    "src.api.main:app",
+                    "--port",
+                    api_url.rsplit(":", 1)[1],
+                    "--workers",
+                    str(args.workers),
+                    "--log-level",
+                    "warning",
+                ],
+                cwd=directory,
+                # Workers split the embedding rate limits by this count
+                env={**environment, "WEB_CONCURRENCY": str(args.workers)},
+            ),
+        ]
+
+        try:
+            wait_until_up(f"{fake_url}/stats")
+            wait_until_up(f"{api_url}/")
+
+            results: Dict[str, Any] = {}
+
+            results["single_upload"] = run_workload(
+                api_url,
+                fake_url,
+                [
+                    upload_call(api_url, number, args.line_items)
+                    for number in range(args.uploads)
+                ],
+                1,
+            )
+
+            results["bulk_upload"] = run_workload(
+                api_url,
+                fake_url,
+                [
+                    upload_call(api_url, args.uploads + number, args.line_items)
+                    for number in range(args.bulk_uploads)
+                ],
+                args.concurrency,
+            )
+
+            results["concurrent_ask"] = run_workload(
+                api_url,
+                fake_url,
+                [ask_call(api_url, number) for number in range(args.asks)],
+                args.concurrency,
+            )
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+    for name, result in results.items():
+        print_result(name, result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            regressions: List[str] = compare(results, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
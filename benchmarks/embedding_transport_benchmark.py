@@ -0,0 +1,188 @@
+"""
+Embedding Transport Benchmark
+
+Compares, per embedding batch, the cost of turning an embeddings API
+response into a normalized float32 matrix ready for FAISS:
+
+- float: JSON float lists -> Python lists -> np.array().astype()
+  -> normalized copy (the previous path)
+- base64: base64 strings decoded straight into a preallocated float32
+  matrix, normalized in place (the current path)
+
+Responses are synthesized locally, so no API key is needed; payload
+sizes show the difference on the wire.
+
+Usage:
+    python -m benchmarks.embedding_transport_benchmark
+    python -m benchmarks.embedding_transport_benchmark --batch-size 256 --dimension 3072
+"""
+
+from typing import Dict, Any, List, Callable
+import argparse
+import base64
+import json
+import time
+import tracemalloc
+
+import faiss
+import numpy as np
+
+
+def make_payloads(batch_size: int, dimension: int) -> Dict[str, str]:
+    """
+    Synthesize embeddings API response bodies in both encodings.
+
+    Args:
+        batch_size (int): Embeddings per response.
+        dimension (int): Embedding dimension.
+
+    Returns:
+        Dict[str, str]: JSON body per encoding.
+    """
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    vectors: np.ndarray = rng.standard_normal((batch_size, dimension)).astype(
+        np.float32
+    )
+
+    float_body: str = json.dumps(
+        {
+            "data": [
+                {"index": idx, "embedding": v.tolist()} for idx, v in enumerate(vectors)
+            ]
+        }
+    )
+
+    base64_body: str = json.dumps(
+        {
+            "data": [
+                {
+                    "index": idx,
+                    "embedding": base64.b64encode(v.astype("<f4").tobytes()).decode(),
+                }
+                for idx, v in enumerate(vectors)
+            ]
+        }
+    )
+
+    return {"float": float_body, "base64": base64_body}
+
+
+def decode_float(body: str) -> np.ndarray:
+    """
+    Previous path: float lists, array conversion, normalized copy.
+
+    Args:
+        body (str): JSON response body.
+
+    Returns:
+        np.ndarray
+    """
+
+    embeddings: List[List[float]] = [
+        item["embedding"] for item in json.loads(body)["data"]
+    ]
+
+    vectors: np.ndarray = np.array(embeddings).astype("float32")
+
+    norms: np.ndarray = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+
+    return vectors / norms
+
+
+def decode_base64(body: str) -> np.ndarray:
+    """
+    Current path: base64 into a preallocated matrix, normalized in place.
+
+    Args:
+        body (str): JSON response body.
+
+    Returns:
+        np.ndarray
+    """
+
+    data: List[Dict[str, Any]] = json.loads(body)["data"]
+
+    out: np.ndarray = None
+
+    for position, item in enumerate(data):
+        vector: np.ndarray = np.frombuffer(
+            base64.b64decode(item["embedding"]), dtype="<f4"
+        )
+
+        if out is None:
+            out = np.empty((len(data), vector.shape[0]), dtype=np.float32)
+
+        out[position] = vector
+
+    faiss.normalize_L2(out)
+
+    return out
+
+
+def measure(
+    decode: Callable[[str], np.ndarray], body: str, repeats: int
+) -> Dict[str, float]:
+    """
+    Median latency and peak traced allocation of a decode path.
+
+    Args:
+        decode (Callable[[str], np.ndarray]): Decode function.
+        body (str): Response body.
+        repeats (int): Timed repetitions.
+
+    Returns:
+        Dict[str, float]: latency_ms and peak_mib.
+    """
+
+    latencies: List[float] = []
+
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        decode(body)
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "latency_ms": 1000.0 * float(np.median(latencies)),
+        "peak_mib": peak / 2**20,
+    }
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--dimension", type=int, default=3072)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads: Dict[str, str] = make_payloads(args.batch_size, args.dimension)
+
+    # Both paths must produce the same normalized vectors
+    np.testing.assert_allclose(
+        decode_float(payloads["float"]), decode_base64(payloads["base64"]), atol=1e-6
+    )
+
+    for name, decode in (("float", decode_float), ("base64", decode_base64)):
+        result: Dict[str, float] = measure(decode, payloads[name], args.repeats)
+
+        print(
+            f"{name}: payload {len(payloads[name]) / 2**20:.1f} MiB, "
+            f"decode {result['latency_ms']:.1f} ms, "
+            f"peak allocation {result['peak_mib']:.1f} MiB "
+            f"per batch of {args.batch_size}"
+        )
+
+
+if __name__ == "__main__":
+    main()
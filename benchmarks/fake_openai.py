@@ -0,0 +1,351 @@
+"""
+Fake OpenAI Server
+
+Local stand-in for the OpenAI chat completion and embedding endpoints,
+so the API can be benchmarked without paying for live calls. Point the
+app at it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 (the OpenAI
+client reads it when no base_url is passed).
+
+Responses are deterministic:
+- Embeddings: hashed bag-of-words vectors, so questions still retrieve
+  the chunks that share their words
+- Extraction: "Label: value" lines of the document mapped to the
+  shipment_details schema
+- Answers: the first line of the retrieved context
+
+Every call waits for its configured latency plus uniform jitter, and is
+recorded; GET /stats returns the per-kind call latencies.
+
+Usage:
+    python -m benchmarks.fake_openai --port 8765
+    python -m benchmarks.fake_openai --chat-latency-ms 800 --jitter-ms 200
+"""
+
+from typing import Dict, Any, List, Optional
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+
+from src.core.data.chunker import StructureAwareChunker
+from src.core.data.schemas import ShipmentDetailsModel
+
+WORD_PATTERN: re.Pattern = re.compile(r"[a-z0-9]+")
+
+LABEL_PATTERN: re.Pattern = re.compile(r"^\s*([A-Za-z][A-Za-z #/_-]*?)\s*:\s*(.+?)\s*$")
+
+
+def _field_labels() -> Dict[str, str]:
+    """
+    Document label (lowercased) -> shipment_details field.
+
+    Returns:
+        Dict[str, str]
+    """
+
+    labels: Dict[str, str] = {}
+
+    for field in ShipmentDetailsModel.model_fields:
+        labels[field.lower()] = field
+        labels[field.lower().replace("_", " ")] = field
+
+    for field, aliases in StructureAwareChunker.FIELD_ALIASES.items():
+        for alias in aliases:
+            labels[alias.lower()] = field
+
+    labels["carrier"] = "carrier_name"
+
+    return labels
+
+
+FIELD_LABELS: Dict[str, str] = _field_labels()
+
+
+def embed(text: str, dimension: int) -> np.ndarray:
+    """
+    Deterministic unit vector of a text (signed feature hashing).
+
+    Args:
+        text (str)
+        dimension (int)
+
+    Returns:
+        np.ndarray: float32 vector.
+    """
+
+    vector: np.ndarray = np.zeros(dimension, dtype=np.float32)
+
+    for word in WORD_PATTERN.findall(text.lower()):
+        digest: int = int.from_bytes(hashlib.md5(word.encode()).digest()[:8], "little")
+        vector[digest % dimension] += 1.0 if digest & (1 << 63) else -1.0
+
+    norm: float = float(np.linalg.norm(vector))
+
+    return vector / norm if norm else vector
+
+
+def extract_fields(document_text: str) -> Dict[str, Optional[str]]:
+    """
+    Map "Label: value" lines to shipment_details.
+
+    Args:
+        document_text (str)
+
+    Returns:
+        Dict[str, Optional[str]]
+    """
+
+    details: Dict[str, Optional[str]] = {
+        field: None for field in ShipmentDetailsModel.model_fields
+    }
+
+    for line in document_text.splitlines():
+        match: Optional[re.Match] = LABEL_PATTERN.match(line)
+
+        if match:
+            field: Optional[str] = FIELD_LABELS.get(match.group(1).lower())
+
+            if field and details[field] is None:
+                details[field] = match.group(2)
+
+    return details
+
+
+def answer_from_context(prompt: str) -> str:
+    """
+    First line of the retrieved context in an answer prompt.
+
+    Args:
+        prompt (str): Last user message.
+
+    Returns:
+        str
+    """
+
+    context: str = prompt.split("Retrieved Document Context:", 1)[-1]
+    context = context.split("Current Question:", 1)[0]
+
+    for line in context.splitlines():
+        if line.strip():
+            return line.strip()
+
+    return "Not found in document."
+
+
+class CallRecorder:
+    """
+    Thread-safe record of call latencies per kind.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty record.
+        """
+
+        self.latencies: Dict[str, List[float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, kind: str, seconds: float) -> None:
+        """
+        Record one call.
+
+        Args:
+            kind (str): embeddings, chat_extraction or chat_answer.
+            seconds (float): Time to respond, injected latency included.
+        """
+
+        with self._lock:
+            self.latencies.setdefault(kind, []).append(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Call count and latency percentiles (seconds) per kind.
+
+        Returns:
+            Dict[str, Dict[str, float]]
+        """
+
+        with self._lock:
+            return {
+                kind: {
+                    "count": len(values),
+                    "p50": float(np.percentile(values, 50)),
+                    "p95": float(np.percentile(values, 95)),
+                    "p99": float(np.percentile(values, 99)),
+                }
+                for kind, values in self.latencies.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Forget all calls.
+        """
+
+        with self._lock:
+            self.latencies.clear()
+
+
+def create_app(
+    chat_latency_ms: float = 300.0,
+    embedding_latency_ms: float = 50.0,
+    jitter_ms: float = 0.0,
+    dimension: int = 3072,
+    seed: int = 0,
+) -> FastAPI:
+    """
+    Build the fake server.
+
+    Args:
+        chat_latency_ms (float): Mean chat completion latency.
+        embedding_latency_ms (float): Mean embedding request latency.
+        jitter_ms (float): Uniform jitter added to both (+/-).
+        dimension (int): Embedding dimension.
+        seed (int): Seed of the jitter sequence.
+
+    Returns:
+        FastAPI
+    """
+
+    app: FastAPI = FastAPI(title="Fake OpenAI")
+
+    jitter: random.Random = random.Random(seed)
+    recorder: CallRecorder = CallRecorder()
+
+    async def wait(kind: str, latency_ms: float, start: float) -> None:
+        delay: float = max(0.0, latency_ms + jitter.uniform(-jitter_ms, jitter_ms))
+
+        await asyncio.sleep(delay / 1000.0)
+
+        recorder.record(kind, time.perf_counter() - start)
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request) -> Dict[str, Any]:
+        start: float = time.perf_counter()
+
+        body: Dict[str, Any] = await request.json()
+
+        inputs: List[str] = (
+            [body["input"]] if isinstance(body["input"], str) else body["input"]
+        )
+
+        data: List[Dict[str, Any]] = []
+
+        for idx, text in enumerate(inputs):
+            vector: np.ndarray = embed(text, body.get("dimensions") or dimension)
+
+            data.append(
+                {
+                    "object": "embedding",
+                    "index": idx,
+                    "embedding": (
+                        base64.b64encode(vector.astype("<f4").tobytes()).decode()
+                        if body.get("encoding_format") == "base64"
+                        else vector.tolist()
+                    ),
+                }
+            )
+
+        tokens: int = sum(len(text) // 4 + 1 for text in inputs)
+
+        await wait("embeddings", embedding_latency_ms, start)
+
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> Dict[str, Any]:
+        start: float = time.perf_counter()
+
+        body: Dict[str, Any] = await request.json()
+
+        messages: List[Dict[str, str]] = body["messages"]
+        prompt: str = messages[-1]["content"]
+
+        if "shipment_details" in messages[0]["content"]:
+            kind: str = "chat_extraction"
+            content: str = json.dumps({"shipment_details": extract_fields(prompt)})
+        else:
+            kind = "chat_answer"
+            content = answer_from_context(prompt)
+
+        prompt_tokens: int = sum(len(message["content"]) // 4 for message in messages)
+
+        await wait(kind, chat_latency_ms, start)
+
+        return {
+            "id": f"chatcmpl-{hashlib.md5(prompt.encode()).hexdigest()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": prompt_tokens + len(content) // 4,
+                "prompt_tokens_details": {"cached_tokens": 0},
+            },
+        }
+
+    @app.get("/stats")
+    async def stats() -> Dict[str, Dict[str, float]]:
+        return recorder.stats()
+
+    @app.post("/stats/reset")
+    async def reset_stats() -> Dict[str, str]:
+        recorder.reset()
+
+        return {"status": "reset"}
+
+    return app
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--chat-latency-ms", type=float, default=300.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--dimension", type=int, default=3072)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(
+            args.chat_latency_ms,
+            args.embedding_latency_ms,
+            args.jitter_ms,
+            args.dimension,
+            args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Index Memory Benchmark
+
+Compares the combined memory of several worker processes serving the
+same persisted index, loaded either into private memory or memory-mapped.
+
+Each worker loads the index, runs searches so every page is touched,
+and reports its proportional set size (PSS, Linux only): memory pages
+shared by N processes count 1/N towards each of them, so the sum over
+workers is the real footprint.
+
+Usage:
+    python -m benchmarks.index_memory_benchmark
+    python -m benchmarks.index_memory_benchmark --vectors 20000 --workers 4
+"""
+
+from typing import Dict, Any, List
+import argparse
+import multiprocessing
+import os
+import tempfile
+
+import numpy as np
+
+from src.core.data.vector_store import VectorStore
+
+
+def build_index(index_path: str, vectors: int, dimension: int) -> None:
+    """
+    Build and save a synthetic index with chunk-like metadata.
+
+    Args:
+        index_path (str): Destination index file.
+        vectors (int): Number of vectors.
+        dimension (int): Embedding dimension.
+    """
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    embeddings: np.ndarray = rng.standard_normal((vectors, dimension)).astype(
+        np.float32
+    )
+
+    metadata: List[Dict[str, str]] = [
+        {
+            "chunk_id": f"chunk_{idx}",
+            "content": f"Field {idx}: synthetic value {idx}",
+            "field": f"field_{idx}",
+            "value": f"value {idx}",
+        }
+        for idx in range(vectors)
+    ]
+
+    vector_store: VectorStore = VectorStore(dimension)
+    vector_store.add_vectors(embeddings, metadata)
+    vector_store.save(index_path)
+
+
+def proportional_set_size() -> int:
+    """
+    PSS of the current process in bytes.
+
+    Returns:
+        int
+    """
+
+    with open("/proc/self/smaps_rollup", "r", encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) * 1024
+
+    return 0
+
+
+def _worker(
+    index_path: str,
+    mmap: bool,
+    searches: int,
+    ready: Any,
+    measure: Any,
+    results: Any,
+) -> None:
+    """
+    Load the index, search it, then report memory once all workers loaded.
+
+    Args:
+        index_path (str): Index file.
+        mmap (bool): Memory-map the index.
+        searches (int): Number of searches to run.
+        ready (Any): Barrier passed after loading.
+        measure (Any): Barrier passed before measuring.
+        results (Any): Queue receiving (pss_bytes, baseline_bytes).
+    """
+
+    baseline: int = proportional_set_size()
+
+    vector_store: VectorStore = VectorStore.load(index_path, mmap=mmap)
+
+    rng: np.random.Generator = np.random.default_rng(os.getpid())
+
+    for _ in range(searches):
+        query: np.ndarray = rng.standard_normal(vector_store.embedding_dimension)
+        vector_store.search(query.astype(np.float32))
+
+    # Touch every metadata record, as serving traffic eventually does
+    for _ in vector_store.metadata_store:
+        pass
+
+    ready.wait()
+    measure.wait()
+
+    results.put((proportional_set_size(), baseline))
+
+
+def measure_workers(
+    index_path: str, mmap: bool, workers: int, searches: int
+) -> Dict[str, Any]:
+    """
+    Run workers loading the same index and sum their memory.
+
+    Args:
+        index_path (str): Index file.
+        mmap (bool): Memory-map the index.
+        workers (int): Number of worker processes.
+        searches (int): Searches per worker.
+
+    Returns:
+        Dict[str, Any]: Total and per-worker index memory in bytes.
+    """
+
+    context = multiprocessing.get_context("spawn")
+
+    ready = context.Barrier(workers)
+    measure = context.Barrier(workers)
+    results = context.Queue()
+
+    processes: List[Any] = [
+        context.Process(
+            target=_worker,
+            args=(index_path, mmap, searches, ready, measure, results),
+        )
+        for _ in range(workers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    samples: List[tuple] = [results.get() for _ in processes]
+
+    for process in processes:
+        process.join()
+
+    index_bytes: List[int] = [pss - baseline for pss, baseline in samples]
+
+    return {
+        "mmap": mmap,
+        "workers": workers,
+        "total_bytes": sum(index_bytes),
+        "per_worker_bytes": index_bytes,
+    }
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vectors", type=int, default=10000)
+    parser.add_argument("--dimension", type=int, default=3072)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--searches", type=int, default=200)
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        raise SystemExit("PSS measurement requires Linux (/proc/self/smaps_rollup).")
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_path: str = os.path.join(directory, "benchmark.faiss")
+
+        build_index(index_path, args.vectors, args.dimension)
+
+        file_bytes: int = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in os.listdir(directory)
+        )
+        print(f"Index files: {file_bytes / 2**20:.1f} MiB")
+
+        for mmap in (False, True):
+            result: Dict[str, Any] = measure_workers(
+                index_path, mmap, args.workers, args.searches
+            )
+
+            per_worker: str = ", ".join(
+                f"{value / 2**20:.1f}" for value in result["per_worker_bytes"]
+            )
+
+            print(
+                f"{'mmap' if mmap else 'private'}: "
+                f"{result['total_bytes'] / 2**20:.1f} MiB across "
+                f"{args.workers} workers (per worker MiB: {per_worker})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Prompt Reduction Benchmark
+
+Reports estimated tokens saved per document by PromptReducer and,
+when an API key is given, the effect on extraction accuracy.
+
+Usage:
+    python -m benchmarks.prompt_reduction_benchmark docs/*.pdf
+    python -m benchmarks.prompt_reduction_benchmark docs/*.pdf \
+        --api-key sk-... --ground-truth expected.json
+
+The ground-truth file maps document file names to expected
+"shipment_details" dictionaries. Without it, the extraction from the
+full (unreduced) text is used as the reference.
+"""
+
+from typing import Dict, Any, List, Optional
+import argparse
+import json
+import os
+import time
+
+from src.core.data.document_processor import DocumentProcessor
+from src.core.data.prompt_reducer import PromptReducer
+from src.core.data.llm_structured_extractor import LLMStructuredExtractor
+
+
+def _normalize_value(value: Optional[str]) -> str:
+    """
+    Normalize a field value for comparison.
+
+    Args:
+        value (Optional[str])
+
+    Returns:
+        str
+    """
+
+    return " ".join(str(value).lower().split()) if value else ""
+
+
+def field_accuracy(predicted: Dict[str, Any], expected: Dict[str, Any]) -> float:
+    """
+    Fraction of expected fields reproduced exactly (after normalization).
+
+    Args:
+        predicted (Dict[str, Any]): Extracted shipment_details.
+        expected (Dict[str, Any]): Reference shipment_details.
+
+    Returns:
+        float: Accuracy between 0 and 1.
+    """
+
+    if not expected:
+        return 1.0
+
+    matches: int = sum(
+        1
+        for key, value in expected.items()
+        if _normalize_value(predicted.get(key)) == _normalize_value(value)
+    )
+
+    return matches / len(expected)
+
+
+def run_benchmark(
+    file_paths: List[str],
+    api_key: Optional[str],
+    ground_truth: Dict[str, Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark prompt reduction over documents.
+
+    Args:
+        file_paths (List[str]): Documents to process.
+        api_key (Optional[str]): OpenAI API key; skips accuracy if None.
+        ground_truth (Dict[str, Dict[str, Any]]): Expected fields per file name.
+
+    Returns:
+        List[Dict[str, Any]]: One result row per document.
+    """
+
+    processor: DocumentProcessor = DocumentProcessor()
+    reducer: PromptReducer = PromptReducer()
+
+    results: List[Dict[str, Any]] = []
+
+    for file_path in file_paths:
+        document_text: str = processor.extract_text(file_path)
+
+        reduction: Dict[str, Any] = reducer.reduce(document_text)
+
+        row: Dict[str, Any] = {
+            "document": os.path.basename(file_path),
+            "original_tokens": reduction["original_tokens"],
+            "reduced_tokens": reduction["reduced_tokens"],
+            "tokens_saved": reduction["tokens_saved"],
+        }
+
+        if api_key:
+            full_extractor = LLMStructuredExtractor(api_key, reduce_prompt=False)
+            reduced_extractor = LLMStructuredExtractor(api_key, reduce_prompt=True)
+
+            start: float = time.perf_counter()
+            full_output = full_extractor.extract(document_text)["shipment_details"]
+            row["full_latency_s"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            reduced_output = reduced_extractor.extract(document_text)[
+                "shipment_details"
+            ]
+            row["reduced_latency_s"] = time.perf_counter() - start
+
+            reference: Dict[str, Any] = ground_truth.get(row["document"]) or {
+                key: value for key, value in full_output.items() if value
+            }
+
+            row["full_accuracy"] = field_accuracy(full_output, reference)
+            row["reduced_accuracy"] = field_accuracy(reduced_output, reference)
+
+        results.append(row)
+
+    return results
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="+", help="Documents (PDF, DOCX, TXT)")
+    parser.add_argument("--api-key", default=os.getenv("OPENAI_API_KEY"))
+    parser.add_argument("--ground-truth", help="JSON file of expected fields")
+    args = parser.parse_args()
+
+    ground_truth: Dict[str, Dict[str, Any]] = {}
+
+    if args.ground_truth:
+        with open(args.ground_truth, "r", encoding="utf-8") as file:
+            ground_truth = json.load(file)
+
+    results = run_benchmark(args.files, args.api_key, ground_truth)
+
+    for row in results:
+        saved_pct: float = (
+            100.0 * row["tokens_saved"] / row["original_tokens"]
+            if row["original_tokens"]
+            else 0.0
+        )
+
+        line: str = (
+            f"{row['document']}: {row['original_tokens']} -> "
+            f"{row['reduced_tokens']} tokens ({saved_pct:.1f}% saved)"
+        )
+
+        if "reduced_accuracy" in row:
+            line += (
+                f" | accuracy full={row['full_accuracy']:.2f} "
+                f"reduced={row['reduced_accuracy']:.2f}"
+                f" | latency full={row['full_latency_s']:.2f}s "
+                f"reduced={row['reduced_latency_s']:.2f}s"
+            )
+
+        print(line)
+
+    total_original: int = sum(row["original_tokens"] for row in results)
+    total_saved: int = sum(row["tokens_saved"] for row in results)
+
+    if total_original:
+        print(
+            f"Total: {total_saved}/{total_original} tokens saved "
+            f"({100.0 * total_saved / total_original:.1f}%)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+Search Tuning Benchmark
+
+Measures recall@k against exact search, and per-query latency, of the
+HNSW vector store across a grid of M, efConstruction, efSearch and k,
+plus the adaptive mode (default efSearch, widened to --adaptive-ef-search
+only for queries whose two best distinct chunks are within --score-gap).
+
+Embedding sets:
+- synthetic (default): clustered unit vectors, each chunk indexed with
+  --questions-per-chunk synthetic question entries near it (as uploads
+  index them), and queries paraphrasing indexed chunks
+- --embeddings: a (n, dimension) .npy matrix of real embeddings, one
+  chunk per row
+- --index: a persisted index (e.g. state/indexes/<version>.faiss); its
+  stored vectors are reconstructed and its chunk metadata kept, so the
+  escalation rate is that of the real upload
+
+Run it on --index of a real upload before changing ADAPTIVE_SCORE_GAP:
+the escalated column is the share of queries paying for the wider beam.
+
+For real sets the last --queries vectors are held out as queries and
+not indexed.
+
+Usage:
+    python -m benchmarks.search_tuning_benchmark
+    python -m benchmarks.search_tuning_benchmark --m 16,32 --ef-search 16,50,200 --k 4,16
+    python -m benchmarks.search_tuning_benchmark --score-gap 0.001,0.005 --adaptive-ef-search 100
+    python -m benchmarks.search_tuning_benchmark --index state/indexes/1.faiss --queries 50 \
+        --score-gap 0.005,0.01,0.02,0.03,0.05
+"""
+
+from typing import Dict, Any, List, Tuple, Optional
+import argparse
+import itertools
+import time
+
+import faiss
+import numpy as np
+
+from src.config.settings import (
+    HNSW_EF_SEARCH,
+    ADAPTIVE_EF_SEARCH,
+    ADAPTIVE_SCORE_GAP,
+)
+from src.core.data.mapped_metadata import MappedMetadata
+from src.core.data.vector_store import VectorStore
+from src.core.state.metrics import METRICS
+
+
+def synthetic_embeddings(
+    vectors: int,
+    queries: int,
+    dimension: int,
+    clusters: int,
+    query_noise: float,
+    questions_per_chunk: int,
+    question_noise: float,
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Clustered unit vectors, so that near-ties occur as in real corpora,
+    and queries that each paraphrase (perturb) one indexed chunk.
+
+    Every chunk is followed by questions_per_chunk entries close to it
+    and sharing its chunk_id, like synthetic question entries.
+
+    Args:
+        vectors (int): Indexed vectors, question entries included.
+        queries (int): Query vectors.
+        dimension (int): Embedding dimension.
+        clusters (int): Number of clusters.
+        query_noise (float): Perturbation of queries; larger values make
+            the best match less decisive.
+        questions_per_chunk (int): Question entries per chunk.
+        question_noise (float): Perturbation of question entries; small
+            values make a chunk and its questions near-ties for a query.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: (vectors, queries,
+            chunk id per vector), vectors and queries normalized float32.
+    """
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    rows_per_chunk: int = 1 + questions_per_chunk
+    chunk_count: int = max(1, vectors // rows_per_chunk)
+
+    centers: np.ndarray = rng.standard_normal((clusters, dimension))
+
+    chunks: np.ndarray = normalized(
+        centers[rng.integers(0, clusters, chunk_count)]
+        + 0.5 * rng.standard_normal((chunk_count, dimension))
+    )
+
+    total: int = chunk_count * rows_per_chunk
+
+    # The first row of each chunk is the chunk itself, the rest its questions
+    is_question: np.ndarray = np.arange(total) % rows_per_chunk > 0
+
+    indexed: np.ndarray = normalized(
+        np.repeat(chunks, rows_per_chunk, axis=0)
+        + question_noise
+        * rng.standard_normal((total, dimension))
+        * is_question[:, None]
+    )
+
+    chunk_ids: List[str] = [str(row // rows_per_chunk) for row in range(len(indexed))]
+
+    sources: np.ndarray = chunks[rng.integers(0, chunk_count, queries)]
+
+    return (
+        indexed,
+        normalized(sources + query_noise * rng.standard_normal((queries, dimension))),
+        chunk_ids,
+    )
+
+
+def real_embeddings(
+    args: argparse.Namespace,
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Embeddings from a .npy matrix or a persisted index, queries held out.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: (vectors, queries,
+            chunk id per vector), vectors and queries normalized float32.
+    """
+
+    if args.embeddings:
+        matrix: np.ndarray = np.load(args.embeddings).astype(np.float32)
+        chunk_ids: List[str] = [str(row) for row in range(len(matrix))]
+    else:
+        index = faiss.read_index(args.index)
+        matrix = index.reconstruct_n(0, index.ntotal)
+        chunk_ids = [
+            str(metadata.get("chunk_id", row))
+            for row, metadata in enumerate(MappedMetadata(args.index))
+        ]
+
+    if len(matrix) <= args.queries:
+        raise SystemExit(
+            f"Need more than {args.queries} vectors to hold out queries, "
+            f"got {len(matrix)}."
+        )
+
+    matrix = normalized(matrix)
+
+    return matrix[: -args.queries], matrix[-args.queries :], chunk_ids[: -args.queries]
+
+
+def normalized(matrix: np.ndarray) -> np.ndarray:
+    """
+    Contiguous float32 copy with unit rows.
+
+    Args:
+        matrix (np.ndarray)
+
+    Returns:
+        np.ndarray
+    """
+
+    matrix = np.array(matrix, dtype=np.float32, order="C")
+    faiss.normalize_L2(matrix)
+
+    return matrix
+
+
+def exact_neighbors(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    Ground truth top-k rows by exact inner product.
+
+    Args:
+        vectors (np.ndarray): Indexed vectors.
+        queries (np.ndarray): Query vectors.
+        k (int)
+
+    Returns:
+        np.ndarray: (queries, k) row ids.
+    """
+
+    index = faiss.IndexFlatIP(vectors.shape[1])
+    index.add(vectors)
+
+    _, neighbors = index.search(queries, k)
+
+    return neighbors
+
+
+def measure(
+    vector_store: VectorStore,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+    adaptive: bool,
+) -> Dict[str, float]:
+    """
+    Recall@k and latency of one configuration, one query at a time as
+    /ask issues them.
+
+    Args:
+        vector_store (VectorStore): Store to search.
+        queries (np.ndarray): Query vectors.
+        truth (np.ndarray): Exact top-k rows per query.
+        k (int)
+        adaptive (bool): Use the adaptive search.
+
+    Returns:
+        Dict[str, float]: recall@k, top1 (exact best match ranked
+            first), p50_ms, p95_ms and escalation rate.
+    """
+
+    escalations_key: str = 'adaptive_search_escalations_total{kind="ef_search"}'
+    escalations_before: float = METRICS.snapshot()["counters"].get(escalations_key, 0)
+
+    latencies: List[float] = []
+    hits: int = 0
+    top_hits: int = 0
+
+    for query, expected in zip(queries, truth):
+        start: float = time.perf_counter()
+        results = vector_store.search(query, k, adaptive=adaptive)
+        latencies.append(time.perf_counter() - start)
+
+        found: List[int] = [int(metadata["row"]) for metadata, _ in results]
+        hits += len(set(found).intersection(expected.tolist()))
+        top_hits += bool(found) and found[0] == expected[0]
+
+    escalations: float = (
+        METRICS.snapshot()["counters"].get(escalations_key, 0) - escalations_before
+    )
+
+    return {
+        "recall": hits / truth.size,
+        "top1": top_hits / len(queries),
+        "p50_ms": 1000.0 * float(np.percentile(latencies, 50)),
+        "p95_ms": 1000.0 * float(np.percentile(latencies, 95)),
+        "escalated": escalations / len(queries),
+    }
+
+
+def parse_grid(value: str) -> List[int]:
+    """
+    Parse a comma-separated list of integers.
+
+    Args:
+        value (str)
+
+    Returns:
+        List[int]
+    """
+
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    """
+    Command line entry point.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--query-noise", type=float, default=0.05)
+    parser.add_argument("--questions-per-chunk", type=int, default=3)
+    parser.add_argument("--question-noise", type=float, default=0.01)
+    parser.add_argument("--embeddings", help="(n, dimension) .npy matrix")
+    parser.add_argument("--index", help="persisted FAISS index")
+    parser.add_argument("--m", type=parse_grid, default=[16, 32])
+    parser.add_argument("--ef-construction", type=parse_grid, default=[100, 200])
+    parser.add_argument("--ef-search", type=parse_grid, default=[16, 32, 50, 100, 200])
+    parser.add_argument("--k", type=parse_grid, default=[4, 16])
+    parser.add_argument(
+        "--score-gap",
+        type=lambda value: [float(item) for item in value.split(",")],
+        default=[0.01, ADAPTIVE_SCORE_GAP, 0.05],
+    )
+    parser.add_argument("--adaptive-ef-search", type=int, default=ADAPTIVE_EF_SEARCH)
+    args = parser.parse_args()
+
+    if args.embeddings or args.index:
+        vectors, queries, chunk_ids = real_embeddings(args)
+        source: str = args.embeddings or args.index
+    else:
+        vectors, queries, chunk_ids = synthetic_embeddings(
+            args.vectors,
+            args.queries,
+            args.dimension,
+            args.clusters,
+            args.query_noise,
+            args.questions_per_chunk,
+            args.question_noise,
+        )
+        source = (
+            f"synthetic ({args.clusters} clusters, query noise {args.query_noise}, "
+            f"{args.questions_per_chunk} questions per chunk)"
+        )
+
+    print(
+        f"{source}: {len(vectors)} vectors, {len(queries)} queries, "
+        f"dimension {vectors.shape[1]}"
+    )
+
+    truth: Dict[int, np.ndarray] = {
+        k: exact_neighbors(vectors, queries, k) for k in args.k
+    }
+
+    metadata: List[Dict[str, Any]] = [
+        {"chunk_id": chunk_id, "row": str(row)}
+        for row, chunk_id in enumerate(chunk_ids)
+    ]
+
+    print(
+        f"{'M':>3} {'efC':>4} {'efS':>4} {'gap':>6} {'k':>3} {'recall':>7} "
+        f"{'top1':>6} {'p50 ms':>7} {'p95 ms':>7} {'escalated':>9}"
+    )
+
+    # Fixed beam widths, then adaptive search (default beam) per score gap
+    rows: List[Tuple[int, Optional[float]]] = [
+        (ef_search, None) for ef_search in args.ef_search
+    ] + [(HNSW_EF_SEARCH, score_gap) for score_gap in args.score_gap]
+
+    for m, ef_construction in itertools.product(args.m, args.ef_construction):
+        build_start: float = time.perf_counter()
+
+        vector_store: VectorStore = VectorStore(
+            vectors.shape[1], m=m, ef_construction=ef_construction
+        )
+        vector_store.add_vectors(vectors.copy(), metadata)
+
+        vector_store.adaptive_ef_search = args.adaptive_ef_search
+
+        print(
+            f"# M={m} efConstruction={ef_construction}: built in "
+            f"{time.perf_counter() - build_start:.1f} s"
+        )
+
+        for k in args.k:
+            for ef_search, score_gap in rows:
+                vector_store.index.hnsw.efSearch = ef_search
+
+                if score_gap is not None:
+                    vector_store.adaptive_score_gap = score_gap
+
+                result: Dict[str, float] = measure(
+                    vector_store, queries, truth[k], k, score_gap is not None
+                )
+
+                gap_label: str = "-" if score_gap is None else f"{score_gap:g}"
+
+                print(
+                    f"{m:>3} {ef_construction:>4} {ef_search:>4} {gap_label:>6} "
+                    f"{k:>3} {result['recall']:>7.3f} {result['top1']:>6.3f} "
+                    f"{result['p50_ms']:>7.3f} "
+                    f"{result['p95_ms']:>7.3f} {result['escalated']:>9.1%}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,88 +3,281 @@ Ask API Module
 """
 
 from fastapi import APIRouter
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+import time
+import numpy as np
 from src.core.services.embedding_service import EmbeddingService
 from src.core.services.retriever import Retriever
 from src.core.evaluator.guardrails import Guardrails
-from src.core.services.answer_generator import AnswerGenerator
+from src.core.services.answer_generator import AnswerGenerator, NOT_FOUND_ANSWER
+from src.core.services.field_answerer import FieldAnswerer
 from src.core.evaluator.confidence import ConfidenceScorer
+from src.core.state.memory_manager import MemoryManager
+from src.core.state.document_state import DocumentState
+from src.config.settings import (
+    ANSWER_CACHE_ENABLED,
+    FAST_PATH_ENABLED,
+    DEFAULT_SESSION_ID,
+    GROUNDING_SCORE_ENABLED,
+    OOD_PREFILTER_ENABLED,
+    LEXICAL_FAST_PATH_ENABLED,
+)
+from src.core.state.metrics import METRICS
 import src.core.state.app_state as app_state
 
 router = APIRouter()
 
 
+# Sync endpoint: FastAPI runs it in the threadpool, so retry backoff,
+# hedged generation and backend reloads do not hold the event loop
 @router.post("/ask")
-async def ask_question(query: str, api_key: str) -> Dict:
+def ask_question(
+    query: str,
+    api_key: str,
+    session_id: str = DEFAULT_SESSION_ID,
+    filter_column: Optional[str] = None,
+    filter_value: Optional[str] = None,
+) -> Dict:
     """
     Ask question about uploaded document.
 
     Args:
         query (str): User question.
         api_key (str): OpenAI API key.
+        session_id (str): Client session whose conversation memory is used.
+        filter_column (Optional[str]): Table column to filter rows by.
+        filter_value (Optional[str]): Required value of filter_column.
 
     Returns:
         Dict: Answer, sources, confidence.
     """
 
+    document: Optional[DocumentState] = app_state.get_document()
+
     # Check if document has been uploaded
-    if app_state.VECTOR_STORE_INSTANCE is None:
+    if document is None:
         return {"error": "No document uploaded."}
 
-    embedding_service: EmbeddingService = EmbeddingService(api_key)
+    memory_manager: MemoryManager = app_state.SESSION_MEMORY_STORE.get(session_id)
 
-    retriever: Retriever = Retriever(embedding_service, app_state.VECTOR_STORE_INSTANCE)
+    column_filter: Optional[Tuple[str, str]] = (
+        (filter_column, filter_value)
+        if filter_column and filter_value is not None
+        else None
+    )
 
-    retrieved_chunks, max_similarity_score = retriever.retrieve(query)
+    # Cached answers are keyed by question only, not by filter or
+    # conversation: they are shared across sessions, so only questions
+    # answered without conversation history are looked up and stored
+    use_cache: bool = (
+        ANSWER_CACHE_ENABLED
+        and column_filter is None
+        and not memory_manager.get_memory_context(query)
+    )
 
     guardrails: Guardrails = Guardrails()
 
+    # Clearly off-topic questions are rejected before any API call
+    if OOD_PREFILTER_ENABLED:
+        domain_validation = guardrails.validate_query_domain(query, document.vocabulary)
+
+        if domain_validation.get("status") == "reject":
+            METRICS.increment("ood_prefilter_rejections_total")
+
+            # At least the query embedding call is saved
+            METRICS.increment("ood_prefilter_saved_calls_total")
+
+            return {
+                "answer": domain_validation.get("message"),
+                "confidence": 0.0,
+                "sources": [],
+            }
+
+    # Exact repeat of a cached question needs no embedding call
+    if use_cache:
+        cached_response = app_state.ANSWER_CACHE_INSTANCE.lookup(
+            document.document_id, query
+        )
+
+        METRICS.increment("answer_cache_lookups_total", labels={"kind": "exact"})
+
+        if cached_response:
+            METRICS.increment("answer_cache_hits_total", labels={"kind": "exact"})
+
+            return _serve_cached_response(query, cached_response, memory_manager)
+
+    embedding_service: EmbeddingService = EmbeddingService(api_key)
+
+    retriever: Retriever = Retriever(
+        embedding_service, document.vector_store, document.token_index
+    )
+
+    # Pure identifier lookups need no query embedding or dense search
+    lexical_result = (
+        retriever.retrieve_lexical(query)
+        if LEXICAL_FAST_PATH_ENABLED and column_filter is None
+        else None
+    )
+
+    query_embedding: Optional[np.ndarray] = None
+
+    if lexical_result is not None:
+        METRICS.increment("lexical_fast_path_hits_total")
+
+        retrieved_chunks, max_similarity_score = lexical_result
+    else:
+        query_embedding = embedding_service.generate_embedding(query)
+
+        # Paraphrase of a cached question
+        if use_cache:
+            cached_response = app_state.ANSWER_CACHE_INSTANCE.lookup(
+                document.document_id, query, query_embedding
+            )
+
+            METRICS.increment("answer_cache_lookups_total", labels={"kind": "semantic"})
+
+            if cached_response:
+                METRICS.increment(
+                    "answer_cache_hits_total", labels={"kind": "semantic"}
+                )
+
+                return _serve_cached_response(query, cached_response, memory_manager)
+
+        with METRICS.timer("stage_duration_seconds", {"stage": "retrieve"}):
+            retrieved_chunks, max_similarity_score = retriever.retrieve(
+                query, query_embedding, column_filter
+            )
+
     validation = guardrails.validate_retrieval(retrieved_chunks, max_similarity_score)
 
     if validation.get("status") == "reject":
         return {"answer": validation.get("message"), "confidence": 0.0, "sources": []}
 
-    answer_generator: AnswerGenerator = AnswerGenerator(
-        api_key, app_state.MEMORY_MANAGER_INSTANCE
-    )
+    result = None
 
-    result = answer_generator.generate_answer(query, retrieved_chunks)
+    # Deterministic answer from a decisive field match
+    if FAST_PATH_ENABLED:
+        METRICS.increment("fast_path_attempts_total")
+
+        fast_path_start: float = time.perf_counter()
+
+        field_answerer: FieldAnswerer = FieldAnswerer(memory_manager)
+
+        result = field_answerer.try_answer(query, retrieved_chunks)
+
+        if result is not None:
+            METRICS.increment("fast_path_hits_total")
+
+            # Saving is estimated against the mean observed LLM latency
+            mean_generation_seconds = METRICS.mean(
+                "stage_duration_seconds", {"stage": "generate"}
+            )
+
+            if mean_generation_seconds is not None:
+                METRICS.observe(
+                    "fast_path_latency_saved_seconds",
+                    max(
+                        0.0,
+                        mean_generation_seconds
+                        - (time.perf_counter() - fast_path_start),
+                    ),
+                )
+
+    if result is None:
+        answer_generator: AnswerGenerator = AnswerGenerator(
+            api_key,
+            memory_manager,
+            document.structured_context,
+            document.token_index,
+        )
+
+        result = answer_generator.generate_answer(
+            query, retrieved_chunks, max_similarity_score
+        )
 
     answer: str = result.get("answer")
 
-    confidence_scorer: ConfidenceScorer = ConfidenceScorer()
+    # Fast-path answers are copied from a chunk and need no grounding
+    # check; lexical lookups are scored lexically, without embedding calls
+    answer_embedding: Optional[np.ndarray] = None
+
+    if (
+        GROUNDING_SCORE_ENABLED
+        and lexical_result is None
+        and result.get("model") is not None
+        and not answer.startswith(NOT_FOUND_ANSWER.rstrip("."))
+    ):
+        answer_embedding = embedding_service.generate_embedding(answer)
+
+    confidence_scorer: ConfidenceScorer = ConfidenceScorer(
+        document.token_index, document.vector_store
+    )
 
     confidence_score: float = confidence_scorer.compute_confidence(
-        answer, retrieved_chunks, max_similarity_score
+        answer, retrieved_chunks, max_similarity_score, answer_embedding
     )
 
     confidence_validation = guardrails.validate_confidence(confidence_score)
 
     if confidence_validation.get("status") == "reject":
         return {
-            "answer": answer
-            if answer == "Not found in document."
-            else confidence_validation.get("message"),
+            "answer": (
+                answer
+                if answer == NOT_FOUND_ANSWER
+                else confidence_validation.get("message")
+            ),
             "confidence": confidence_score,
             "sources": [],
         }
 
-    return {
+    response: Dict = {
         "answer": answer,
         "confidence": confidence_score,
         "sources": result.get("sources"),
     }
 
+    # Lexical lookups are cached without an embedding (exact text only)
+    if use_cache:
+        app_state.ANSWER_CACHE_INSTANCE.store(
+            document.document_id, query, query_embedding, response
+        )
 
+    return response
+
+
+def _serve_cached_response(
+    query: str, cached_response: Dict, memory_manager: MemoryManager
+) -> Dict:
+    """
+    Return a cached answer, keeping conversation memory consistent.
+
+    Args:
+        query (str): User question.
+        cached_response (Dict): Cached answer, confidence and sources.
+        memory_manager (MemoryManager): Session memory.
+
+    Returns:
+        Dict: Answer, sources, confidence.
+    """
+
+    memory_manager.add_interaction(query, cached_response.get("answer"))
+
+    return cached_response
+
+
+# Sync endpoint: clearing writes through the state backend
 @router.post("/clear_memory")
-async def clear_memory() -> Dict[str, str]:
+def clear_memory(session_id: str = DEFAULT_SESSION_ID) -> Dict[str, str]:
     """
-    Clear conversational memory.
+    Clear conversational memory of a session.
+
+    Args:
+        session_id (str): Client session identifier.
 
     Returns:
         Dict[str, str]: Status message.
     """
 
-    app_state.MEMORY_MANAGER_INSTANCE.clear_memory()
+    app_state.SESSION_MEMORY_STORE.clear(session_id)
 
     return {"status": "Memory cleared."}
@@ -10,8 +10,9 @@ import src.core.state.app_state as app_state
 router = APIRouter()
 
 
+# Sync endpoint: the extraction call blocks, so it runs in the threadpool
 @router.post("/extract")
-async def extract_structured_data(api_key: str) -> Dict:
+def extract_structured_data(api_key: str) -> Dict:
     """
     Extract structured shipment data.
 
@@ -22,15 +23,15 @@ async def extract_structured_data(api_key: str) -> Dict:
         Dict: Structured JSON output.
     """
 
-    if not app_state.DOCUMENT_TEXT_STORAGE:
+    document = app_state.get_document()
+
+    if document is None or not document.document_text:
         return {"error": "No document uploaded."}
 
     try:
         extractor: LLMStructuredExtractor = LLMStructuredExtractor(api_key)
 
-        structured_output: Dict[str, Any] = extractor.extract(
-            app_state.DOCUMENT_TEXT_STORAGE
-        )
+        structured_output: Dict[str, Any] = extractor.extract(document.document_text)
 
         return structured_output
     except Exception as e:
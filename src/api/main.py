@@ -2,11 +2,16 @@
 Main FastAPI Application
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from typing import Any, Awaitable, Callable
+import time
 from src.api.upload import router as upload_router
 from src.api.ask import router as ask_router
 from src.api.extract import router as extract_router
+from src.api.metrics import router as metrics_router
+from src.api.search import router as search_router
+from src.core.state.metrics import METRICS
 
 app = FastAPI(title="UltraDoc Intelligence RAG API")
 
@@ -20,6 +25,48 @@ app.add_middleware(
 )
 
 
+async def record_request_duration(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Any:
+    """
+    Observe each request's latency per route template and status.
+
+    Args:
+        request (Request): Incoming request.
+        call_next (Callable[[Request], Awaitable[Response]]): Rest of the app.
+
+    Returns:
+        Any: The route's response.
+    """
+
+    start: float = time.perf_counter()
+
+    response: Response = await call_next(request)
+
+    # Route templates (not raw paths) keep label cardinality bounded
+    route: Any = request.scope.get("route")
+
+    METRICS.observe(
+        "http_request_duration_seconds",
+        time.perf_counter() - start,
+        {
+            "route": getattr(route, "path", "unmatched"),
+            "method": request.method,
+            "status": str(response.status_code),
+        },
+    )
+
+    return response
+
+
+# Registered only when metrics are on: the middleware itself costs a hop
+if METRICS.enabled:
+    app.middleware("http")(record_request_duration)
+
+# Each worker process imports this module: report all workers' metrics
+METRICS.start_sharing()
+
+
 # Health check endpoint for Render
 @app.get("/")
 def health_check():
@@ -31,3 +78,7 @@ app.include_router(upload_router)
 app.include_router(ask_router)
 
 app.include_router(extract_router)
+
+app.include_router(metrics_router)
+
+app.include_router(search_router)
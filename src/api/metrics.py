@@ -0,0 +1,102 @@
+"""
+Metrics API Module
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any
+from src.core.state.metrics import METRICS
+
+router = APIRouter()
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Sync endpoints: with several workers a scrape reads their metric files
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_prometheus_metrics() -> PlainTextResponse:
+    """
+    Report runtime metrics for Prometheus to scrape.
+
+    Returns:
+        PlainTextResponse: Counters, gauges and histograms in the
+            Prometheus text format.
+    """
+
+    return PlainTextResponse(
+        METRICS.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
+@router.get("/metrics/json")
+def get_metrics() -> Dict[str, Any]:
+    """
+    Report runtime metrics as JSON.
+
+    Returns:
+        Dict[str, Any]: Counters, gauges, summaries and derived rates.
+    """
+
+    snapshot: Dict[str, Any] = METRICS.snapshot()
+
+    counters: Dict[str, float] = snapshot.get("counters", {})
+
+    snapshot["rates"] = {
+        "fast_path_hit_rate": _ratio(
+            counters.get("fast_path_hits_total", 0.0),
+            counters.get("fast_path_attempts_total", 0.0),
+        ),
+        "cascade_escalation_rate": _ratio(
+            _total(counters, "cascade_escalations_total"),
+            counters.get("cascade_requests_total", 0.0),
+        ),
+        "llm_hedge_rate": _ratio(
+            _total(counters, "llm_hedges_total"),
+            counters.get("llm_requests_total", 0.0),
+        ),
+        "prompt_cache_hit_ratio": _ratio(
+            counters.get('llm_cached_prompt_tokens_total{purpose="answer"}', 0.0),
+            counters.get('llm_prompt_tokens_total{purpose="answer"}', 0.0),
+        ),
+        "answer_cache_hit_ratio": _ratio(
+            _total(counters, "answer_cache_hits_total"),
+            _total(counters, "answer_cache_lookups_total"),
+        ),
+    }
+
+    return snapshot
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    """
+    Safe division for derived rates.
+
+    Args:
+        numerator (float)
+        denominator (float)
+
+    Returns:
+        float: Ratio, or 0.0 when the denominator is zero.
+    """
+
+    return numerator / denominator if denominator else 0.0
+
+
+def _total(counters: Dict[str, float], name: str) -> float:
+    """
+    Sum a counter across all of its label combinations.
+
+    Args:
+        counters (Dict[str, float]): Counter snapshot.
+        name (str): Counter name.
+
+    Returns:
+        float: Total value.
+    """
+
+    return sum(
+        value
+        for key, value in counters.items()
+        if key == name or key.startswith(name + "{")
+    )
@@ -0,0 +1,96 @@
+"""
+Corpus Search API Module
+"""
+
+from fastapi import APIRouter
+from typing import Dict, Any, List, Optional, Tuple
+import time
+import numpy as np
+from src.core.services.embedding_service import EmbeddingService
+from src.core.data.sharded_index import ShardedIndex, IndexShard
+from src.config.settings import TOP_K_RETRIEVAL, SEARCH_OVERFETCH_FACTOR
+from src.core.state.metrics import METRICS
+import src.core.state.app_state as app_state
+
+router = APIRouter()
+
+
+# Sync endpoint: shard searches block, so it runs in the threadpool
+@router.post("/search")
+def search_corpus(
+    query: str,
+    api_key: str,
+    top_k: int = TOP_K_RETRIEVAL,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    filter_column: Optional[str] = None,
+    filter_value: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Search all kept documents, not just the current one.
+
+    Args:
+        query (str): Search query.
+        api_key (str): OpenAI API key.
+        top_k (int): Number of chunks to return.
+        since (Optional[float]): Only documents uploaded at or after
+            this time (Unix seconds).
+        until (Optional[float]): Only documents uploaded at or before
+            this time (Unix seconds).
+        filter_column (Optional[str]): Table column to filter rows by.
+        filter_value (Optional[str]): Required value of filter_column.
+
+    Returns:
+        Dict[str, Any]: Matching chunks, best first, each attributed to
+            its document.
+    """
+
+    corpus: ShardedIndex = app_state.get_corpus()
+
+    if not corpus.shards:
+        return {"error": "No document uploaded."}
+
+    embedding_service: EmbeddingService = EmbeddingService(api_key)
+
+    query_embedding: np.ndarray = embedding_service.generate_embedding(query)
+
+    where: Optional[Dict[str, str]] = (
+        {f"columns.{filter_column}": filter_value}
+        if filter_column and filter_value is not None
+        else None
+    )
+
+    search_start: float = time.perf_counter()
+
+    # Over-fetch since several question entries may point to the same chunk
+    hits: List[Tuple[IndexShard, Dict[str, str], float]] = corpus.search(
+        query_embedding, top_k * SEARCH_OVERFETCH_FACTOR, where, since, until
+    )
+
+    METRICS.observe("corpus_search_seconds", time.perf_counter() - search_start)
+
+    results: List[Dict[str, Any]] = []
+    seen: set = set()
+
+    for shard, metadata, similarity_score in hits:
+        key: Tuple[int, str] = (shard.version, metadata.get("chunk_id"))
+
+        if key in seen:
+            continue
+
+        seen.add(key)
+
+        results.append(
+            {
+                **shard.attribution(),
+                "chunk_id": metadata.get("chunk_id"),
+                "content": metadata.get("content"),
+                "page": metadata.get("page"),
+                "similarity": similarity_score,
+            }
+        )
+
+        if len(results) == top_k:
+            break
+
+    return {"results": results}
@@ -3,22 +3,38 @@ Upload API Module
 """
 
 from fastapi import APIRouter, UploadFile, File, Form
-from typing import Dict, List
+from typing import Dict, List, Any, Iterable, Optional
+import itertools
 import shutil
+import hashlib
 import os
 
 from src.core.data.document_processor import DocumentProcessor
 from src.core.data.chunker import StructureAwareChunker
 from src.core.services.embedding_service import EmbeddingService
+from src.core.services.embedding_batcher import EmbeddingBatcher
 from src.core.data.vector_store import VectorStore
 from src.core.data.llm_structured_extractor import LLMStructuredExtractor
+from src.core.data.question_generator import SyntheticQuestionGenerator
+from src.core.data.window_chunker import SlidingWindowChunker
+from src.core.data.structured_extractor import StructuredExtractor
+from src.core.data.table_chunker import TableRowChunker
+from src.core.state.document_state import DocumentState
+from src.config.settings import (
+    SYNTHETIC_QUESTIONS_ENABLED,
+    RAW_TEXT_CHUNKING_ENABLED,
+    TABLE_CHUNKING_ENABLED,
+)
+from src.core.state.metrics import METRICS
 import src.core.state.app_state as app_state
 
 router = APIRouter()
 
 
+# Sync endpoint: FastAPI runs it in the threadpool, so ingestion does
+# not hold the event loop while queries are being served
 @router.post("/upload")
-async def upload_document(
+def upload_document(
     file: UploadFile = File(...), api_key: str = Form(...)
 ) -> Dict[str, str]:
     """
@@ -42,14 +58,13 @@ async def upload_document(
             shutil.copyfileobj(file.file, buffer)
 
         # -----------------------------
-        # Extract raw document text
+        # Extract raw document text (and PDF tables, in the same pass)
         # -----------------------------
         processor: DocumentProcessor = DocumentProcessor()
 
-        document_text: str = processor.extract_text(temp_file_path)
-
-        # Store document text in shared state
-        app_state.DOCUMENT_TEXT_STORAGE = document_text
+        document_text, tables = processor.extract_text_and_tables(
+            temp_file_path, include_tables=TABLE_CHUNKING_ENABLED
+        )
 
         # -----------------------------
         # LLM Structured Extraction
@@ -62,33 +77,78 @@ async def upload_document(
         # Chunk structured document
         # -----------------------------
         chunker: StructureAwareChunker = StructureAwareChunker()
-        chunks: List[Dict[str, str]] = chunker.chunk_document(structured_data)
+
+        with METRICS.timer("stage_duration_seconds", {"stage": "chunk"}):
+            chunks: List[Dict[str, str]] = chunker.chunk_document(structured_data)
+
+        # Full structured context, used as the stable prompt prefix
+        structured_context: str = "\n".join(chunk.get("content") for chunk in chunks)
+
+        index_entries: Iterable[Dict[str, Any]] = chunks
 
         # -----------------------------
-        # Generate embeddings
+        # Synthetic question entries
         # -----------------------------
-        embedding_service: EmbeddingService = EmbeddingService(api_key)
+        if SYNTHETIC_QUESTIONS_ENABLED:
+            question_generator: SyntheticQuestionGenerator = (
+                SyntheticQuestionGenerator()
+            )
 
-        chunk_texts: List[str] = [chunk.get("content") for chunk in chunks]
+            # Questions point back to their field chunk's metadata
+            index_entries = itertools.chain(
+                index_entries, question_generator.generate(chunks)
+            )
 
-        embeddings: List[List[float]] = embedding_service.generate_embeddings_batch(
-            chunk_texts
-        )
+        # -----------------------------
+        # Raw-text windows (generated lazily)
+        # -----------------------------
+        if RAW_TEXT_CHUNKING_ENABLED:
+            window_chunker: SlidingWindowChunker = SlidingWindowChunker()
+
+            index_entries = itertools.chain(
+                index_entries, window_chunker.chunk_text(document_text)
+            )
 
         # -----------------------------
-        # Initialize vector store
+        # Table rows (PDF tables)
         # -----------------------------
-        embedding_dimension: int = len(embeddings[0])
+        if tables:
+            sections: List[Any] = StructuredExtractor().parse_tables(tables)["sections"]
 
-        app_state.VECTOR_STORE_INSTANCE = VectorStore(embedding_dimension)
+            table_chunker: TableRowChunker = TableRowChunker()
 
-        # Add vectors to shared vector store
-        app_state.VECTOR_STORE_INSTANCE.add_vectors(embeddings, chunks)
+            index_entries = itertools.chain(
+                index_entries, table_chunker.chunk_sections(sections)
+            )
 
         # -----------------------------
-        # Reset conversation memory
+        # Embed and index in streamed batches
         # -----------------------------
-        app_state.MEMORY_MANAGER_INSTANCE.clear_memory()
+        embedding_service: EmbeddingService = EmbeddingService(api_key)
+
+        vector_store: Optional[VectorStore] = _index_in_batches(
+            index_entries, embedding_service
+        )
+
+        if vector_store is None:
+            raise ValueError("No indexable text found.")
+
+        # -----------------------------
+        # Publish document state
+        # (also resets conversation memory and cached answers)
+        # -----------------------------
+        with METRICS.timer("stage_duration_seconds", {"stage": "publish"}):
+            app_state.publish_document(
+                DocumentState(
+                    document_id=hashlib.sha256(
+                        document_text.encode("utf-8")
+                    ).hexdigest(),
+                    document_text=document_text,
+                    structured_data=structured_data,
+                    structured_context=structured_context,
+                    vector_store=vector_store,
+                )
+            )
 
         # -----------------------------
         # Remove temporary file
@@ -101,3 +161,49 @@ async def upload_document(
         if os.path.exists(temp_file_path):
             os.remove(temp_file_path)
         return {"error": f"Upload failed: {str(e)}"}
+
+
+def _index_in_batches(
+    index_entries: Iterable[Dict[str, Any]], embedding_service: EmbeddingService
+) -> Optional[VectorStore]:
+    """
+    Embed index entries batch by batch and add them to a new vector store,
+    so only the batches in flight are held in memory.
+
+    Args:
+        index_entries (Iterable[Dict[str, Any]]): Chunks, question entries
+            and windows; question entries are embedded by their question.
+        embedding_service (EmbeddingService): Embedding service.
+
+    Returns:
+        Optional[VectorStore]: None when there was nothing to index.
+    """
+
+    vector_store: Optional[VectorStore] = None
+
+    embedding_batcher: EmbeddingBatcher = EmbeddingBatcher(embedding_service)
+
+    for batch, embeddings in embedding_batcher.embed_stream(
+        index_entries, _embedding_text
+    ):
+        # Dimension is known once the first batch is embedded
+        if vector_store is None:
+            vector_store = VectorStore(embeddings.shape[1])
+
+        vector_store.add_vectors(embeddings, batch)
+
+    return vector_store
+
+
+def _embedding_text(entry: Dict[str, Any]) -> str:
+    """
+    Text embedded for an index entry (question entries by their question).
+
+    Args:
+        entry (Dict[str, Any])
+
+    Returns:
+        str
+    """
+
+    return entry.get("question") or entry.get("content")
@@ -1,6 +1,10 @@
 """
 Global Configuration Settings for UltraDoc Intelligence RAG System.
 """
+
+from typing import List
+import os
+
 # =========================
 # Retrieval Configuration
 # =========================
@@ -8,12 +12,43 @@ Global Configuration Settings for UltraDoc Intelligence RAG System.
 TOP_K_RETRIEVAL: int = 4
 SIMILARITY_THRESHOLD: float = 0.30  # for acomodating huge variance in Questions
 
+# HNSW graph parameters (see benchmarks/search_tuning_benchmark.py)
+HNSW_M: int = 32
+HNSW_EF_CONSTRUCTION: int = 200
+HNSW_EF_SEARCH: int = 50
+
+# Adaptive search: a query whose two best distinct chunks score within
+# this gap has no decisive match, and only then is it searched again
+# with a wider beam and given more chunks. 0.02 comes from synthetic
+# data; check the escalated rate on a real upload before changing it
+# (python -m benchmarks.search_tuning_benchmark --index <index> ...)
+ADAPTIVE_SEARCH_ENABLED: bool = True
+ADAPTIVE_SCORE_GAP: float = 0.02
+ADAPTIVE_EF_SEARCH: int = 200
+ADAPTIVE_MAX_TOP_K: int = 8
+
 # =========================
 # Confidence Scoring
 # =========================
 
 MIN_CONFIDENCE_SCORE: float = 0.45
 
+# Blend in cosine similarity between the embedded answer and the
+# retrieved chunks' stored vectors (one extra embedding call per answer)
+GROUNDING_SCORE_ENABLED: bool = True
+GROUNDING_SCORE_WEIGHT: float = 0.25
+
+# =========================
+# Out-of-Domain Prefilter
+# =========================
+
+# Reject clearly off-topic questions locally, before any API call
+OOD_PREFILTER_ENABLED: bool = True
+
+# Minimum content words a question needs before it can be rejected
+# (shorter follow-ups like "and the rate?" always pass)
+OOD_MIN_CONTENT_TOKENS: int = 2
+
 # =========================
 # Model Configuration
 # =========================
@@ -26,8 +61,247 @@ CHUNKING_LLM_MODEL: str = "gpt-4o-mini"
 # Main LLM - GPT-4.1 for high-quality answer generation
 MAIN_LLM_MODEL: str = "gpt-4.1"
 
+# =========================
+# Model Cascade
+# =========================
+
+CASCADE_ENABLED: bool = True
+
+# Answer models tried in order; the last tier is always accepted
+CASCADE_MODELS: List[str] = ["gpt-4.1-mini", MAIN_LLM_MODEL]
+
+# Confidence an earlier tier's answer must reach to avoid escalation
+CASCADE_ESCALATION_THRESHOLD: float = 0.6
+
+# =========================
+# LLM Request Resilience
+# =========================
+
+# Timeout of a single chat completion attempt
+LLM_REQUEST_TIMEOUT_SECONDS: float = 30.0
+
+# Overall deadline across retries and hedges
+LLM_DEADLINE_SECONDS: float = 60.0
+
+# Retries on transient failures (timeouts, 429, 5xx) with jittered backoff
+LLM_MAX_RETRIES: int = 2
+LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5
+LLM_RETRY_MAX_DELAY_SECONDS: float = 4.0
+
+# Send a duplicate request once the primary exceeds this latency percentile
+LLM_HEDGING_ENABLED: bool = True
+LLM_HEDGE_PERCENTILE: float = 95.0
+
+# Observed latencies needed (per model) before hedging kicks in
+LLM_HEDGE_MIN_SAMPLES: int = 20
+LLM_LATENCY_WINDOW: int = 200
+LLM_HEDGE_MAX_WORKERS: int = 16
+
 # =========================
 # Memory Configuration
 # =========================
 
 MAX_SHORT_TERM_MEMORY: int = 10
+
+# Estimated-token budget for retained conversation turns
+MEMORY_TOKEN_BUDGET: int = 1000
+
+# Estimated-token budget for the rolling summary of evicted turns
+MEMORY_SUMMARY_TOKEN_BUDGET: int = 200
+
+# Most recent turns always included (follow-up questions)
+MEMORY_RECENT_TURNS: int = 2
+
+# Session used when the client does not send one
+DEFAULT_SESSION_ID: str = "default"
+
+# Idle sessions are evicted after this many seconds
+SESSION_TTL_SECONDS: float = 1800.0
+
+# Least recently used sessions are evicted beyond these caps
+MAX_SESSIONS: int = 1000
+MAX_TOTAL_MEMORY_TOKENS: int = 2_000_000
+
+# =========================
+# Prompt Reduction (Structured Extraction)
+# =========================
+
+# Rough characters-per-token ratio used for token estimates
+CHARS_PER_TOKEN: float = 4.0
+
+# Maximum estimated tokens of document text sent to the extraction LLM
+EXTRACTION_TOKEN_BUDGET: int = 6000
+
+# Lines kept around each keyword hit by the relevance filter
+RELEVANCE_CONTEXT_LINES: int = 2
+
+# A line seen on at least this fraction of pages is treated as header/footer
+REPEATED_LINE_PAGE_RATIO: float = 0.5
+
+# =========================
+# Answer Cache
+# =========================
+
+ANSWER_CACHE_ENABLED: bool = True
+
+# Minimum cosine similarity between query embeddings for a cache hit
+ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.92
+
+# Maximum cached answers per document (oldest evicted first)
+ANSWER_CACHE_MAX_ENTRIES: int = 512
+
+# =========================
+# Structured-Field Fast Path
+# =========================
+
+FAST_PATH_ENABLED: bool = True
+
+# Top chunk must reach this similarity ...
+FAST_PATH_MIN_SIMILARITY: float = 0.55
+
+# ... and beat the runner-up by at least this margin
+FAST_PATH_MIN_MARGIN: float = 0.08
+
+# =========================
+# Synthetic Question Index
+# =========================
+
+SYNTHETIC_QUESTIONS_ENABLED: bool = True
+
+# Canonical question phrasings indexed per field chunk
+MAX_SYNTHETIC_QUESTIONS_PER_FIELD: int = 6
+
+# Search fetches top_k * factor entries before collapsing
+# question entries onto their field chunk
+SEARCH_OVERFETCH_FACTOR: int = 4
+
+# =========================
+# Raw-Text Windows
+# =========================
+
+# Index overlapping windows of the raw text next to the field chunks
+RAW_TEXT_CHUNKING_ENABLED: bool = True
+
+WINDOW_CHUNK_TOKENS: int = 200
+WINDOW_OVERLAP_TOKENS: int = 40
+
+# Index rows of tables found in PDFs (StructuredExtractor sections)
+TABLE_CHUNKING_ENABLED: bool = True
+
+# =========================
+# Embedding Requests
+# =========================
+
+# Inputs per embedding request (the API accepts at most 2048)
+EMBEDDING_BATCH_SIZE: int = 128
+
+# Estimated tokens per embedding request (API limit: 300k per request)
+EMBEDDING_MAX_BATCH_TOKENS: int = 100_000
+
+# Embedding requests in flight at once across all bulk ingests
+EMBEDDING_MAX_CONCURRENCY: int = 4
+
+# Per-API-key limits; interactive /ask embeddings are served first
+EMBEDDING_REQUESTS_PER_MINUTE: int = 3000
+EMBEDDING_TOKENS_PER_MINUTE: int = 1_000_000
+
+# Worker processes splitting those limits equally, each enforcing its
+# share locally; uvicorn's --workers also defaults to WEB_CONCURRENCY
+API_WORKERS: int = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# =========================
+# Hybrid Retrieval
+# =========================
+
+# Fuse BM25 and dense rankings with reciprocal rank fusion
+HYBRID_RETRIEVAL_ENABLED: bool = True
+RRF_K: int = 60
+
+BM25_K1: float = 1.5
+BM25_B: float = 0.75
+
+# Identifier-like tokens (containing a digit, at least this long)
+# matching a single chunk boost that chunk into the results; questions
+# that are only an identifier lookup are answered from that chunk
+# without embedding the query
+LEXICAL_FAST_PATH_ENABLED: bool = True
+LEXICAL_IDENTIFIER_MIN_LENGTH: int = 4
+
+# Similarity reported for such an exact identifier match
+LEXICAL_MATCH_SIMILARITY: float = 0.9
+
+# =========================
+# Filtered Search
+# =========================
+
+# Filters matching at most this many entries are scored exactly;
+# larger ones are applied inside the HNSW search via an id bitmap
+FILTERED_EXACT_SEARCH_MAX_ROWS: int = 2048
+
+# Per-index cap on cached (field, value) filter bitsets (LRU)
+METADATA_BITSET_CACHE_SIZE: int = 256
+
+# =========================
+# Corpus Search
+# =========================
+
+# Uploaded documents kept searchable as corpus shards (newest first)
+CORPUS_MAX_DOCUMENTS: int = int(os.getenv("CORPUS_MAX_DOCUMENTS", "100"))
+
+# Shards searched in parallel (FAISS releases the GIL while searching)
+CORPUS_SEARCH_THREADS: int = os.cpu_count() or 4
+
+# =========================
+# Metrics
+# =========================
+
+# Record runtime metrics; when off, every recording call returns at once
+METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+
+# Upper bounds (seconds) of the latency histogram buckets
+METRICS_LATENCY_BUCKETS: List[float] = [
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+]
+
+# Interval at which each worker writes its metrics for the others to
+# report (see METRICS_MULTIPROCESS_DIR under State Backend)
+METRICS_FLUSH_INTERVAL_SECONDS: float = float(
+    os.getenv("METRICS_FLUSH_INTERVAL_SECONDS", "5.0")
+)
+
+# =========================
+# State Backend
+# =========================
+
+# "memory" (single process) or "sqlite" (shared by all workers on a host/volume)
+STATE_BACKEND: str = os.getenv("STATE_BACKEND", "memory")
+
+STATE_DB_PATH: str = os.getenv("STATE_DB_PATH", "state/ultradoc.db")
+STATE_INDEX_DIR: str = os.getenv("STATE_INDEX_DIR", "state/indexes")
+
+# Directory through which all workers' metrics are merged, so /metrics
+# reports totals whichever worker serves the scrape; next to the SQLite
+# database by default, "" keeps metrics per process
+METRICS_MULTIPROCESS_DIR: str = os.getenv(
+    "METRICS_MULTIPROCESS_DIR",
+    (
+        os.path.join(os.path.dirname(STATE_DB_PATH), "metrics")
+        if STATE_BACKEND == "sqlite"
+        else ""
+    ),
+)
+
+# Memory-map persisted indexes so worker processes share one copy
+INDEX_MMAP_ENABLED: bool = True
@@ -51,7 +51,14 @@ class StructureAwareChunker:
 
                     # Natural language format is often better for semantic search
                     chunk_text: str = f"The {key}{alias_str} is {value}."
-                    chunks.append({"chunk_id": str(chunk_id), "content": chunk_text})
+                    chunks.append(
+                        {
+                            "chunk_id": str(chunk_id),
+                            "content": chunk_text,
+                            "field": key,
+                            "value": str(value),
+                        }
+                    )
                     chunk_id += 1
 
         return chunks
@@ -2,13 +2,23 @@
 Document Processor Module
 
 Uses pdfplumber for layout-aware PDF extraction
-and preserves structural line breaks.
+and preserves structural line breaks. PDF tables can be
+collected in the same pass.
 """
 
 import os
-from typing import List
+import time
+from typing import List, Optional, Tuple
 import pdfplumber
 from docx import Document
+from src.core.state.metrics import METRICS
+
+# Separator placed between pages so downstream stages can
+# recover page boundaries (form feed)
+PAGE_SEPARATOR: str = "\f"
+
+# A table as extracted by pdfplumber: rows of cells (None when empty)
+Table = List[List[Optional[str]]]
 
 
 class DocumentProcessor:
@@ -30,11 +40,35 @@ class DocumentProcessor:
             str
         """
 
+        return self.extract_text_and_tables(file_path, include_tables=False)[0]
+
+    def extract_text_and_tables(
+        self, file_path: str, include_tables: bool = True
+    ) -> Tuple[str, List[Table]]:
+        """
+        Extract text and, for PDFs, the page tables in the same
+        pdfplumber pass (so the file is parsed once).
+
+        Args:
+            file_path (str)
+            include_tables (bool): Collect tables; skipped when False.
+
+        Returns:
+            Tuple[str, List[Table]]: Text, and tables in page order
+                (empty for other file types).
+        """
+
+        start: float = time.perf_counter()
+
         _, file_extension = os.path.splitext(file_path)
         file_extension = file_extension.lower()
 
+        tables: List[Table] = []
+
         if file_extension == ".pdf":
-            extracted_text: str = self._extract_from_pdf(file_path)
+            extracted_text: str = self._extract_from_pdf(
+                file_path, tables if include_tables else None
+            )
 
         elif file_extension == ".docx":
             extracted_text: str = self._extract_from_docx(file_path)
@@ -45,14 +79,20 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported file type: {file_extension}")
 
-        return extracted_text
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "parse"}
+        )
+
+        return extracted_text, tables
 
-    def _extract_from_pdf(self, file_path: str) -> str:
+    def _extract_from_pdf(self, file_path: str, tables: Optional[List[Table]]) -> str:
         """
         Layout-aware PDF extraction using pdfplumber.
 
         Args:
             file_path (str)
+            tables (Optional[List[Table]]): Filled with the page tables;
+                tables are not extracted when None.
 
         Returns:
             str
@@ -65,10 +105,13 @@ class DocumentProcessor:
                 # Extract text with layout preserved
                 text: str = page.extract_text(x_tolerance=2, y_tolerance=2)
 
-                if text:
-                    pages_text.append(text)
+                # Empty pages are kept so page numbers stay accurate
+                pages_text.append(text or "")
+
+                if tables is not None:
+                    tables.extend(page.extract_tables())
 
-        return "\n".join(pages_text)
+        return PAGE_SEPARATOR.join(pages_text)
 
     def _extract_from_docx(self, file_path: str) -> str:
         document: Document = Document(file_path)
@@ -6,11 +6,15 @@ into canonical structured JSON.
 """
 
 from src.config.settings import CHUNKING_LLM_MODEL
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from openai import OpenAI
 from src.core.data.schemas import StructuredDocumentModel
+from src.core.data.prompt_reducer import PromptReducer
+from src.core.services.llm_client import ResilientLLMClient
+from src.core.state.metrics import METRICS
 from pydantic import ValidationError
 import json
+import time
 
 
 class LLMStructuredExtractor:
@@ -18,10 +22,26 @@ class LLMStructuredExtractor:
     Uses LLM to extract structured JSON from document text.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, reduce_prompt: bool = True) -> None:
+        """
+        Initialize LLMStructuredExtractor.
+
+        Args:
+            api_key (str): OpenAI API key.
+            reduce_prompt (bool): Shrink document text before sending it.
+        """
 
         self.client = OpenAI(api_key=api_key)
 
+        self.llm_client: ResilientLLMClient = ResilientLLMClient(self.client)
+
+        self.prompt_reducer: Optional[PromptReducer] = (
+            PromptReducer() if reduce_prompt else None
+        )
+
+        # Token statistics of the most recent extraction
+        self.last_reduction_stats: Dict[str, int] = {}
+
     def extract(self, document_text: str) -> Dict[str, Any]:
         """
         Extract structured JSON from document using LLM.
@@ -67,6 +87,11 @@ class LLMStructuredExtractor:
         }
         """
 
+        if self.prompt_reducer:
+            reduction: Dict[str, Any] = self.prompt_reducer.reduce(document_text)
+            document_text = reduction.pop("text")
+            self.last_reduction_stats = reduction
+
         user_prompt: str = f"""
         Document Content:
 
@@ -75,7 +100,9 @@ class LLMStructuredExtractor:
         Return structured JSON.
         """
 
-        response = self.client.chat.completions.create(
+        start: float = time.perf_counter()
+
+        response = self.llm_client.create_chat_completion(
             model=CHUNKING_LLM_MODEL,
             temperature=0,
             messages=[
@@ -84,6 +111,24 @@ class LLMStructuredExtractor:
             ],
         )
 
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "extract"}
+        )
+
+        usage = getattr(response, "usage", None)
+
+        if usage is not None:
+            METRICS.increment(
+                "llm_prompt_tokens_total",
+                usage.prompt_tokens or 0,
+                {"purpose": "extraction"},
+            )
+            METRICS.increment(
+                "llm_completion_tokens_total",
+                usage.completion_tokens or 0,
+                {"purpose": "extraction"},
+            )
+
         raw_output: str = response.choices[0].message.content
 
         # Robust JSON extraction (handle markdown blocks)
@@ -0,0 +1,85 @@
+"""
+Mapped Metadata Module
+
+Read-only chunk metadata backed by memory-mapped files, so that
+every worker process opening the same index shares one copy
+through the OS page cache.
+
+Layout:
+- <path>.meta: JSON records concatenated as UTF-8 bytes
+- <path>.offsets.npy: int64 record boundaries (n + 1 entries)
+"""
+
+from typing import Dict, List, Iterator
+from collections.abc import Sequence
+import json
+import numpy as np
+
+
+class MappedMetadata(Sequence):
+    """
+    Sequence of metadata dicts decoded lazily from a memory map.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open mapped metadata written by write().
+
+        Args:
+            path (str): Path prefix used when writing.
+        """
+
+        self.offsets: np.ndarray = np.load(f"{path}.offsets.npy", mmap_mode="r")
+
+        self.records: np.ndarray = (
+            np.memmap(f"{path}.meta", dtype=np.uint8, mode="r")
+            if self.offsets[-1] > 0
+            else np.zeros(0, dtype=np.uint8)
+        )
+
+    @staticmethod
+    def write(path: str, metadata: List[Dict[str, str]]) -> None:
+        """
+        Write metadata in the mapped layout.
+
+        Args:
+            path (str): Path prefix.
+            metadata (List[Dict[str, str]]): Records to write.
+        """
+
+        encoded: List[bytes] = [
+            json.dumps(record, separators=(",", ":")).encode("utf-8")
+            for record in metadata
+        ]
+
+        offsets: np.ndarray = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(record) for record in encoded], out=offsets[1:])
+
+        with open(f"{path}.meta", "wb") as file:
+            for record in encoded:
+                file.write(record)
+
+        with open(f"{path}.offsets.npy", "wb") as file:
+            np.save(file, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> Dict[str, str]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        if not 0 <= idx < len(self):
+            raise IndexError("metadata index out of range")
+
+        start: int = int(self.offsets[idx])
+        end: int = int(self.offsets[idx + 1])
+
+        return json.loads(self.records[start:end].tobytes())
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for idx in range(len(self)):
+            yield self[idx]
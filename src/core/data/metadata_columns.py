@@ -0,0 +1,352 @@
+"""
+Metadata Columns Module
+
+Columnar, array-backed view of chunk metadata for filtered search.
+
+Every scalar metadata field (field, page, section, ...) and every
+table cell (as "columns.<header>") is stored as an int32 array of
+value codes, one entry per index row. Filters resolve to packed id
+bitsets in FAISS's IDSelectorBitmap layout, so predicates are
+applied inside the vector search instead of after it.
+
+Values are matched case- and whitespace-insensitively.
+
+Layout (next to the index, see save()):
+- <path>.columns.npy: int32 codes, one row per field (-1 = missing)
+- <path>.columns.json: field names and their value dictionaries
+"""
+
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+from collections import OrderedDict
+import json
+import os
+import threading
+import numpy as np
+from src.config.settings import METADATA_BITSET_CACHE_SIZE
+
+# Free text and offsets are never filtered on; chunk ids are unique
+# per chunk, so a column of them would hold one value per row
+UNINDEXED_FIELDS: frozenset = frozenset(
+    {"content", "question", "start", "end", "chunk_id"}
+)
+
+# Set bits per byte value, for counting bitset members
+_POPCOUNT: np.ndarray = np.array([bin(i).count("1") for i in range(256)], np.uint8)
+
+
+def normalize_value(value: Any) -> str:
+    """
+    Canonical form of a filter or metadata value.
+
+    Args:
+        value (Any)
+
+    Returns:
+        str: Whitespace-collapsed, lowercased text.
+    """
+
+    return " ".join(str(value).split()).lower()
+
+
+def normalize_field(field: str) -> str:
+    """
+    Canonical field name ("columns.<header>" headers are normalized
+    like values).
+
+    Args:
+        field (str)
+
+    Returns:
+        str
+    """
+
+    if field.startswith("columns."):
+        return f"columns.{normalize_value(field[len('columns.'):])}"
+
+    return field
+
+
+def _entry_fields(metadata: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+    """
+    Indexed (field, normalized value) pairs of one metadata entry.
+
+    Args:
+        metadata (Dict[str, Any])
+
+    Returns:
+        Iterable[Tuple[str, str]]
+    """
+
+    for key, value in metadata.items():
+        if key in UNINDEXED_FIELDS or value is None:
+            continue
+
+        if key == "columns" and isinstance(value, dict):
+            for header, cell in value.items():
+                yield f"columns.{normalize_value(header)}", normalize_value(cell)
+
+        elif isinstance(value, (str, int, float, bool)):
+            yield key, normalize_value(value)
+
+
+class MetadataColumns:
+    """
+    Per-field value codes with cached per-value id bitsets.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty column store.
+        """
+
+        self.row_count: int = 0
+
+        # field -> int32 codes per row, and field -> value -> code
+        self.codes: Dict[str, np.ndarray] = {}
+        self.values: Dict[str, Dict[str, int]] = {}
+
+        # Growable arrays behind codes (codes are their first row_count
+        # entries), over-allocated so that extend() amortizes copies
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._capacity: int = 0
+
+        # (field, value) -> packed bitset, built on first use; least
+        # recently used first
+        self._bitsets: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._bitsets_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def from_metadata(cls, metadata: Iterable[Dict[str, Any]]) -> "MetadataColumns":
+        """
+        Build columns from metadata entries (e.g. indexes saved before
+        columns were persisted).
+
+        Args:
+            metadata (Iterable[Dict[str, Any]])
+
+        Returns:
+            MetadataColumns
+        """
+
+        columns: MetadataColumns = cls()
+        columns.extend(list(metadata))
+
+        return columns
+
+    @classmethod
+    def load(cls, path: str) -> Optional["MetadataColumns"]:
+        """
+        Open columns written by save(); codes are memory-mapped.
+
+        Args:
+            path (str): Path prefix used when saving.
+
+        Returns:
+            Optional[MetadataColumns]: None when no columns were saved.
+        """
+
+        if not os.path.exists(f"{path}.columns.json"):
+            return None
+
+        with open(f"{path}.columns.json", "r", encoding="utf-8") as file:
+            layout: Dict[str, Any] = json.load(file)
+
+        columns: MetadataColumns = cls()
+        columns.row_count = layout["row_count"]
+
+        if layout["fields"]:
+            matrix: np.ndarray = np.load(f"{path}.columns.npy", mmap_mode="r")
+
+            for position, field in enumerate(layout["fields"]):
+                columns.codes[field] = matrix[position]
+                columns.values[field] = {
+                    value: code for code, value in enumerate(layout["values"][field])
+                }
+
+        return columns
+
+    def save(self, path: str) -> None:
+        """
+        Write the columns next to an index.
+
+        Args:
+            path (str): Path prefix.
+        """
+
+        fields: List[str] = list(self.codes)
+
+        matrix: np.ndarray = np.full((len(fields), self.row_count), -1, dtype=np.int32)
+
+        for position, field in enumerate(fields):
+            matrix[position] = self.codes[field]
+
+        with open(f"{path}.columns.npy", "wb") as file:
+            np.save(file, matrix)
+
+        with open(f"{path}.columns.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "row_count": self.row_count,
+                    "fields": fields,
+                    # Values in code order
+                    "values": {field: list(self.values[field]) for field in fields},
+                },
+                file,
+            )
+
+    def extend(self, metadata: List[Dict[str, Any]]) -> None:
+        """
+        Append rows for newly indexed entries.
+
+        Args:
+            metadata (List[Dict[str, Any]]): Entries in index order.
+        """
+
+        first_row: int = self.row_count
+        self.row_count += len(metadata)
+
+        # Capacity doubles, so streaming n rows in batches copies O(n)
+        # codes in total rather than every column on every batch
+        if self.row_count > self._capacity:
+            self._capacity = max(self.row_count, 2 * self._capacity)
+            self._buffers = {}
+
+        # Columns loaded from disk (or outgrown) are copied once
+        for field, codes in self.codes.items():
+            if field not in self._buffers:
+                self._buffers[field] = self._new_buffer(codes)
+
+        for offset, entry in enumerate(metadata):
+            for field, value in _entry_fields(entry):
+                field_values: Dict[str, int] = self.values.setdefault(field, {})
+                code: int = field_values.setdefault(value, len(field_values))
+
+                if field not in self._buffers:
+                    self._buffers[field] = self._new_buffer(np.empty(0, dtype=np.int32))
+
+                self._buffers[field][first_row + offset] = code
+
+        self.codes = {
+            field: buffer[: self.row_count] for field, buffer in self._buffers.items()
+        }
+
+        self._bitsets.clear()
+
+    def _new_buffer(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Buffer of the current capacity holding codes, padded with -1.
+
+        Args:
+            codes (np.ndarray): Existing codes of a field.
+
+        Returns:
+            np.ndarray
+        """
+
+        buffer: np.ndarray = np.full(self._capacity, -1, dtype=np.int32)
+        buffer[: len(codes)] = codes
+
+        return buffer
+
+    def bitset(self, where: Dict[str, Any]) -> np.ndarray:
+        """
+        Rows matching all predicates, as a packed bitset.
+
+        Args:
+            where (Dict[str, Any]): field -> required value; table cells
+                are addressed as "columns.<header>".
+
+        Returns:
+            np.ndarray: uint8 bitset, bit i (little-endian within bytes)
+                set when row i matches.
+        """
+
+        result: Optional[np.ndarray] = None
+
+        for field, value in where.items():
+            field_bitset: np.ndarray = self._value_bitset(
+                normalize_field(field), normalize_value(value)
+            )
+
+            result = (
+                field_bitset if result is None else np.bitwise_and(result, field_bitset)
+            )
+
+        if result is None:
+            # No predicates: every row matches
+            return np.packbits(np.ones(self.row_count, dtype=bool), bitorder="little")
+
+        return result
+
+    def _value_bitset(self, field: str, value: str) -> np.ndarray:
+        """
+        Cached bitset of rows whose field equals value.
+
+        Args:
+            field (str): Normalized field name.
+            value (str): Normalized value.
+
+        Returns:
+            np.ndarray: Packed uint8 bitset.
+        """
+
+        key: Tuple[str, str] = (field, value)
+
+        # Searches run concurrently (request threads, corpus shards)
+        with self._bitsets_lock:
+            cached: Optional[np.ndarray] = self._bitsets.get(key)
+
+            if cached is not None:
+                self._bitsets.move_to_end(key)
+
+                return cached
+
+        code: Optional[int] = self.values.get(field, {}).get(value)
+
+        mask: np.ndarray = (
+            np.asarray(self.codes[field]) == code
+            if code is not None
+            else np.zeros(self.row_count, dtype=bool)
+        )
+
+        bitset: np.ndarray = np.packbits(mask, bitorder="little")
+
+        with self._bitsets_lock:
+            self._bitsets[key] = bitset
+
+            # Each bitset holds row_count / 8 bytes; keep the most recent ones
+            while len(self._bitsets) > METADATA_BITSET_CACHE_SIZE:
+                self._bitsets.popitem(last=False)
+
+        return bitset
+
+
+def bitset_count(bitset: np.ndarray) -> int:
+    """
+    Number of rows set in a packed bitset.
+
+    Args:
+        bitset (np.ndarray)
+
+    Returns:
+        int
+    """
+
+    return int(_POPCOUNT[bitset].sum(dtype=np.int64))
+
+
+def bitset_rows(bitset: np.ndarray, row_count: int) -> np.ndarray:
+    """
+    Row ids set in a packed bitset.
+
+    Args:
+        bitset (np.ndarray)
+        row_count (int): Rows covered by the bitset.
+
+    Returns:
+        np.ndarray: int64 row ids, ascending.
+    """
+
+    return np.flatnonzero(
+        np.unpackbits(bitset, count=row_count, bitorder="little")
+    ).astype(np.int64)
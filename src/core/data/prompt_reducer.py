@@ -0,0 +1,292 @@
+"""
+Prompt Reducer Module
+
+Shrinks raw document text before structured extraction by:
+- Normalizing whitespace
+- Dropping headers/footers repeated across pages
+- Keeping only lines near logistics keywords
+- Enforcing a token budget
+"""
+
+from typing import Dict, Any, List, Set
+from collections import Counter
+import re
+from src.config.settings import (
+    EXTRACTION_TOKEN_BUDGET,
+    RELEVANCE_CONTEXT_LINES,
+    REPEATED_LINE_PAGE_RATIO,
+)
+from src.core.data.document_processor import PAGE_SEPARATOR
+from src.core.data.chunker import StructureAwareChunker
+from src.core.data.token_estimator import estimate_tokens
+
+
+class PromptReducer:
+    """
+    Reduces document text to the parts relevant for shipment extraction.
+    """
+
+    # Terms that signal shipment-relevant content
+    LOGISTICS_KEYWORDS: List[str] = [
+        "load",
+        "shipment",
+        "order",
+        "reference",
+        "bol",
+        "bill of lading",
+        "pro",
+        "po",
+        "shipper",
+        "consignee",
+        "pickup",
+        "pick up",
+        "delivery",
+        "deliver",
+        "ship date",
+        "arrival",
+        "carrier",
+        "trucking",
+        "driver",
+        "weight",
+        "lbs",
+        "kg",
+        "kgs",
+        "rate",
+        "total",
+        "amount",
+        "usd",
+        "currency",
+        "equipment",
+        "trailer",
+        "van",
+        "reefer",
+        "flatbed",
+        "mode",
+        "ftl",
+        "ltl",
+        "origin",
+        "destination",
+        "stop",
+    ]
+
+    # Headings of pages that only contain legal boilerplate
+    BOILERPLATE_HEADINGS: List[str] = [
+        "terms and conditions",
+        "terms & conditions",
+        "standard terms",
+        "general conditions",
+        "limitation of liability",
+    ]
+
+    def __init__(
+        self,
+        token_budget: int = EXTRACTION_TOKEN_BUDGET,
+        context_lines: int = RELEVANCE_CONTEXT_LINES,
+    ) -> None:
+        """
+        Initialize PromptReducer.
+
+        Args:
+            token_budget (int): Maximum estimated tokens of reduced text.
+            context_lines (int): Lines kept around each keyword hit.
+        """
+
+        self.token_budget: int = token_budget
+        self.context_lines: int = context_lines
+
+        keywords: Set[str] = set(self.LOGISTICS_KEYWORDS)
+
+        # Include canonical field names and their aliases
+        # (short aliases such as "To"/"From" match almost every line)
+        for field_name, aliases in StructureAwareChunker.FIELD_ALIASES.items():
+            keywords.add(field_name.lower().replace("_", " "))
+            keywords.update(alias.lower() for alias in aliases if len(alias) > 4)
+
+        self.keyword_pattern: re.Pattern = re.compile(
+            r"\b("
+            + "|".join(
+                re.escape(keyword)
+                for keyword in sorted(keywords, key=len, reverse=True)
+            )
+            + r")\b",
+            re.IGNORECASE,
+        )
+
+    def reduce(self, document_text: str) -> Dict[str, Any]:
+        """
+        Reduce document text for LLM extraction.
+
+        Args:
+            document_text (str): Raw extracted document text.
+
+        Returns:
+            Dict[str, Any]:
+                - text: Reduced document text
+                - original_tokens: Estimated tokens before reduction
+                - reduced_tokens: Estimated tokens after reduction
+                - tokens_saved: Difference between the two
+        """
+
+        pages: List[List[str]] = [
+            self._normalize_whitespace(page)
+            for page in document_text.split(PAGE_SEPARATOR)
+        ]
+
+        pages = [page for page in pages if page and not self._is_boilerplate_page(page)]
+
+        lines: List[str] = self._remove_repeated_lines(pages)
+
+        relevant_lines: List[str] = self._filter_relevant_lines(lines)
+
+        # Non-logistics documents have no keyword hits; keep the
+        # normalized text so the LLM can still classify them
+        if not relevant_lines:
+            relevant_lines = lines
+
+        reduced_lines: List[str] = self._apply_token_budget(relevant_lines)
+
+        reduced_text: str = "\n".join(reduced_lines)
+
+        original_tokens: int = estimate_tokens(document_text)
+        reduced_tokens: int = estimate_tokens(reduced_text)
+
+        return {
+            "text": reduced_text,
+            "original_tokens": original_tokens,
+            "reduced_tokens": reduced_tokens,
+            "tokens_saved": max(0, original_tokens - reduced_tokens),
+        }
+
+    def _normalize_whitespace(self, page_text: str) -> List[str]:
+        """
+        Collapse whitespace runs and drop empty lines.
+
+        Args:
+            page_text (str)
+
+        Returns:
+            List[str]: Normalized non-empty lines.
+        """
+
+        lines: List[str] = []
+
+        for line in page_text.splitlines():
+            normalized: str = " ".join(line.split())
+
+            if normalized:
+                lines.append(normalized)
+
+        return lines
+
+    def _is_boilerplate_page(self, page_lines: List[str]) -> bool:
+        """
+        Detect terms-and-conditions style pages from their heading.
+
+        Args:
+            page_lines (List[str])
+
+        Returns:
+            bool
+        """
+
+        heading: str = " ".join(page_lines[:3]).lower()
+
+        return any(marker in heading for marker in self.BOILERPLATE_HEADINGS)
+
+    def _remove_repeated_lines(self, pages: List[List[str]]) -> List[str]:
+        """
+        Keep only the first occurrence of lines repeated across pages
+        (running headers and footers).
+
+        Args:
+            pages (List[List[str]])
+
+        Returns:
+            List[str]: Flattened lines.
+        """
+
+        if len(pages) < 2:
+            return [line for page in pages for line in page]
+
+        page_counts: Counter = Counter()
+
+        for page in pages:
+            page_counts.update(set(page))
+
+        min_pages: int = max(2, int(len(pages) * REPEATED_LINE_PAGE_RATIO))
+
+        repeated: Set[str] = {
+            line for line, count in page_counts.items() if count >= min_pages
+        }
+
+        seen: Set[str] = set()
+        lines: List[str] = []
+
+        for page in pages:
+            for line in page:
+                if line in repeated:
+                    if line in seen:
+                        continue
+                    seen.add(line)
+
+                lines.append(line)
+
+        return lines
+
+    def _filter_relevant_lines(self, lines: List[str]) -> List[str]:
+        """
+        Keep lines containing logistics keywords plus surrounding context.
+
+        Args:
+            lines (List[str])
+
+        Returns:
+            List[str]
+        """
+
+        keep: List[bool] = [False] * len(lines)
+
+        for idx, line in enumerate(lines):
+            if self.keyword_pattern.search(line):
+                start: int = max(0, idx - self.context_lines)
+                end: int = min(len(lines), idx + self.context_lines + 1)
+
+                for keep_idx in range(start, end):
+                    keep[keep_idx] = True
+
+        return [line for line, flag in zip(lines, keep) if flag]
+
+    def _apply_token_budget(self, lines: List[str]) -> List[str]:
+        """
+        Truncate to the token budget, preferring keyword-dense lines
+        and preserving original line order.
+
+        Args:
+            lines (List[str])
+
+        Returns:
+            List[str]
+        """
+
+        line_tokens: List[int] = [estimate_tokens(line) + 1 for line in lines]
+
+        if sum(line_tokens) <= self.token_budget:
+            return lines
+
+        # Rank by keyword hits, earlier lines first on ties
+        ranked: List[int] = sorted(
+            range(len(lines)),
+            key=lambda idx: (-len(self.keyword_pattern.findall(lines[idx])), idx),
+        )
+
+        selected: Set[int] = set()
+        used_tokens: int = 0
+
+        for idx in ranked:
+            if used_tokens + line_tokens[idx] > self.token_budget:
+                continue
+
+            selected.add(idx)
+            used_tokens += line_tokens[idx]
+
+        return [lines[idx] for idx in sorted(selected)]
@@ -0,0 +1,104 @@
+"""
+Synthetic Question Generator
+
+Generates canonical question phrasings for each field chunk so
+that queries can be matched question-to-question at retrieval time.
+"""
+
+from typing import List, Dict
+import re
+from src.config.settings import MAX_SYNTHETIC_QUESTIONS_PER_FIELD
+from src.core.data.chunker import StructureAwareChunker
+from src.core.data.schemas import ShipmentDetailsModel
+
+
+class SyntheticQuestionGenerator:
+    """
+    Builds question index entries pointing to field chunks.
+    """
+
+    # Fields naming a party are asked about with "Who"
+    PARTY_FIELDS: List[str] = ["shipper", "consignee", "carrier_name"]
+
+    def __init__(
+        self, max_questions_per_field: int = MAX_SYNTHETIC_QUESTIONS_PER_FIELD
+    ) -> None:
+        """
+        Initialize SyntheticQuestionGenerator.
+
+        Args:
+            max_questions_per_field (int): Cap on phrasings per field.
+        """
+
+        self.max_questions_per_field: int = max_questions_per_field
+
+    def generate(self, chunks: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Generate question entries for field chunks.
+
+        Args:
+            chunks (List[Dict[str, str]]): Field-level chunks.
+
+        Returns:
+            List[Dict[str, str]]: Index entries carrying the field chunk's
+                metadata plus the "question" text to embed.
+        """
+
+        entries: List[Dict[str, str]] = []
+
+        for chunk in chunks:
+            field_name: str = chunk.get("field")
+
+            if not field_name:
+                continue
+
+            for question in self.questions_for_field(field_name):
+                entries.append({**chunk, "question": question})
+
+        return entries
+
+    def questions_for_field(self, field_name: str) -> List[str]:
+        """
+        Canonical phrasings for a field, from its name, aliases and
+        schema description.
+
+        Args:
+            field_name (str)
+
+        Returns:
+            List[str]
+        """
+
+        label: str = field_name.lower().replace("_", " ")
+
+        if field_name in self.PARTY_FIELDS:
+            wh_word: str = "Who"
+        elif field_name.endswith("_datetime"):
+            wh_word = "When"
+            label = label.replace(" datetime", " date")
+        else:
+            wh_word = "What"
+
+        questions: List[str] = [f"What is the {label}?"]
+
+        if wh_word == "When":
+            questions.append(f"When is the {label.replace(' date', '')}?")
+        elif wh_word == "Who":
+            questions.append(f"Who is the {label}?")
+
+        for alias in StructureAwareChunker.FIELD_ALIASES.get(field_name, []):
+            # Skip prepositions like "To"/"From"
+            if len(alias) > 4:
+                questions.append(f"{wh_word} is the {alias.lower()}?")
+
+        field_info = ShipmentDetailsModel.model_fields.get(field_name)
+
+        if field_info is not None and field_info.description:
+            # Drop parenthetical examples such as "(e.g., FTL, LTL)"
+            description: str = re.sub(r"\s*\(.*?\)", "", field_info.description)
+            questions.append(f"{wh_word} is the {description.lower()}?")
+
+        # Preserve order, drop duplicates
+        unique_questions: List[str] = list(dict.fromkeys(questions))
+
+        return unique_questions[: self.max_questions_per_field]
@@ -0,0 +1,141 @@
+"""
+Sharded Index Module
+
+Corpus-wide search over many per-document vector stores.
+
+Each uploaded document is one shard. A query is searched on every
+shard in parallel (FAISS releases the GIL while searching, so shards
+are spread across cores), and the per-shard top-k lists are merged
+with a heap. Shards carry their upload time, so time-bounded queries
+skip shards outside the range without searching them.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import numpy as np
+from src.config.settings import CORPUS_SEARCH_THREADS
+from src.core.data.vector_store import VectorStore
+
+# Shared by all corpus queries, bounding shard searches in flight
+_SHARD_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=CORPUS_SEARCH_THREADS, thread_name_prefix="shard-search"
+)
+
+
+class IndexShard:
+    """
+    One document's vector store with its attribution.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        document_id: str,
+        uploaded_at: float,
+        vector_store: VectorStore,
+    ) -> None:
+        """
+        Initialize IndexShard.
+
+        Args:
+            version (int): Backend version of the document.
+            document_id (str): Content hash of the document text.
+            uploaded_at (float): Upload time (Unix seconds).
+            vector_store (VectorStore): The document's index.
+        """
+
+        self.version: int = version
+        self.document_id: str = document_id
+        self.uploaded_at: float = uploaded_at
+        self.vector_store: VectorStore = vector_store
+
+    def attribution(self) -> Dict[str, Any]:
+        """
+        Document fields reported with each hit.
+
+        Returns:
+            Dict[str, Any]
+        """
+
+        return {
+            "document_id": self.document_id,
+            "version": self.version,
+            "uploaded_at": self.uploaded_at,
+        }
+
+
+class ShardedIndex:
+    """
+    Immutable set of shards searched as one index.
+    """
+
+    def __init__(self, shards: List[IndexShard]) -> None:
+        """
+        Initialize ShardedIndex.
+
+        Args:
+            shards (List[IndexShard]): Shards, any order.
+        """
+
+        self.shards: List[IndexShard] = sorted(shards, key=lambda s: s.version)
+
+        self.versions: frozenset = frozenset(shard.version for shard in shards)
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        where: Optional[Dict[str, Any]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[Tuple[IndexShard, Dict[str, str], float]]:
+        """
+        Global top_k over all shards uploaded within [since, until].
+
+        Args:
+            query_embedding (np.ndarray): Query embedding vector.
+            top_k (int): Number of results to return.
+            where (Optional[Dict[str, Any]]): Metadata predicates, applied
+                inside each shard's search.
+            since (Optional[float]): Earliest upload time (Unix seconds).
+            until (Optional[float]): Latest upload time (Unix seconds).
+
+        Returns:
+            List[Tuple[IndexShard, Dict[str, str], float]]:
+                (shard, metadata, similarity_score), best first.
+        """
+
+        shards: List[IndexShard] = [
+            shard
+            for shard in self.shards
+            if (since is None or shard.uploaded_at >= since)
+            and (until is None or shard.uploaded_at <= until)
+        ]
+
+        if not shards:
+            return []
+
+        def search_shard(
+            shard: IndexShard,
+        ) -> List[Tuple[IndexShard, Dict[str, str], float]]:
+            return [
+                (shard, metadata, score)
+                for metadata, score in shard.vector_store.search(
+                    query_embedding, top_k, where
+                )
+            ]
+
+        # A lone shard is not worth a thread hop
+        if len(shards) == 1:
+            shard_results = [search_shard(shards[0])]
+        else:
+            shard_results = list(_SHARD_EXECUTOR.map(search_shard, shards))
+
+        # Each shard's list is sorted best first: k-way merge, stop at top_k
+        merged: Iterator[Tuple[IndexShard, Dict[str, str], float]] = heapq.merge(
+            *shard_results, key=lambda hit: -hit[2]
+        )
+
+        return list(itertools.islice(merged, top_k))
@@ -5,7 +5,7 @@ Converts layout-aware PDF tables into clean semantic JSON.
 No hardcoding. Fully generic.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable
 import pdfplumber
 
 
@@ -28,25 +28,38 @@ class StructuredExtractor:
             Dict[str, Any]
         """
 
-        structured: Dict[str, Any] = {"sections": []}
-
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
+            return self.parse_tables(
+                table for page in pdf.pages for table in page.extract_tables()
+            )
+
+    def parse_tables(self, tables: Iterable[List[List[str]]]) -> Dict[str, Any]:
+        """
+        Structured representation of already extracted tables
+        (e.g. collected by DocumentProcessor while reading the text).
+
+        Args:
+            tables (Iterable[List[List[str]]]): Tables in page order.
+
+        Returns:
+            Dict[str, Any]
+        """
 
-                for table in tables:
-                    if not table or len(table) < 1:
-                        continue
+        structured: Dict[str, Any] = {"sections": []}
 
-                    cleaned_table = self._clean_table(table)
+        for table in tables:
+            if not table or len(table) < 1:
+                continue
+
+            cleaned_table = self._clean_table(table)
 
-                    if not cleaned_table:
-                        continue
+            if not cleaned_table:
+                continue
 
-                    parsed_section = self._parse_table(cleaned_table)
+            parsed_section = self._parse_table(cleaned_table)
 
-                    if parsed_section:
-                        structured["sections"].append(parsed_section)
+            if parsed_section:
+                structured["sections"].append(parsed_section)
 
         return structured
 
@@ -0,0 +1,26 @@
+"""
+Token Estimator Module
+
+Provides a cheap, dependency-free approximation of
+LLM token counts for prompt budgeting.
+"""
+
+import math
+from src.config.settings import CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate number of tokens in text.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        int: Approximate token count.
+    """
+
+    if not text:
+        return 0
+
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
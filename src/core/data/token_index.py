@@ -0,0 +1,181 @@
+"""
+Chunk Token Index Module
+
+Per-chunk token sets and an inverted index (token -> chunk ids),
+built once at ingest so lexical scoring over retrieved chunks is a
+set operation instead of a scan of their text. Term counts kept
+alongside support BM25 ranking.
+"""
+
+from typing import Dict, List, Set, FrozenSet, Iterable, Tuple
+from collections import Counter
+import math
+from src.config.settings import BM25_K1, BM25_B
+from src.core.data.tokenizer import tokenize, content_tokens
+
+
+class ChunkTokenIndex:
+    """
+    Token sets and postings of the chunks of one document.
+    """
+
+    def __init__(self, chunks: Iterable[Dict[str, str]]) -> None:
+        """
+        Build the index from chunk metadata.
+
+        Args:
+            chunks (Iterable[Dict[str, str]]): Chunk metadata; synthetic
+                question entries are skipped, each chunk is indexed once.
+        """
+
+        self.token_sets: Dict[str, FrozenSet[str]] = {}
+        self.postings: Dict[str, Set[str]] = {}
+
+        # BM25 statistics and the metadata returned by lexical search
+        self.term_counts: Dict[str, Counter] = {}
+        self.chunk_lengths: Dict[str, int] = {}
+        self.chunks: Dict[str, Dict[str, str]] = {}
+
+        for chunk in chunks:
+            chunk_id: str = chunk.get("chunk_id")
+
+            # Question entries repeat their chunk's metadata
+            if chunk_id is None or "question" in chunk or chunk_id in self.token_sets:
+                continue
+
+            words: List[str] = tokenize(chunk.get("content", ""))
+            tokens: FrozenSet[str] = frozenset(words)
+
+            self.token_sets[chunk_id] = tokens
+            self.term_counts[chunk_id] = Counter(words)
+            self.chunk_lengths[chunk_id] = len(words)
+            self.chunks[chunk_id] = chunk
+
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(chunk_id)
+
+        self.average_length: float = (
+            sum(self.chunk_lengths.values()) / len(self.chunk_lengths)
+            if self.chunk_lengths
+            else 0.0
+        )
+
+    def tokens_of(self, chunk_ids: Iterable[str]) -> Set[str]:
+        """
+        Union of the token sets of the given chunks.
+
+        Args:
+            chunk_ids (Iterable[str])
+
+        Returns:
+            Set[str]
+        """
+
+        tokens: Set[str] = set()
+
+        for chunk_id in chunk_ids:
+            tokens |= self.token_sets.get(chunk_id, frozenset())
+
+        return tokens
+
+    def chunks_containing(self, token: str) -> Set[str]:
+        """
+        Chunk ids whose content contains token.
+
+        Args:
+            token (str): Lowercase token.
+
+        Returns:
+            Set[str]
+        """
+
+        return self.postings.get(token, set())
+
+    def bm25_search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
+        """
+        Rank chunks by BM25 score for the query's content tokens.
+
+        Args:
+            query (str): User question.
+            top_k (int): Number of chunks to return.
+
+        Returns:
+            List[Tuple[str, float]]: (chunk_id, score), best first;
+                chunks sharing no token with the query are omitted.
+        """
+
+        chunk_count: int = len(self.term_counts)
+        scores: Dict[str, float] = {}
+
+        for token in content_tokens(query):
+            matching: Set[str] = self.postings.get(token, set())
+
+            if not matching:
+                continue
+
+            idf: float = math.log(
+                1.0 + (chunk_count - len(matching) + 0.5) / (len(matching) + 0.5)
+            )
+
+            for chunk_id in matching:
+                frequency: int = self.term_counts[chunk_id][token]
+                norm: float = BM25_K1 * (
+                    1.0
+                    - BM25_B
+                    + BM25_B * self.chunk_lengths[chunk_id] / self.average_length
+                )
+
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * (
+                    frequency * (BM25_K1 + 1.0) / (frequency + norm)
+                )
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    def coverage(self, text: str, chunk_ids: Iterable[str]) -> float:
+        """
+        Fraction of the words of text found in the given chunks.
+
+        Args:
+            text (str): Text to score (e.g. a generated answer).
+            chunk_ids (Iterable[str]): Chunks it should be grounded in.
+
+        Returns:
+            float: Coverage between 0 and 1.
+        """
+
+        return self.coverage_batch([text], chunk_ids)[0]
+
+    def coverage_batch(self, texts: List[str], chunk_ids: Iterable[str]) -> List[float]:
+        """
+        Coverage of several texts against the same chunks.
+
+        Args:
+            texts (List[str]): Texts to score.
+            chunk_ids (Iterable[str]): Chunks they should be grounded in.
+
+        Returns:
+            List[float]: Coverage per text, between 0 and 1.
+        """
+
+        # Union is built once for the whole batch
+        context_tokens: Set[str] = self.tokens_of(chunk_ids)
+
+        return [coverage_ratio(tokenize(text), context_tokens) for text in texts]
+
+
+def coverage_ratio(words: List[str], context_tokens: Set[str]) -> float:
+    """
+    Fraction of words present in context_tokens.
+
+    Args:
+        words (List[str]): Tokenized text (repeats counted).
+        context_tokens (Set[str]): Tokens of the grounding context.
+
+    Returns:
+        float: Coverage between 0 and 1 (0 for no words).
+    """
+
+    if not words:
+        return 0.0
+
+    return sum(1 for word in words if word in context_tokens) / len(words)
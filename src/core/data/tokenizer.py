@@ -0,0 +1,45 @@
+"""
+Tokenizer Module
+
+Lightweight word tokenization shared by lexical components.
+"""
+
+from typing import List, Set
+import re
+
+# Common English function words and question words carrying no content
+STOPWORDS: Set[str] = set("""
+    a an and are as at be by can did do does for from has have how i in is
+    it its me my of on or please s tell that the this to was we were what
+    whats when where which who whom whose why will with you your
+    """.split())
+
+TOKEN_PATTERN: re.Pattern = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        List[str]: Tokens in order of appearance.
+    """
+
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def content_tokens(text: str) -> Set[str]:
+    """
+    Distinct tokens of text excluding stopwords.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        Set[str]: Content tokens.
+    """
+
+    return {token for token in tokenize(text) if token not in STOPWORDS}
@@ -5,10 +5,29 @@ Implements FAISS-based HNSW vector indexing
 with cosine similarity using Inner Product metric.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Any, Sequence, Optional
+import time
 import faiss
 import numpy as np
-from src.config.settings import TOP_K_RETRIEVAL
+from src.config.settings import (
+    TOP_K_RETRIEVAL,
+    SEARCH_OVERFETCH_FACTOR,
+    INDEX_MMAP_ENABLED,
+    FILTERED_EXACT_SEARCH_MAX_ROWS,
+    HNSW_M,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
+    ADAPTIVE_SEARCH_ENABLED,
+    ADAPTIVE_SCORE_GAP,
+    ADAPTIVE_EF_SEARCH,
+)
+from src.core.data.mapped_metadata import MappedMetadata
+from src.core.data.metadata_columns import (
+    MetadataColumns,
+    bitset_count,
+    bitset_rows,
+)
+from src.core.state.metrics import METRICS
 
 
 class VectorStore:
@@ -17,94 +36,384 @@ class VectorStore:
     for approximate nearest neighbor search.
     """
 
-    def __init__(self, embedding_dimension: int) -> None:
+    def __init__(
+        self,
+        embedding_dimension: int,
+        index: Any = None,
+        m: int = HNSW_M,
+        ef_construction: int = HNSW_EF_CONSTRUCTION,
+        ef_search: int = HNSW_EF_SEARCH,
+    ) -> None:
         """
         Initialize FAISS HNSW index.
 
         Args:
             embedding_dimension (int): Dimension of embedding vectors.
+            index (Any): Existing FAISS index to wrap (e.g. loaded from disk).
+            m (int): Neighbors per graph node (new indexes only).
+            ef_construction (int): Build-time beam width (new indexes only).
+            ef_search (int): Default search beam width.
         """
 
         self.embedding_dimension: int = embedding_dimension
 
-        # HNSW index with Inner Product metric
-        # 32 = number of neighbors per node (M parameter)
-        self.index = faiss.IndexHNSWFlat(
-            embedding_dimension, 32, faiss.METRIC_INNER_PRODUCT
-        )
+        if index is None:
+            # HNSW index with Inner Product metric
+            index = faiss.IndexHNSWFlat(
+                embedding_dimension, m, faiss.METRIC_INNER_PRODUCT
+            )
+
+            # Higher values improve accuracy but increase memory/time
+            index.hnsw.efConstruction = ef_construction
+
+        self.index = index
 
-        # Optional HNSW tuning parameters
-        # Higher values improve accuracy but increase memory/time
-        self.index.hnsw.efConstruction = 200
-        self.index.hnsw.efSearch = 50
+        self.index.hnsw.efSearch = ef_search
+
+        # Adaptive search: wider beam for ambiguous queries
+        self.adaptive_ef_search: int = ADAPTIVE_EF_SEARCH
+        self.adaptive_score_gap: float = ADAPTIVE_SCORE_GAP
 
         # Metadata storage aligned with vector index
-        self.metadata_store: List[Dict[str, str]] = []
+        # (a read-only MappedMetadata for stores loaded with mmap)
+        self.metadata_store: Sequence[Dict[str, str]] = []
+
+        # Columnar copy of the filterable metadata fields
+        self.metadata_columns: MetadataColumns = MetadataColumns()
+
+        # chunk_id -> row of its content vector, built on first use
+        self._chunk_rows: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def load(cls, index_path: str, mmap: bool = INDEX_MMAP_ENABLED) -> "VectorStore":
+        """
+        Load a read-only vector store persisted with save().
+
+        With mmap, the vectors and metadata are memory-mapped instead of
+        copied, so worker processes opening the same files share one
+        copy through the OS page cache.
+
+        Args:
+            index_path (str): FAISS index file.
+            mmap (bool): Memory-map instead of reading into private memory.
+
+        Returns:
+            VectorStore
+        """
+
+        if mmap:
+            # IO_FLAG_MMAP_IFC maps the flat vector codes in place
+            io_flags: int = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+            index = faiss.read_index(index_path, io_flags)
+        else:
+            index = faiss.read_index(index_path)
+
+        vector_store: VectorStore = cls(index.d, index)
+
+        metadata: MappedMetadata = MappedMetadata(index_path)
+        vector_store.metadata_store = metadata if mmap else list(metadata)
+
+        # Indexes saved before columns existed are indexed on load
+        vector_store.metadata_columns = MetadataColumns.load(
+            index_path
+        ) or MetadataColumns.from_metadata(metadata)
+
+        return vector_store
+
+    def save(self, index_path: str) -> None:
+        """
+        Write the FAISS index and its metadata to disk.
+
+        Args:
+            index_path (str): Destination index file; metadata is written
+                next to it.
+        """
+
+        faiss.write_index(self.index, index_path)
+
+        MappedMetadata.write(index_path, list(self.metadata_store))
+
+        self.metadata_columns.save(index_path)
 
-    def _normalize_vectors(self, vectors: np.ndarray) -> np.ndarray:
+    def _normalize_vectors(self, vectors: Any) -> np.ndarray:
         """
         Normalize vectors to unit length for cosine similarity.
 
+        Float32 C-contiguous arrays are normalized in place; anything
+        else (lists, other dtypes) is converted once first.
+
         Args:
-            vectors (np.ndarray): Input vectors.
+            vectors (Any): (n, dimension) vectors.
 
         Returns:
-            np.ndarray: L2-normalized vectors.
+            np.ndarray: L2-normalized float32 vectors.
         """
 
-        norms: np.ndarray = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors_np: np.ndarray = np.ascontiguousarray(vectors, dtype=np.float32)
 
-        # Prevent division by zero
-        norms[norms == 0] = 1.0
+        if vectors_np.ndim == 1:
+            vectors_np = vectors_np.reshape(1, -1)
 
-        normalized_vectors: np.ndarray = vectors / norms
+        # Zero vectors are left unchanged
+        faiss.normalize_L2(vectors_np)
 
-        return normalized_vectors
+        return vectors_np
 
-    def add_vectors(
-        self, embeddings: List[List[float]], metadata: List[Dict[str, str]]
-    ) -> None:
+    def add_vectors(self, embeddings: Any, metadata: List[Dict[str, str]]) -> None:
         """
         Add embedding vectors and metadata to FAISS index.
 
         Args:
-            embeddings (List[List[float]]): Embedding vectors.
+            embeddings (Any): (n, dimension) float32 matrix (normalized in
+                place) or nested lists.
             metadata (List[Dict[str, str]]): Corresponding metadata.
         """
 
-        vectors_np: np.ndarray = np.array(embeddings).astype("float32")
+        start: float = time.perf_counter()
 
-        normalized_vectors: np.ndarray = self._normalize_vectors(vectors_np)
+        normalized_vectors: np.ndarray = self._normalize_vectors(embeddings)
 
         self.index.add(normalized_vectors)
 
         self.metadata_store.extend(metadata)
+        self.metadata_columns.extend(metadata)
+
+        self._chunk_rows = None
+
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "index"}
+        )
 
     def search(
-        self, query_embedding: List[float], top_k: int = TOP_K_RETRIEVAL
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = TOP_K_RETRIEVAL,
+        where: Optional[Dict[str, Any]] = None,
+        adaptive: bool = ADAPTIVE_SEARCH_ENABLED,
     ) -> List[Tuple[Dict[str, str], float]]:
         """
         Search for most similar chunks.
 
+        Predicates are resolved to an id bitset and applied inside the
+        FAISS search, so a filtered query returns the top_k matching
+        entries rather than whatever survives out of the global top_k.
+
         Args:
-            query_embedding (List[float]): Query embedding vector.
+            query_embedding (np.ndarray): Query embedding vector.
             top_k (int): Number of top results to return.
+            where (Optional[Dict[str, Any]]): field -> required value
+                (e.g. {"field": "carrier"}, {"columns.SKU": "A-1"});
+                all must match.
+            adaptive (bool): Search again with a wider beam
+                (adaptive_ef_search) when the two best results are within
+                adaptive_score_gap.
 
         Returns:
             List[Tuple[Dict[str, str], float]]:
                 List of (metadata, similarity_score).
         """
 
-        query_np: np.ndarray = np.array([query_embedding]).astype("float32")
+        # Copy: the caller's query embedding is reused (e.g. answer cache)
+        normalized_query: np.ndarray = self._normalize_vectors(
+            np.array(query_embedding, dtype=np.float32, ndmin=2)
+        )
+
+        start: float = time.perf_counter()
+
+        if where:
+            results: List[Tuple[Dict[str, str], float]] = self._filtered_search(
+                normalized_query, top_k, where
+            )
+        else:
+            results = self._approximate_search(normalized_query, top_k, adaptive)
+
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "search"}
+        )
+
+        return results
+
+    def _approximate_search(
+        self, normalized_query: np.ndarray, top_k: int, adaptive: bool
+    ) -> List[Tuple[Dict[str, str], float]]:
+        """
+        Unfiltered HNSW search, widened for ambiguous queries.
+
+        Args:
+            normalized_query (np.ndarray): (1, dimension) normalized query.
+            top_k (int): Number of top results to return.
+            adaptive (bool): Search again with adaptive_ef_search when the
+                two best chunks are within adaptive_score_gap.
+
+        Returns:
+            List[Tuple[Dict[str, str], float]]
+        """
+
+        if not adaptive:
+            similarity_scores, indices = self.index.search(normalized_query, top_k)
+
+            return self._results(indices[0], similarity_scores[0])
+
+        # Enough rows to reach a second chunk past the best chunk's own
+        # question entries (k is well below efSearch, so this is cheap)
+        similarity_scores, indices = self.index.search(
+            normalized_query, max(top_k, 2 * SEARCH_OVERFETCH_FACTOR)
+        )
+
+        if self._is_ambiguous(indices[0], similarity_scores[0]):
+            METRICS.increment(
+                "adaptive_search_escalations_total", labels={"kind": "ef_search"}
+            )
+
+            # Per-query beam width; the index default is left untouched
+            similarity_scores, indices = self.index.search(
+                normalized_query,
+                top_k,
+                params=faiss.SearchParametersHNSW(
+                    efSearch=max(self.adaptive_ef_search, top_k)
+                ),
+            )
+
+        return self._results(indices[0][:top_k], similarity_scores[0][:top_k])
+
+    def _is_ambiguous(self, indices: np.ndarray, similarity_scores: np.ndarray) -> bool:
+        """
+        Whether the query has no decisive best match: its two best
+        distinct chunks are within adaptive_score_gap, so the approximate
+        search may have ordered (or missed) near-ties.
+
+        Rows are grouped by chunk_id, as in Retriever._cut_off: a chunk's
+        field entry and its own synthetic questions are not rivals.
+
+        Args:
+            indices (np.ndarray): Index rows, best first.
+            similarity_scores (np.ndarray): Their scores.
+
+        Returns:
+            bool
+        """
+
+        best_chunk_id: Optional[str] = None
+
+        for idx, score in zip(indices, similarity_scores):
+            # FAISS pads with -1 when fewer vectors exist
+            if not 0 <= idx < len(self.metadata_store):
+                break
+
+            chunk_id: Optional[str] = self.metadata_store[idx].get("chunk_id", idx)
+
+            if best_chunk_id is None:
+                best_chunk_id = chunk_id
+                best_score: float = float(score)
+            elif chunk_id != best_chunk_id:
+                return best_score - float(score) < self.adaptive_score_gap
+
+        # A lone chunk among the results counts as decisive
+        return False
+
+    def _filtered_search(
+        self, normalized_query: np.ndarray, top_k: int, where: Dict[str, Any]
+    ) -> List[Tuple[Dict[str, str], float]]:
+        """
+        Search restricted to entries matching where.
+
+        Small matching sets are scored exactly (HNSW graph walks degrade
+        when most neighbours are filtered out); larger ones are searched
+        through the graph with an IDSelectorBitmap.
+
+        Args:
+            normalized_query (np.ndarray): (1, dimension) normalized query.
+            top_k (int): Number of top results to return.
+            where (Dict[str, Any]): Predicates.
+
+        Returns:
+            List[Tuple[Dict[str, str], float]]
+        """
+
+        bitset: np.ndarray = self.metadata_columns.bitset(where)
+        match_count: int = bitset_count(bitset)
+
+        if match_count == 0:
+            return []
+
+        if match_count <= max(top_k, FILTERED_EXACT_SEARCH_MAX_ROWS):
+            rows: np.ndarray = bitset_rows(bitset, self.index.ntotal)
+
+            similarity_scores: np.ndarray = (
+                self.index.reconstruct_batch(rows) @ normalized_query[0]
+            )
 
-        normalized_query: np.ndarray = self._normalize_vectors(query_np)
+            best: np.ndarray = np.argsort(-similarity_scores)[:top_k]
 
-        similarity_scores, indices = self.index.search(normalized_query, top_k)
+            return self._results(rows[best], similarity_scores[best])
+
+        # The bitmap must outlive the search call
+        selector = faiss.IDSelectorBitmap(self.index.ntotal, faiss.swig_ptr(bitset))
+
+        params = faiss.SearchParametersHNSW(
+            sel=selector, efSearch=max(self.index.hnsw.efSearch, top_k)
+        )
+
+        similarity_scores, indices = self.index.search(
+            normalized_query, top_k, params=params
+        )
+
+        return self._results(indices[0], similarity_scores[0])
+
+    def _results(
+        self, indices: np.ndarray, similarity_scores: np.ndarray
+    ) -> List[Tuple[Dict[str, str], float]]:
+        """
+        Pair result rows with their metadata.
+
+        Args:
+            indices (np.ndarray): Index rows, best first.
+            similarity_scores (np.ndarray): Their scores.
+
+        Returns:
+            List[Tuple[Dict[str, str], float]]
+        """
 
         results: List[Tuple[Dict[str, str], float]] = []
 
-        for idx, score in zip(indices[0], similarity_scores[0]):
-            if idx < len(self.metadata_store):
+        for idx, score in zip(indices, similarity_scores):
+            # FAISS pads with -1 when fewer than top_k vectors exist
+            if 0 <= idx < len(self.metadata_store):
                 results.append((self.metadata_store[idx], float(score)))
 
         return results
+
+    def chunk_vectors(self, chunk_ids: List[str]) -> np.ndarray:
+        """
+        Stored (normalized) content vectors of chunks.
+
+        Vectors are reconstructed from the index rather than embedded
+        again; synthetic question entries are skipped, so each chunk
+        maps to the embedding of its own content.
+
+        Args:
+            chunk_ids (List[str]): Chunk identifiers; unknown ids are skipped.
+
+        Returns:
+            np.ndarray: (n, embedding_dimension) float32 matrix.
+        """
+
+        if self._chunk_rows is None:
+            chunk_rows: Dict[str, int] = {}
+
+            for row, metadata in enumerate(self.metadata_store):
+                if "question" not in metadata:
+                    chunk_rows.setdefault(metadata.get("chunk_id"), row)
+
+            self._chunk_rows = chunk_rows
+
+        rows: List[int] = [
+            self._chunk_rows[chunk_id]
+            for chunk_id in chunk_ids
+            if chunk_id in self._chunk_rows
+        ]
+
+        if not rows:
+            return np.zeros((0, self.embedding_dimension), dtype=np.float32)
+
+        return self.index.reconstruct_batch(np.array(rows, dtype=np.int64))
@@ -0,0 +1,124 @@
+"""
+Window Chunker Module
+
+Splits raw document text into overlapping windows so that content
+outside the structured fields (line items, accessorial charges,
+special instructions, ...) is searchable too.
+
+Windows never cross a page boundary and carry their page number
+and character offsets in the document text.
+"""
+
+from typing import Dict, Any, Iterator, List
+import re
+from src.config.settings import (
+    WINDOW_CHUNK_TOKENS,
+    WINDOW_OVERLAP_TOKENS,
+    CHARS_PER_TOKEN,
+)
+from src.core.data.document_processor import PAGE_SEPARATOR
+
+WORD_PATTERN: re.Pattern = re.compile(r"\S+")
+
+
+class SlidingWindowChunker:
+    """
+    Generates overlapping raw-text windows page by page.
+    """
+
+    def __init__(
+        self,
+        window_tokens: int = WINDOW_CHUNK_TOKENS,
+        overlap_tokens: int = WINDOW_OVERLAP_TOKENS,
+    ) -> None:
+        """
+        Initialize SlidingWindowChunker.
+
+        Args:
+            window_tokens (int): Estimated tokens per window.
+            overlap_tokens (int): Estimated tokens shared by consecutive windows.
+        """
+
+        self.window_chars: int = int(window_tokens * CHARS_PER_TOKEN)
+        self.step_chars: int = max(
+            1, int((window_tokens - overlap_tokens) * CHARS_PER_TOKEN)
+        )
+
+    def chunk_text(self, document_text: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield windows of the document, one page at a time.
+
+        Args:
+            document_text (str): Extracted text, pages separated by
+                PAGE_SEPARATOR.
+
+        Yields:
+            Dict[str, Any]: chunk_id, content, page (1-based) and
+                start/end character offsets in document_text.
+        """
+
+        window_number: int = 0
+        page_offset: int = 0
+
+        for page_number, page_text in enumerate(
+            document_text.split(PAGE_SEPARATOR), start=1
+        ):
+            for start, end, content in self._page_windows(page_text):
+                yield {
+                    "chunk_id": f"w{window_number}",
+                    "content": content,
+                    "page": page_number,
+                    "start": page_offset + start,
+                    "end": page_offset + end,
+                }
+
+                window_number += 1
+
+            page_offset += len(page_text) + len(PAGE_SEPARATOR)
+
+    def _page_windows(self, page_text: str) -> Iterator[tuple]:
+        """
+        Windows of one page, cut at word boundaries.
+
+        Args:
+            page_text (str)
+
+        Yields:
+            tuple: (start, end, whitespace-normalized content)
+        """
+
+        words: List[re.Match] = list(WORD_PATTERN.finditer(page_text))
+
+        first: int = 0
+
+        while first < len(words):
+            window_start: int = words[first].start()
+
+            # Extend while the window fits (always at least one word)
+            last: int = first
+
+            while (
+                last + 1 < len(words)
+                and words[last + 1].end() - window_start <= self.window_chars
+            ):
+                last += 1
+
+            yield (
+                window_start,
+                words[last].end(),
+                " ".join(match.group() for match in words[first : last + 1]),
+            )
+
+            if last == len(words) - 1:
+                break
+
+            # Next window starts step_chars later, overlapping this one
+            next_first: int = first + 1
+
+            while (
+                next_first < last
+                and words[next_first].start() - window_start < self.step_chars
+            ):
+                next_first += 1
+
+            first = next_first
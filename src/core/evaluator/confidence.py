@@ -5,11 +5,18 @@ Implements heuristic confidence scoring based on:
 - Retrieval similarity
 - Chunk agreement
 - Answer grounding coverage
+- Optionally, embedding similarity between the answer and the
+  retrieved chunks' stored vectors
 """
 
-from typing import List, Dict
-import re
-from src.config.settings import SIMILARITY_THRESHOLD
+from typing import List, Dict, Optional, Set
+import time
+import numpy as np
+from src.config.settings import SIMILARITY_THRESHOLD, GROUNDING_SCORE_WEIGHT
+from src.core.data.vector_store import VectorStore
+from src.core.data.token_index import ChunkTokenIndex, coverage_ratio
+from src.core.data.tokenizer import tokenize
+from src.core.state.metrics import METRICS
 
 
 class ConfidenceScorer:
@@ -17,17 +24,31 @@ class ConfidenceScorer:
     Computes confidence score for generated answers.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        token_index: Optional[ChunkTokenIndex] = None,
+        vector_store: Optional[VectorStore] = None,
+    ) -> None:
         """
         Initialize ConfidenceScorer.
+
+        Args:
+            token_index (Optional[ChunkTokenIndex]): Token index of the
+                document's chunks; without it, retrieved chunk text is
+                tokenized on every call.
+            vector_store (Optional[VectorStore]): Index holding the chunk
+                vectors, required for embedding grounding.
         """
-        pass
+
+        self.token_index: Optional[ChunkTokenIndex] = token_index
+        self.vector_store: Optional[VectorStore] = vector_store
 
     def compute_confidence(
         self,
         answer: str,
         retrieved_chunks: List[Dict[str, str]],
         max_similarity_score: float,
+        answer_embedding: Optional[np.ndarray] = None,
     ) -> float:
         """
         Compute overall confidence score.
@@ -36,11 +57,16 @@ class ConfidenceScorer:
             answer (str): Generated answer text.
             retrieved_chunks (List[Dict[str, str]]): Retrieved chunks used for context.
             max_similarity_score (float): Highest similarity score.
+            answer_embedding (Optional[np.ndarray]): Embedding of the answer;
+                when given (and a vector store is set), embedding grounding
+                is blended into the score.
 
         Returns:
             float: Confidence score between 0 and 1.
         """
 
+        start: float = time.perf_counter()
+
         retrieval_score: float = self._compute_retrieval_score(max_similarity_score)
 
         agreement_score: float = self._compute_chunk_agreement_score(retrieved_chunks)
@@ -54,9 +80,22 @@ class ConfidenceScorer:
             0.5 * retrieval_score + 0.3 * agreement_score + 0.2 * coverage_score
         )
 
+        if answer_embedding is not None and self.vector_store is not None:
+            grounding_score: float = self.compute_grounding_score(
+                answer_embedding, retrieved_chunks
+            )
+
+            final_score = (
+                1.0 - GROUNDING_SCORE_WEIGHT
+            ) * final_score + GROUNDING_SCORE_WEIGHT * grounding_score
+
         # Ensure score bounded between 0 and 1
         final_score = max(0.0, min(1.0, final_score))
 
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "score"}
+        )
+
         return final_score
 
     def _compute_retrieval_score(self, max_similarity_score: float) -> float:
@@ -98,35 +137,86 @@ class ConfidenceScorer:
 
         return normalized_score
 
-    def _compute_answer_coverage_score(
-        self, answer: str, retrieved_chunks: List[Dict[str, str]]
+    def compute_grounding_score(
+        self, answer_embedding: np.ndarray, retrieved_chunks: List[Dict[str, str]]
     ) -> float:
         """
-        Compute coverage score based on how much of answer
-        overlaps with retrieved chunk text.
+        Highest cosine similarity between the answer and the retrieved
+        chunks, using the vectors already stored in the index.
 
         Args:
-            answer (str): Generated answer.
+            answer_embedding (np.ndarray): Embedding of the answer.
             retrieved_chunks (List[Dict[str, str]]): Retrieved chunks.
 
         Returns:
-            float: Coverage score between 0 and 1.
+            float: Grounding score between 0 and 1 (0 below the
+                retrieval similarity threshold).
         """
 
-        if not answer:
+        chunk_vectors: np.ndarray = self.vector_store.chunk_vectors(
+            [chunk.get("chunk_id") for chunk in retrieved_chunks]
+        )
+
+        if len(chunk_vectors) == 0:
             return 0.0
 
-        combined_context: str = " ".join(
-            chunk.get("content", "") for chunk in retrieved_chunks
-        ).lower()
+        answer_vector: np.ndarray = np.asarray(answer_embedding, dtype=np.float32)
 
-        answer_words: List[str] = re.findall(r"\w+", answer.lower())
+        norm: float = float(np.linalg.norm(answer_vector))
 
-        if not answer_words:
+        if norm == 0:
             return 0.0
 
-        matched_words: int = sum(1 for word in answer_words if word in combined_context)
+        # Stored vectors are unit length: one matrix-vector product
+        similarity: float = float(np.max(chunk_vectors @ (answer_vector / norm)))
+
+        if similarity < SIMILARITY_THRESHOLD:
+            return 0.0
+
+        return min(similarity, 1.0)
+
+    def compute_coverage_scores(
+        self, answers: List[str], retrieved_chunks: List[Dict[str, str]]
+    ) -> List[float]:
+        """
+        Answer coverage of several answers against the same chunks.
+
+        Args:
+            answers (List[str]): Candidate answers.
+            retrieved_chunks (List[Dict[str, str]]): Retrieved chunks.
+
+        Returns:
+            List[float]: Coverage score per answer, between 0 and 1.
+        """
+
+        if self.token_index is not None:
+            return self.token_index.coverage_batch(
+                answers, [chunk.get("chunk_id") for chunk in retrieved_chunks]
+            )
+
+        context_tokens: Set[str] = set()
 
-        coverage_ratio: float = matched_words / len(answer_words)
+        for chunk in retrieved_chunks:
+            context_tokens.update(tokenize(chunk.get("content", "")))
+
+        return [coverage_ratio(tokenize(answer), context_tokens) for answer in answers]
+
+    def _compute_answer_coverage_score(
+        self, answer: str, retrieved_chunks: List[Dict[str, str]]
+    ) -> float:
+        """
+        Compute coverage score based on how many answer words
+        appear in retrieved chunk text.
+
+        Args:
+            answer (str): Generated answer.
+            retrieved_chunks (List[Dict[str, str]]): Retrieved chunks.
+
+        Returns:
+            float: Coverage score between 0 and 1.
+        """
+
+        if not answer:
+            return 0.0
 
-        return coverage_ratio
+        return self.compute_coverage_scores([answer], retrieved_chunks)[0]
@@ -1,11 +1,61 @@
 """
 Guardrails Module
 
-Implements hallucination prevention and answer validation logic.
+Implements hallucination prevention and answer validation logic,
+plus a local out-of-domain prefilter run before any API call.
 """
 
-from typing import List, Dict
-from src.config.settings import SIMILARITY_THRESHOLD, MIN_CONFIDENCE_SCORE
+from typing import List, Dict, Set, FrozenSet
+from src.config.settings import (
+    SIMILARITY_THRESHOLD,
+    MIN_CONFIDENCE_SCORE,
+    OOD_MIN_CONTENT_TOKENS,
+)
+from src.core.data.chunker import StructureAwareChunker
+from src.core.data.prompt_reducer import PromptReducer
+from src.core.data.schemas import ShipmentDetailsModel
+from src.core.data.tokenizer import tokenize, content_tokens
+
+# Logistics terms not covered by the extraction keywords and schema
+LOGISTICS_TERMS: Set[str] = set("""
+    address bill cargo charge charges commodity contact cost date dispatch
+    eta fee freight goods hazmat instructions invoice location lading
+    number pallet pallets pay payment phone pieces price quantity seal
+    temperature time truck
+    """.split())
+
+# Follow-up and document-level words valid for any document
+CONVERSATIONAL_TERMS: Set[str] = set("""
+    again answer before document details detail else earlier explain
+    field fields file first info information last mentioned more one other
+    page pdf previous same second summarize summary value values
+    """.split())
+
+
+def _build_domain_lexicon() -> FrozenSet[str]:
+    """
+    Tokens of the logistics keywords, schema fields (names and
+    descriptions) and field aliases, plus the extra term lists.
+
+    Returns:
+        FrozenSet[str]
+    """
+
+    texts: List[str] = list(PromptReducer.LOGISTICS_KEYWORDS)
+
+    for field_name, field_info in ShipmentDetailsModel.model_fields.items():
+        texts.append(field_name.replace("_", " "))
+        texts.append(field_info.description or "")
+
+    for aliases in StructureAwareChunker.FIELD_ALIASES.values():
+        texts.extend(aliases)
+
+    lexicon: Set[str] = {token for text in texts for token in tokenize(text)}
+
+    return frozenset(lexicon | LOGISTICS_TERMS | CONVERSATIONAL_TERMS)
+
+
+DOMAIN_LEXICON: FrozenSet[str] = _build_domain_lexicon()
 
 
 class Guardrails:
@@ -20,6 +70,42 @@ class Guardrails:
         """
         pass
 
+    def validate_query_domain(
+        self, query: str, document_vocabulary: FrozenSet[str] = frozenset()
+    ) -> Dict[str, str]:
+        """
+        Reject clearly out-of-domain questions without any API call.
+
+        A question is rejected when it has enough content words and none
+        of them is a logistics term or a word of the uploaded document.
+
+        Args:
+            query (str): User question.
+            document_vocabulary (FrozenSet[str]): Words of the document.
+
+        Returns:
+            Dict[str, str]:
+                - status: "allow" or "reject"
+                - message: Explanation if rejected
+        """
+
+        query_tokens: Set[str] = content_tokens(query)
+
+        if len(query_tokens) < OOD_MIN_CONTENT_TOKENS:
+            return {"status": "allow", "message": "Query too short to classify."}
+
+        for token in query_tokens:
+            # Also try the singular of plural words ("shipments")
+            candidates: Set[str] = {token, token[:-1] if token.endswith("s") else token}
+
+            if candidates & DOMAIN_LEXICON or candidates & document_vocabulary:
+                return {"status": "allow", "message": "Query in domain."}
+
+        return {
+            "status": "reject",
+            "message": "The question does not appear to relate to the document.",
+        }
+
     def validate_retrieval(
         self, retrieved_chunks: List[Dict[str, str]], max_similarity_score: float
     ) -> Dict[str, str]:
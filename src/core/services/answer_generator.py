@@ -4,12 +4,35 @@ Answer Generator Module
 Generates grounded conversational answers using:
 - Retrieved document chunks
 - Short-term conversational memory
+
+Prompts are laid out stable-first (system prompt, full structured
+document context, history, question) so provider-side prompt caching
+can reuse the shared prefix across turns.
+
+Answers go through a model cascade: cheaper models are tried first
+and the answer escalates to the next tier only on low confidence.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Any, Optional, Tuple
+import logging
+import time
 from openai import OpenAI
-from src.config.settings import MAIN_LLM_MODEL
+from src.config.settings import (
+    MAIN_LLM_MODEL,
+    CASCADE_ENABLED,
+    CASCADE_MODELS,
+    CASCADE_ESCALATION_THRESHOLD,
+)
+from src.core.evaluator.confidence import ConfidenceScorer
+from src.core.data.token_index import ChunkTokenIndex
+from src.core.evaluator.guardrails import Guardrails
+from src.core.services.llm_client import ResilientLLMClient
 from src.core.state.memory_manager import MemoryManager
+from src.core.state.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND_ANSWER: str = "Not found in document."
 
 
 class AnswerGenerator:
@@ -17,79 +40,195 @@ class AnswerGenerator:
     Generates grounded conversational answers from retrieved context.
     """
 
-    def __init__(self, api_key: str, memory_manager: MemoryManager) -> None:
+    SYSTEM_PROMPT: str = """
+        You are a logistics document assistant.
+
+        Answer the question ONLY using:
+        1. The document context
+        2. Relevant prior conversation (if needed)
+
+        Rules:
+        - Do NOT use outside knowledge.
+        - If answer is not present in document context, say:
+        "Not found in document."
+        - Be concise and factual.
+        """
+
+    def __init__(
+        self,
+        api_key: str,
+        memory_manager: MemoryManager,
+        document_context: str = "",
+        token_index: Optional[ChunkTokenIndex] = None,
+    ) -> None:
         """
         Initialize AnswerGenerator.
 
         Args:
             api_key (str): OpenAI API key.
             memory_manager (MemoryManager): STM manager.
+            document_context (str): Full structured context of the document,
+                identical across turns.
+            token_index (Optional[ChunkTokenIndex]): Chunk token index used
+                to score cascade answers.
         """
 
         self.client: OpenAI = OpenAI(api_key=api_key)
 
+        self.llm_client: ResilientLLMClient = ResilientLLMClient(self.client)
+
         self.memory_manager: MemoryManager = memory_manager
 
+        self.document_context: str = document_context
+
+        self.confidence_scorer: ConfidenceScorer = ConfidenceScorer(token_index)
+
     def generate_answer(
-        self, query: str, retrieved_chunks: List[Dict[str, str]]
-    ) -> Dict[str, str]:
+        self,
+        query: str,
+        retrieved_chunks: List[Dict[str, str]],
+        max_similarity_score: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Generate conversational grounded answer.
 
         Args:
             query (str): User question.
             retrieved_chunks (List[Dict[str, str]]): Retrieved chunks.
+            max_similarity_score (Optional[float]): Highest retrieval
+                similarity; enables the model cascade when given.
 
         Returns:
-            Dict[str, str]:
+            Dict[str, Any]:
                 - answer
                 - sources
+                - model: Model that produced the answer
+                - usage: prompt, cached and completion token counts
         """
 
+        start: float = time.perf_counter()
+
         context_text: str = self._build_context(retrieved_chunks)
 
-        memory_context: str = self.memory_manager.get_memory_context()
+        memory_context: str = self.memory_manager.get_memory_context(query)
 
-        system_prompt: str = """
-        You are a logistics document assistant.
+        messages: List[Dict[str, str]] = self._build_messages(
+            query, context_text, memory_context
+        )
 
-        Answer the question ONLY using:
-        1. The document context
-        2. Relevant prior conversation (if needed)
+        models: List[str] = (
+            CASCADE_MODELS
+            if CASCADE_ENABLED and max_similarity_score is not None
+            else [MAIN_LLM_MODEL]
+        )
 
-        Rules:
-        - Do NOT use outside knowledge.
-        - If answer is not present in document context, say:
-        "Not found in document."
-        - Be concise and factual.
-        """
+        if len(models) > 1:
+            METRICS.increment("cascade_requests_total")
 
-        user_prompt: str = f"""
-        Conversation History:
-        {memory_context}
+        for tier, model in enumerate(models):
+            answer, usage = self._complete(model, messages)
 
-        Document Context:
-        {context_text}
+            if tier == len(models) - 1:
+                break
 
-        Current Question:
-        {query}
+            if self._accept_tier_answer(answer, retrieved_chunks, max_similarity_score):
+                break
+
+            METRICS.increment("cascade_escalations_total", labels={"model": model})
+
+            logger.info("Cascade escalating from %s (low confidence)", model)
+
+        # Add to memory AFTER generation
+        self.memory_manager.add_interaction(query, answer)
+
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "generate"}
+        )
+
+        return {
+            "answer": answer,
+            "sources": context_text,
+            "model": model,
+            "usage": usage,
+        }
+
+    def _complete(
+        self, model: str, messages: List[Dict[str, str]]
+    ) -> Tuple[str, Dict[str, int]]:
         """
+        Run one chat completion and record its latency and token usage.
+
+        Args:
+            model (str): Model name.
+            messages (List[Dict[str, str]]): Chat messages.
+
+        Returns:
+            Tuple[str, Dict[str, int]]: Answer text and token usage.
+        """
+
+        start: float = time.perf_counter()
 
-        response = self.client.chat.completions.create(
-            model=MAIN_LLM_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+        response = self.llm_client.create_chat_completion(
+            model=model,
+            messages=messages,
             temperature=0,
         )
 
+        elapsed: float = time.perf_counter() - start
+
         answer: str = response.choices[0].message.content.strip()
 
-        # Add to memory AFTER generation
-        self.memory_manager.add_interaction(query, answer)
+        usage: Dict[str, int] = self._extract_usage(response)
+
+        METRICS.observe("llm_completion_seconds", elapsed, {"model": model})
+        METRICS.increment(
+            "llm_prompt_tokens_total", usage["prompt_tokens"], {"purpose": "answer"}
+        )
+        METRICS.increment(
+            "llm_cached_prompt_tokens_total",
+            usage["cached_tokens"],
+            {"purpose": "answer"},
+        )
+        METRICS.increment(
+            "llm_completion_tokens_total",
+            usage["completion_tokens"],
+            {"purpose": "answer"},
+        )
 
-        return {"answer": answer, "sources": context_text}
+        logger.info("Completion with %s took %.3fs", model, elapsed)
+
+        return answer, usage
+
+    def _accept_tier_answer(
+        self,
+        answer: str,
+        retrieved_chunks: List[Dict[str, str]],
+        max_similarity_score: float,
+    ) -> bool:
+        """
+        Decide whether a non-final cascade tier's answer is good enough.
+
+        Args:
+            answer (str): Tier answer.
+            retrieved_chunks (List[Dict[str, str]]): Retrieved chunks.
+            max_similarity_score (float): Highest retrieval similarity.
+
+        Returns:
+            bool: True to accept, False to escalate.
+        """
+
+        # A stronger model may still find what a cheaper one missed
+        if answer.startswith(NOT_FOUND_ANSWER.rstrip(".")):
+            return False
+
+        confidence_score: float = self.confidence_scorer.compute_confidence(
+            answer, retrieved_chunks, max_similarity_score
+        )
+
+        if Guardrails().validate_confidence(confidence_score).get("status") != "allow":
+            return False
+
+        return confidence_score >= CASCADE_ESCALATION_THRESHOLD
 
     def _build_context(self, retrieved_chunks: List[Dict[str, str]]) -> str:
         """
@@ -108,3 +247,70 @@ class AnswerGenerator:
             context_parts.append(chunk.get("content", ""))
 
         return "\n\n".join(context_parts)
+
+    def _build_messages(
+        self, query: str, context_text: str, memory_context: str
+    ) -> List[Dict[str, str]]:
+        """
+        Assemble chat messages, most stable content first.
+
+        Args:
+            query (str): User question.
+            context_text (str): Retrieved chunk context.
+            memory_context (str): Conversation history.
+
+        Returns:
+            List[Dict[str, str]]: Chat messages.
+        """
+
+        messages: List[Dict[str, str]] = [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+        ]
+
+        # Identical for every question on this document
+        if self.document_context:
+            messages.append(
+                {
+                    "role": "user",
+                    "content": f"Document Structured Context:\n{self.document_context}",
+                }
+            )
+
+        user_prompt: str = f"""
+        Conversation History:
+        {memory_context}
+
+        Retrieved Document Context:
+        {context_text}
+
+        Current Question:
+        {query}
+        """
+
+        messages.append({"role": "user", "content": user_prompt})
+
+        return messages
+
+    def _extract_usage(self, response: Any) -> Dict[str, int]:
+        """
+        Read token usage, including provider-cached prompt tokens.
+
+        Args:
+            response (Any): Chat completion response.
+
+        Returns:
+            Dict[str, int]: prompt_tokens, cached_tokens, completion_tokens.
+        """
+
+        usage = getattr(response, "usage", None)
+
+        if usage is None:
+            return {"prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+
+        return {
+            "prompt_tokens": usage.prompt_tokens or 0,
+            "cached_tokens": getattr(prompt_details, "cached_tokens", 0) or 0,
+            "completion_tokens": usage.completion_tokens or 0,
+        }
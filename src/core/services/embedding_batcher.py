@@ -0,0 +1,160 @@
+"""
+Embedding Batcher Module
+
+Embeds large inputs by packing texts into requests within the API's
+input-count and token limits, running the requests concurrently and
+reassembling the results in input order.
+
+Requests run at bulk priority, so interactive embeddings made with the
+same API key are served first by its rate limiter.
+"""
+
+from typing import List, Iterable, Iterator, Callable, Tuple, TypeVar, Deque
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+import numpy as np
+from src.config.settings import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_BATCH_TOKENS,
+    EMBEDDING_MAX_CONCURRENCY,
+)
+from src.core.data.token_estimator import estimate_tokens
+from src.core.services.embedding_service import EmbeddingService
+from src.core.services.rate_limiter import PRIORITY_BULK
+
+Item = TypeVar("Item")
+
+# Shared by all ingests, bounding embedding requests in flight
+_EMBEDDING_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=EMBEDDING_MAX_CONCURRENCY, thread_name_prefix="embedding"
+)
+
+
+def pack_batches(
+    items: Iterable[Item],
+    text_of: Callable[[Item], str],
+    max_inputs: int = EMBEDDING_BATCH_SIZE,
+    max_tokens: int = EMBEDDING_MAX_BATCH_TOKENS,
+) -> Iterator[List[Item]]:
+    """
+    Group items into request-sized batches, lazily and in order.
+
+    Args:
+        items (Iterable[Item]): Items to embed.
+        text_of (Callable[[Item], str]): Text embedded for an item.
+        max_inputs (int): Inputs per request.
+        max_tokens (int): Estimated tokens per request.
+
+    Yields:
+        List[Item]: Non-empty batches.
+    """
+
+    batch: List[Item] = []
+    batch_tokens: int = 0
+
+    for item in items:
+        item_tokens: int = estimate_tokens(text_of(item))
+
+        if batch and (
+            len(batch) >= max_inputs or batch_tokens + item_tokens > max_tokens
+        ):
+            yield batch
+
+            batch, batch_tokens = [], 0
+
+        batch.append(item)
+        batch_tokens += item_tokens
+
+    if batch:
+        yield batch
+
+
+class EmbeddingBatcher:
+    """
+    Concurrent, order-preserving embedding of many texts.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize EmbeddingBatcher.
+
+        Args:
+            embedding_service (EmbeddingService): Service making the requests.
+            max_concurrency (int): Requests in flight for this batcher.
+        """
+
+        self.embedding_service: EmbeddingService = embedding_service
+        self.max_concurrency: int = max(1, max_concurrency)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed any number of texts.
+
+        Args:
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: (len(texts), dimension) float32 matrix, in input order.
+        """
+
+        embeddings: np.ndarray = None
+        position: int = 0
+
+        for batch, batch_embeddings in self.embed_stream(texts, str):
+            # Dimension is known once the first batch is embedded
+            if embeddings is None:
+                embeddings = np.empty(
+                    (len(texts), batch_embeddings.shape[1]), dtype=np.float32
+                )
+
+            embeddings[position : position + len(batch)] = batch_embeddings
+            position += len(batch)
+
+        if embeddings is None:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        return embeddings
+
+    def embed_stream(
+        self, items: Iterable[Item], text_of: Callable[[Item], str]
+    ) -> Iterator[Tuple[List[Item], np.ndarray]]:
+        """
+        Embed items batch by batch as they are produced, with up to
+        max_concurrency requests in flight.
+
+        Args:
+            items (Iterable[Item]): Items to embed (consumed lazily).
+            text_of (Callable[[Item], str]): Text embedded for an item.
+
+        Yields:
+            Tuple[List[Item], np.ndarray]: Each batch with its embeddings,
+                in input order.
+        """
+
+        in_flight: Deque[Tuple[List[Item], Future]] = deque()
+
+        for batch in pack_batches(items, text_of):
+            in_flight.append(
+                (
+                    batch,
+                    _EMBEDDING_EXECUTOR.submit(
+                        self.embedding_service.generate_embeddings_array,
+                        [text_of(item) for item in batch],
+                        None,
+                        PRIORITY_BULK,
+                    ),
+                )
+            )
+
+            # Oldest first, so results come back in input order
+            if len(in_flight) >= self.max_concurrency:
+                done_batch, future = in_flight.popleft()
+                yield done_batch, future.result()
+
+        while in_flight:
+            done_batch, future = in_flight.popleft()
+            yield done_batch, future.result()
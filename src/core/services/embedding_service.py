@@ -2,11 +2,28 @@
 Embedding Service Module
 
 Handles embedding generation using OpenAI embedding models.
+
+Embeddings are requested base64-encoded and decoded straight into
+float32 arrays instead of being parsed into Python float lists.
+Requests are rate limited per API key.
 """
 
-from typing import List
+from typing import List, Optional
+import base64
+import time
+import numpy as np
 from openai import OpenAI
 from src.config.settings import EMBEDDING_MODEL_NAME
+from src.core.data.token_estimator import estimate_tokens
+from src.core.services.rate_limiter import (
+    RateLimiter,
+    rate_limiter_for,
+    PRIORITY_INTERACTIVE,
+)
+from src.core.state.metrics import METRICS
+
+# Wire format of base64 embeddings: little-endian float32
+EMBEDDING_DTYPE: np.dtype = np.dtype("<f4")
 
 
 class EmbeddingService:
@@ -25,7 +42,10 @@ class EmbeddingService:
 
         self.client: OpenAI = OpenAI(api_key=api_key)
 
-    def generate_embedding(self, text: str) -> List[float]:
+        # Shared by every service using the same key
+        self.rate_limiter: RateLimiter = rate_limiter_for(api_key)
+
+    def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding vector for a single text input.
 
@@ -33,32 +53,65 @@ class EmbeddingService:
             text (str): Input text.
 
         Returns:
-            List[float]: Embedding vector.
+            np.ndarray: float32 embedding vector.
         """
 
-        response = self.client.embeddings.create(model=EMBEDDING_MODEL_NAME, input=text)
-
-        embedding_vector: List[float] = response.data[0].embedding
+        return self.generate_embeddings_array([text])[0]
 
-        return embedding_vector
-
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings_array(
+        self,
+        texts: List[str],
+        out: Optional[np.ndarray] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> np.ndarray:
         """
-        Generate embeddings for multiple texts in batch.
+        Generate embeddings for one request's worth of texts as a
+        float32 matrix (see EmbeddingBatcher for larger inputs).
 
         Args:
             texts (List[str]): List of text inputs.
+            out (Optional[np.ndarray]): Preallocated (len(texts), dimension)
+                float32 matrix to decode into; allocated when omitted.
+            priority (int): Rate-limit priority (PRIORITY_INTERACTIVE
+                or PRIORITY_BULK).
 
         Returns:
-            List[List[float]]: List of embedding vectors.
+            np.ndarray: (len(texts), dimension) C-contiguous float32 matrix.
         """
 
+        wait_start: float = time.perf_counter()
+
+        self.rate_limiter.acquire(
+            sum(estimate_tokens(text) for text in texts), priority
+        )
+
+        start: float = time.perf_counter()
+
+        METRICS.observe("embedding_rate_limit_wait_seconds", start - wait_start)
+
         response = self.client.embeddings.create(
-            model=EMBEDDING_MODEL_NAME, input=texts
+            model=EMBEDDING_MODEL_NAME, input=texts, encoding_format="base64"
+        )
+
+        METRICS.observe(
+            "stage_duration_seconds", time.perf_counter() - start, {"stage": "embed"}
         )
+        METRICS.increment("embedding_inputs_total", len(texts))
+
+        usage = getattr(response, "usage", None)
+
+        if usage is not None:
+            METRICS.increment("embedding_tokens_total", usage.prompt_tokens or 0)
+
+        for position, item in enumerate(response.data):
+            vector: np.ndarray = np.frombuffer(
+                base64.b64decode(item.embedding), dtype=EMBEDDING_DTYPE
+            )
+
+            # Dimension is known once the first vector is decoded
+            if out is None:
+                out = np.empty((len(texts), vector.shape[0]), dtype=np.float32)
 
-        embedding_vectors: List[List[float]] = [
-            item.embedding for item in response.data
-        ]
+            out[position] = vector
 
-        return embedding_vectors
+        return out
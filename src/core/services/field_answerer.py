@@ -0,0 +1,115 @@
+"""
+Field Answerer Module
+
+Deterministic fast path that answers single-field questions
+directly from structured field chunks, without an LLM call.
+"""
+
+from typing import List, Dict, Any, Optional
+import heapq
+from src.config.settings import (
+    FAST_PATH_MIN_SIMILARITY,
+    FAST_PATH_MIN_MARGIN,
+    SIMILARITY_THRESHOLD,
+)
+from src.core.data.chunker import StructureAwareChunker
+from src.core.state.memory_manager import MemoryManager
+
+
+class FieldAnswerer:
+    """
+    Answers a question from the value of a single, clearly
+    best-matching field chunk.
+    """
+
+    def __init__(self, memory_manager: MemoryManager) -> None:
+        """
+        Initialize FieldAnswerer.
+
+        Args:
+            memory_manager (MemoryManager): STM manager.
+        """
+
+        self.memory_manager: MemoryManager = memory_manager
+
+    def try_answer(
+        self, query: str, retrieved_chunks: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Answer from the top field chunk if it is a decisive match.
+
+        Chunks retrieved for an identifier in the question are not
+        candidates: the identifier says which record is meant, not
+        which field is asked for.
+
+        Args:
+            query (str): User question.
+            retrieved_chunks (List[Dict[str, Any]]): Retrieved chunks, in
+                any order (fused retrieval ranks them by RRF, not by
+                similarity).
+
+        Returns:
+            Optional[Dict[str, str]]:
+                - answer
+                - sources
+                None when the fast path does not apply.
+        """
+
+        candidates: List[Dict[str, Any]] = [
+            chunk for chunk in retrieved_chunks if not chunk.get("identifier_match")
+        ]
+
+        if not candidates:
+            return None
+
+        # Best and runner-up by dense similarity, not by list position
+        best: List[Dict[str, Any]] = heapq.nlargest(
+            2, candidates, key=lambda chunk: chunk.get("similarity_score", 0.0)
+        )
+
+        top_chunk: Dict[str, Any] = best[0]
+
+        if not top_chunk.get("field") or not top_chunk.get("value"):
+            return None
+
+        top_score: float = top_chunk.get("similarity_score", 0.0)
+
+        # Chunks below the threshold are dropped by the retriever,
+        # so a missing runner-up scored at most the threshold
+        runner_up_score: float = (
+            best[1].get("similarity_score", 0.0)
+            if len(best) > 1
+            else SIMILARITY_THRESHOLD
+        )
+
+        if top_score < FAST_PATH_MIN_SIMILARITY:
+            return None
+
+        if top_score - runner_up_score < FAST_PATH_MIN_MARGIN:
+            return None
+
+        answer: str = (
+            f"The {self._field_label(top_chunk['field'])} is {top_chunk['value']}."
+        )
+
+        self.memory_manager.add_interaction(query, answer)
+
+        return {"answer": answer, "sources": top_chunk.get("content", "")}
+
+    def _field_label(self, field_name: str) -> str:
+        """
+        Human-readable label for a canonical field name.
+
+        Args:
+            field_name (str)
+
+        Returns:
+            str
+        """
+
+        aliases: List[str] = StructureAwareChunker.FIELD_ALIASES.get(field_name, [])
+
+        if aliases:
+            return aliases[0].lower()
+
+        return field_name.replace("_", " ")
@@ -0,0 +1,270 @@
+"""
+Resilient LLM Client Module
+
+Wraps OpenAI chat completions with:
+- Per-attempt timeouts bounded by an overall deadline
+- Retries with jittered exponential backoff on transient failures
+- Optional request hedging after a p95-derived delay
+"""
+
+from typing import Dict, Any, List, Deque, Optional
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    Future,
+    wait,
+    FIRST_COMPLETED,
+)
+import random
+import threading
+import time
+import numpy as np
+import openai
+from openai import OpenAI
+from src.config.settings import (
+    LLM_REQUEST_TIMEOUT_SECONDS,
+    LLM_DEADLINE_SECONDS,
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BASE_DELAY_SECONDS,
+    LLM_RETRY_MAX_DELAY_SECONDS,
+    LLM_HEDGING_ENABLED,
+    LLM_HEDGE_PERCENTILE,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_LATENCY_WINDOW,
+    LLM_HEDGE_MAX_WORKERS,
+)
+from src.core.state.metrics import METRICS
+
+# Failures worth retrying
+TRANSIENT_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    TimeoutError,
+)
+
+# Shared across client instances (one is created per request)
+_HEDGE_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=LLM_HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge"
+)
+_LATENCIES: Dict[str, Deque[float]] = {}
+_LATENCIES_LOCK: threading.Lock = threading.Lock()
+
+
+class ResilientLLMClient:
+    """
+    Deadline-aware chat completion client with retries and hedging.
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        request_timeout: float = LLM_REQUEST_TIMEOUT_SECONDS,
+        deadline: float = LLM_DEADLINE_SECONDS,
+        max_retries: int = LLM_MAX_RETRIES,
+        hedging_enabled: bool = LLM_HEDGING_ENABLED,
+    ) -> None:
+        """
+        Initialize ResilientLLMClient.
+
+        Args:
+            client (OpenAI): OpenAI client.
+            request_timeout (float): Timeout of a single attempt in seconds.
+            deadline (float): Overall deadline in seconds.
+            max_retries (int): Retries on transient failures.
+            hedging_enabled (bool): Send duplicate requests for slow attempts.
+        """
+
+        # Retries are handled here, not by the SDK
+        self.client: OpenAI = client.with_options(max_retries=0)
+
+        self.request_timeout: float = request_timeout
+        self.deadline: float = deadline
+        self.max_retries: int = max_retries
+        self.hedging_enabled: bool = hedging_enabled
+
+    def create_chat_completion(self, **kwargs: Any) -> Any:
+        """
+        Create a chat completion within the deadline.
+
+        Args:
+            **kwargs: Arguments for chat.completions.create.
+
+        Returns:
+            Any: Chat completion response.
+        """
+
+        deadline_at: float = time.perf_counter() + self.deadline
+        attempt: int = 0
+
+        METRICS.increment("llm_requests_total")
+
+        while True:
+            remaining: float = deadline_at - time.perf_counter()
+
+            try:
+                if remaining <= 0:
+                    raise TimeoutError("LLM request deadline exceeded.")
+
+                return self._hedged_call(
+                    kwargs, min(self.request_timeout, remaining), deadline_at
+                )
+
+            except TRANSIENT_ERRORS:
+                attempt += 1
+                remaining = deadline_at - time.perf_counter()
+
+                if attempt > self.max_retries or remaining <= 0:
+                    raise
+
+                METRICS.increment("llm_retries_total")
+
+                # Full jitter exponential backoff
+                backoff: float = min(
+                    LLM_RETRY_MAX_DELAY_SECONDS,
+                    LLM_RETRY_BASE_DELAY_SECONDS * (2 ** (attempt - 1)),
+                )
+                time.sleep(min(random.uniform(0, backoff), remaining))
+
+    def _hedged_call(
+        self, kwargs: Dict[str, Any], timeout: float, deadline_at: float
+    ) -> Any:
+        """
+        Run one attempt, hedging it with a duplicate request if it is slow.
+
+        Args:
+            kwargs (Dict[str, Any]): Completion arguments.
+            timeout (float): Attempt timeout in seconds.
+            deadline_at (float): Absolute deadline (perf_counter time).
+
+        Returns:
+            Any: First successful response.
+        """
+
+        model: str = kwargs.get("model", "")
+
+        hedge_delay: Optional[float] = (
+            self._hedge_delay(model) if self.hedging_enabled else None
+        )
+
+        if hedge_delay is None or hedge_delay >= timeout:
+            return self._call(kwargs, timeout)
+
+        primary: Future = _HEDGE_EXECUTOR.submit(self._call, kwargs, timeout)
+
+        done, _ = wait([primary], timeout=hedge_delay)
+
+        if done:
+            return primary.result()
+
+        METRICS.increment("llm_hedges_total", labels={"model": model})
+
+        hedge: Future = _HEDGE_EXECUTOR.submit(
+            self._call, kwargs, timeout - hedge_delay
+        )
+
+        pending: List[Future] = [primary, hedge]
+        first_error: Optional[BaseException] = None
+
+        while pending:
+            done, not_done = wait(
+                pending,
+                timeout=max(0.0, deadline_at - time.perf_counter()),
+                return_when=FIRST_COMPLETED,
+            )
+
+            if not done:
+                raise TimeoutError("LLM request deadline exceeded.")
+
+            for future in done:
+                error: Optional[BaseException] = future.exception()
+
+                if error is None:
+                    if future is hedge:
+                        self._record_hedge_win(model, primary)
+
+                    return future.result()
+
+                first_error = first_error or error
+
+            pending = list(not_done)
+
+        raise first_error
+
+    def _call(self, kwargs: Dict[str, Any], timeout: float) -> Any:
+        """
+        Single completion request, recording its latency.
+
+        Args:
+            kwargs (Dict[str, Any]): Completion arguments.
+            timeout (float): Request timeout in seconds.
+
+        Returns:
+            Any: Chat completion response.
+        """
+
+        start: float = time.perf_counter()
+
+        response = self.client.chat.completions.create(**kwargs, timeout=timeout)
+
+        self._record_latency(kwargs.get("model", ""), time.perf_counter() - start)
+
+        return response
+
+    def _record_latency(self, model: str, elapsed: float) -> None:
+        """
+        Add a successful request latency to the model's rolling window.
+
+        Args:
+            model (str)
+            elapsed (float)
+        """
+
+        with _LATENCIES_LOCK:
+            _LATENCIES.setdefault(model, deque(maxlen=LLM_LATENCY_WINDOW)).append(
+                elapsed
+            )
+
+    def _hedge_delay(self, model: str) -> Optional[float]:
+        """
+        Latency percentile after which a hedge request is sent.
+
+        Args:
+            model (str)
+
+        Returns:
+            Optional[float]: Delay in seconds, or None until enough
+                latencies have been observed.
+        """
+
+        with _LATENCIES_LOCK:
+            latencies: List[float] = list(_LATENCIES.get(model, ()))
+
+        if len(latencies) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+
+        return float(np.percentile(latencies, LLM_HEDGE_PERCENTILE))
+
+    def _record_hedge_win(self, model: str, primary: Future) -> None:
+        """
+        Count a hedge win and, once the primary finishes, the tail
+        latency it saved.
+
+        Args:
+            model (str)
+            primary (Future): Still-running primary request.
+        """
+
+        METRICS.increment("llm_hedge_wins_total", labels={"model": model})
+
+        won_at: float = time.perf_counter()
+
+        def _on_primary_done(_: Future) -> None:
+            METRICS.observe(
+                "llm_hedge_latency_saved_seconds",
+                time.perf_counter() - won_at,
+                {"model": model},
+            )
+
+        primary.add_done_callback(_on_primary_done)
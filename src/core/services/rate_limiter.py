@@ -0,0 +1,155 @@
+"""
+Rate Limiter Module
+
+Token-bucket limits on requests and tokens per minute, shared by all
+requests made with the same API key. Waiters are served by priority,
+so interactive requests overtake queued bulk ingestion.
+
+Buckets live in each worker process, so each of the API_WORKERS
+workers enforces an equal share of the configured limits.
+"""
+
+from typing import Dict, List, Tuple
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from src.config.settings import (
+    EMBEDDING_REQUESTS_PER_MINUTE,
+    EMBEDDING_TOKENS_PER_MINUTE,
+    API_WORKERS,
+)
+
+# Lower value is served first
+PRIORITY_INTERACTIVE: int = 0
+PRIORITY_BULK: int = 1
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute token buckets with a
+    priority queue of waiters.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = EMBEDDING_REQUESTS_PER_MINUTE / API_WORKERS,
+        tokens_per_minute: float = EMBEDDING_TOKENS_PER_MINUTE / API_WORKERS,
+    ) -> None:
+        """
+        Initialize RateLimiter with full buckets.
+
+        Args:
+            requests_per_minute (float): Request bucket capacity and refill
+                rate (this worker's share of the per-key limit by default).
+            tokens_per_minute (float): Token bucket capacity and refill
+                rate (this worker's share of the per-key limit by default).
+        """
+
+        self.request_capacity: float = requests_per_minute
+        self.token_capacity: float = tokens_per_minute
+
+        self._requests: float = requests_per_minute
+        self._tokens: float = tokens_per_minute
+        self._refilled_at: float = time.monotonic()
+
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence: itertools.count = itertools.count()
+        self._condition: threading.Condition = threading.Condition()
+
+    def acquire(self, tokens: int, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        Block until one request and tokens may be spent.
+
+        Args:
+            tokens (int): Estimated tokens of the request; a request larger
+                than the bucket waits for a full bucket and overdraws it.
+            priority (int): PRIORITY_INTERACTIVE or PRIORITY_BULK.
+        """
+
+        needed: float = min(float(tokens), self.token_capacity)
+
+        with self._condition:
+            ticket: Tuple[int, int] = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+
+            try:
+                while True:
+                    self._refill()
+
+                    if self._waiters[0] == ticket:
+                        if self._requests >= 1.0 and self._tokens >= needed:
+                            self._requests -= 1.0
+                            self._tokens -= tokens
+                            return
+
+                        self._condition.wait(self._seconds_until(needed))
+                    else:
+                        self._condition.wait()
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+
+                # Let the next waiter check the buckets
+                self._condition.notify_all()
+
+    def _refill(self) -> None:
+        """
+        Add tokens earned since the last refill (caller holds the lock).
+        """
+
+        now: float = time.monotonic()
+        elapsed_minutes: float = (now - self._refilled_at) / 60.0
+        self._refilled_at = now
+
+        self._requests = min(
+            self.request_capacity,
+            self._requests + elapsed_minutes * self.request_capacity,
+        )
+        self._tokens = min(
+            self.token_capacity,
+            self._tokens + elapsed_minutes * self.token_capacity,
+        )
+
+    def _seconds_until(self, tokens: float) -> float:
+        """
+        Time until both buckets allow a request of tokens.
+
+        Args:
+            tokens (float)
+
+        Returns:
+            float: Seconds (at least a millisecond).
+        """
+
+        request_wait: float = (
+            max(0.0, 1.0 - self._requests) / self.request_capacity * 60.0
+        )
+        token_wait: float = max(0.0, tokens - self._tokens) / self.token_capacity * 60.0
+
+        return max(request_wait, token_wait, 0.001)
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK: threading.Lock = threading.Lock()
+
+
+def rate_limiter_for(api_key: str) -> RateLimiter:
+    """
+    Rate limiter shared by all requests made with an API key.
+
+    Args:
+        api_key (str): OpenAI API key (only its hash is kept).
+
+    Returns:
+        RateLimiter
+    """
+
+    key_hash: str = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    with _LIMITERS_LOCK:
+        if key_hash not in _LIMITERS:
+            _LIMITERS[key_hash] = RateLimiter()
+
+        return _LIMITERS[key_hash]
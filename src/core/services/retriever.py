@@ -2,13 +2,36 @@
 Retriever Module
 
 Handles retrieval of relevant document chunks using embeddings
-and FAISS similarity search.
+and FAISS similarity search, fused with BM25 lexical ranking.
+A chunk named by an identifier in the question is boosted to the
+top; pure identifier lookups are answered from that chunk alone.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Set
+import heapq
+import re
+import numpy as np
 from src.core.services.embedding_service import EmbeddingService
+from src.core.data.chunker import StructureAwareChunker
 from src.core.data.vector_store import VectorStore
-from src.config.settings import SIMILARITY_THRESHOLD, TOP_K_RETRIEVAL
+from src.core.data.token_index import ChunkTokenIndex
+from src.core.data.tokenizer import tokenize, STOPWORDS
+from src.config.settings import (
+    SIMILARITY_THRESHOLD,
+    TOP_K_RETRIEVAL,
+    SEARCH_OVERFETCH_FACTOR,
+    HYBRID_RETRIEVAL_ENABLED,
+    RRF_K,
+    LEXICAL_IDENTIFIER_MIN_LENGTH,
+    LEXICAL_MATCH_SIMILARITY,
+    ADAPTIVE_SEARCH_ENABLED,
+    ADAPTIVE_SCORE_GAP,
+    ADAPTIVE_MAX_TOP_K,
+)
+from src.core.state.metrics import METRICS
+
+# Whitespace-delimited words of a question, e.g. "LD-883920?"
+WORD_PATTERN: re.Pattern = re.compile(r"\S+")
 
 
 class Retriever:
@@ -18,7 +41,10 @@ class Retriever:
     """
 
     def __init__(
-        self, embedding_service: EmbeddingService, vector_store: VectorStore
+        self,
+        embedding_service: EmbeddingService,
+        vector_store: VectorStore,
+        token_index: Optional[ChunkTokenIndex] = None,
     ) -> None:
         """
         Initialize Retriever.
@@ -26,17 +52,176 @@ class Retriever:
         Args:
             embedding_service (EmbeddingService): Embedding service instance.
             vector_store (VectorStore): FAISS vector store instance.
+            token_index (Optional[ChunkTokenIndex]): Lexical index of the
+                same chunks; enables hybrid and lexical-only retrieval.
         """
 
         self.embedding_service: EmbeddingService = embedding_service
         self.vector_store: VectorStore = vector_store
+        self.token_index: Optional[ChunkTokenIndex] = token_index
+
+    def retrieve_lexical(
+        self, query: str
+    ) -> Optional[Tuple[List[Dict[str, str]], float]]:
+        """
+        Retrieve from the lexical index alone when the query is only an
+        identifier lookup (e.g. "which shipment is LD-883920?"): an
+        identifier found in exactly one chunk, plus stopwords and words
+        naming that chunk's field.
+
+        Questions asking something else about the identified record
+        (e.g. "what is the weight of LD-883920?") go through retrieve(),
+        which boosts the identified chunk instead.
+
+        The query is not embedded; the exact match is reported with
+        LEXICAL_MATCH_SIMILARITY.
+
+        Args:
+            query (str): User question.
+
+        Returns:
+            Optional[Tuple[List[Dict[str, str]], float]]: Same shape as
+                retrieve(), or None when the query is not such a lookup.
+        """
+
+        chunk_id: Optional[str] = self.identifier_chunk(query)
+
+        if chunk_id is None:
+            return None
+
+        chunk: Dict[str, str] = self.token_index.chunks[chunk_id]
+
+        allowed: Set[str] = STOPWORDS | self._identifier_parts(query)
+
+        if chunk.get("field"):
+            allowed |= self._field_words(chunk["field"])
+
+        if any(token not in allowed for token in tokenize(query)):
+            return None
+
+        return [
+            {
+                **chunk,
+                "similarity_score": LEXICAL_MATCH_SIMILARITY,
+                "identifier_match": True,
+            }
+        ], LEXICAL_MATCH_SIMILARITY
+
+    def identifier_chunk(self, query: str) -> Optional[str]:
+        """
+        The single chunk named by the identifiers in the query.
+
+        Args:
+            query (str): User question.
+
+        Returns:
+            Optional[str]: Chunk id, or None when the query names no
+                identifier or the match is not unique.
+        """
+
+        if self.token_index is None:
+            return None
+
+        identifiers: List[str] = [
+            token for token in tokenize(query) if self._is_identifier(token)
+        ]
+
+        if not identifiers:
+            return None
+
+        matching: Set[str] = set()
+
+        for identifier in identifiers:
+            chunk_ids: Set[str] = self.token_index.chunks_containing(identifier)
+
+            # Every identifier must be known to the document
+            if not chunk_ids:
+                return None
 
-    def retrieve(self, query: str) -> Tuple[List[Dict[str, str]], float]:
+            matching |= chunk_ids
+
+        # Raw-text windows repeat what a matching field chunk states
+        field_matches: Set[str] = {
+            chunk_id
+            for chunk_id in matching
+            if self.token_index.chunks[chunk_id].get("field")
+        }
+
+        matching = field_matches or matching
+
+        if len(matching) != 1:
+            return None
+
+        return matching.pop()
+
+    def _is_identifier(self, token: str) -> bool:
+        """
+        Whether a token looks like an identifier (contains a digit).
+
+        Args:
+            token (str)
+
+        Returns:
+            bool
+        """
+
+        return len(token) >= LEXICAL_IDENTIFIER_MIN_LENGTH and any(
+            char.isdigit() for char in token
+        )
+
+    def _identifier_parts(self, query: str) -> Set[str]:
+        """
+        Tokens of the query words containing an identifier, so that
+        "LD-883920" contributes "ld" as well as "883920".
+
+        Args:
+            query (str): User question.
+
+        Returns:
+            Set[str]
+        """
+
+        parts: Set[str] = set()
+
+        for word in WORD_PATTERN.findall(query):
+            tokens: List[str] = tokenize(word)
+
+            if any(self._is_identifier(token) for token in tokens):
+                parts.update(tokens)
+
+        return parts
+
+    def _field_words(self, field_name: str) -> Set[str]:
+        """
+        Words naming a field: its canonical name and aliases.
+
+        Args:
+            field_name (str): Canonical field name.
+
+        Returns:
+            Set[str]
+        """
+
+        names: List[str] = [field_name.replace("_", " ")]
+        names.extend(StructureAwareChunker.FIELD_ALIASES.get(field_name, []))
+
+        return set(tokenize(" ".join(names)))
+
+    def retrieve(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray] = None,
+        column_filter: Optional[Tuple[str, str]] = None,
+    ) -> Tuple[List[Dict[str, str]], float]:
         """
         Retrieve relevant chunks for a given query.
 
         Args:
             query (str): User question.
+            query_embedding (Optional[np.ndarray]): Precomputed query
+                embedding; generated when omitted.
+            column_filter (Optional[Tuple[str, str]]): (column, value);
+                restricts retrieval to table rows with that cell value.
 
         Returns:
             Tuple[List[Dict[str, str]], float]:
@@ -45,29 +230,194 @@ class Retriever:
         """
 
         # Generate embedding for user query
-        query_embedding: List[float] = self.embedding_service.generate_embedding(query)
+        if query_embedding is None:
+            query_embedding = self.embedding_service.generate_embedding(query)
 
-        # Search vector store
+        # Chunk named by an identifier in the question (e.g. "LD-883920")
+        boosted_chunk_id: Optional[str] = (
+            self.identifier_chunk(query) if column_filter is None else None
+        )
+
+        candidate_count: int = TOP_K_RETRIEVAL * SEARCH_OVERFETCH_FACTOR
+
+        # Search vector store; over-fetch since several question
+        # entries may point to the same chunk. A column filter is
+        # applied inside the search.
         search_results: List[Tuple[Dict[str, str], float]] = self.vector_store.search(
-            query_embedding, TOP_K_RETRIEVAL
+            query_embedding,
+            candidate_count,
+            where=(
+                {f"columns.{column_filter[0]}": column_filter[1]}
+                if column_filter is not None
+                else None
+            ),
         )
 
+        # Best dense score per chunk, best first
+        dense_ranking: Dict[str, Tuple[Dict[str, str], float]] = {}
+
+        for metadata, similarity_score in search_results:
+            # Results are sorted by score, so the first hit of a chunk is its best
+            dense_ranking.setdefault(
+                metadata.get("chunk_id"), (metadata, similarity_score)
+            )
+
+        ranked_chunk_ids: List[str] = list(dense_ranking)
+
+        if (
+            HYBRID_RETRIEVAL_ENABLED
+            and self.token_index is not None
+            and column_filter is None
+        ):
+            ranked_chunk_ids = self._fuse_rankings(
+                query, query_embedding, dense_ranking, candidate_count
+            )
+
+        # An exact identifier match always makes the top_k cut, scored
+        # by its real dense similarity
+        if boosted_chunk_id is not None:
+            if boosted_chunk_id not in dense_ranking:
+                dense_ranking[boosted_chunk_id] = (
+                    self.token_index.chunks[boosted_chunk_id],
+                    self._chunk_similarities([boosted_chunk_id], query_embedding)[0],
+                )
+
+            ranked_chunk_ids = [boosted_chunk_id] + [
+                chunk_id
+                for chunk_id in ranked_chunk_ids
+                if chunk_id != boosted_chunk_id
+            ]
+
         filtered_chunks: List[Dict[str, str]] = []
         max_similarity_score: float = 0.0
 
-        for metadata, similarity_score in search_results:
+        top_k: int = self._cut_off(dense_ranking)
+
+        for chunk_id in ranked_chunk_ids[:top_k]:
+            metadata, similarity_score = dense_ranking[chunk_id]
+
             # Track highest similarity score
             if similarity_score > max_similarity_score:
                 max_similarity_score = similarity_score
 
             # Apply similarity threshold filtering
             if similarity_score >= SIMILARITY_THRESHOLD:
+                # Keep chunk metadata (e.g. field/value) for downstream stages
                 filtered_chunks.append(
                     {
-                        "chunk_id": metadata.get("chunk_id"),
-                        "content": metadata.get("content"),
+                        **metadata,
                         "similarity_score": similarity_score,
+                        "identifier_match": chunk_id == boosted_chunk_id,
                     }
                 )
 
         return filtered_chunks, max_similarity_score
+
+    def _cut_off(self, dense_ranking: Dict[str, Tuple[Dict[str, str], float]]) -> int:
+        """
+        Number of ranked chunks to keep.
+
+        TOP_K_RETRIEVAL, raised to ADAPTIVE_MAX_TOP_K only when the two
+        best chunks score within ADAPTIVE_SCORE_GAP of each other, i.e.
+        when no chunk is a decisive match.
+
+        Args:
+            dense_ranking (Dict[str, Tuple[Dict[str, str], float]]):
+                Metadata and dense similarity per chunk.
+
+        Returns:
+            int
+        """
+
+        if not ADAPTIVE_SEARCH_ENABLED or len(dense_ranking) <= TOP_K_RETRIEVAL:
+            return TOP_K_RETRIEVAL
+
+        # Lexical-only chunks may have been appended out of order
+        best_scores: List[float] = heapq.nlargest(
+            2, (similarity_score for _, similarity_score in dense_ranking.values())
+        )
+
+        if best_scores[0] - best_scores[1] >= ADAPTIVE_SCORE_GAP:
+            return TOP_K_RETRIEVAL
+
+        METRICS.increment("adaptive_search_escalations_total", labels={"kind": "top_k"})
+
+        return max(TOP_K_RETRIEVAL, ADAPTIVE_MAX_TOP_K)
+
+    def _fuse_rankings(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        dense_ranking: Dict[str, Tuple[Dict[str, str], float]],
+        candidate_count: int,
+    ) -> List[str]:
+        """
+        Order chunks by reciprocal rank fusion of dense and BM25 rankings.
+
+        Chunks found only lexically get their dense similarity from the
+        stored vectors, so thresholds apply to every chunk alike.
+
+        Args:
+            query (str): User question.
+            query_embedding (np.ndarray): Query embedding.
+            dense_ranking (Dict[str, Tuple[Dict[str, str], float]]): Dense
+                hits per chunk, best first; lexical-only chunks are added.
+            candidate_count (int): BM25 candidates to consider.
+
+        Returns:
+            List[str]: Chunk ids, best fused score first.
+        """
+
+        lexical_ranking: List[Tuple[str, float]] = self.token_index.bm25_search(
+            query, candidate_count
+        )
+
+        fused_scores: Dict[str, float] = {}
+
+        for rank, chunk_id in enumerate(dense_ranking):
+            fused_scores[chunk_id] = 1.0 / (RRF_K + rank + 1)
+
+        for rank, (chunk_id, _) in enumerate(lexical_ranking):
+            fused_scores[chunk_id] = fused_scores.get(chunk_id, 0.0) + 1.0 / (
+                RRF_K + rank + 1
+            )
+
+        lexical_only: List[str] = [
+            chunk_id for chunk_id, _ in lexical_ranking if chunk_id not in dense_ranking
+        ]
+
+        if lexical_only:
+            similarities: List[float] = self._chunk_similarities(
+                lexical_only, query_embedding
+            )
+
+            for chunk_id, similarity_score in zip(lexical_only, similarities):
+                dense_ranking[chunk_id] = (
+                    self.token_index.chunks[chunk_id],
+                    similarity_score,
+                )
+
+        return sorted(fused_scores, key=fused_scores.get, reverse=True)
+
+    def _chunk_similarities(
+        self, chunk_ids: List[str], query_embedding: np.ndarray
+    ) -> List[float]:
+        """
+        Dense similarity of chunks to the query, from their stored vectors.
+
+        Args:
+            chunk_ids (List[str]): Chunks to score.
+            query_embedding (np.ndarray): Query embedding.
+
+        Returns:
+            List[float]: One score per chunk id.
+        """
+
+        query_vector: np.ndarray = np.asarray(query_embedding, dtype=np.float32)
+        query_vector = query_vector / max(float(np.linalg.norm(query_vector)), 1e-12)
+
+        similarities: np.ndarray = (
+            self.vector_store.chunk_vectors(chunk_ids) @ query_vector
+        )
+
+        return [float(similarity_score) for similarity_score in similarities]
@@ -0,0 +1,213 @@
+"""
+Answer Cache Module
+
+Semantic cache of /ask responses scoped per document.
+Lookups match the normalized query text exactly, or the
+query embedding by cosine similarity.
+"""
+
+from typing import Dict, Any, List, Optional
+import threading
+import numpy as np
+from src.config.settings import (
+    ANSWER_CACHE_SIMILARITY_THRESHOLD,
+    ANSWER_CACHE_MAX_ENTRIES,
+)
+
+
+class _DocumentCache:
+    """
+    Cached answers of a single document.
+
+    Query embeddings live in a preallocated matrix used as a ring buffer,
+    so a lookup is one matrix-vector product.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries: int = max_entries
+        self.embeddings: Optional[np.ndarray] = None
+        self.entries: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self.query_slots: Dict[str, int] = {}
+        self.count: int = 0
+        self.next_slot: int = 0
+
+    def store(
+        self,
+        query_key: str,
+        query_vector: Optional[np.ndarray],
+        response: Dict[str, Any],
+    ) -> None:
+        if self.embeddings is None and query_vector is not None:
+            self.embeddings = np.zeros(
+                (self.max_entries, query_vector.shape[0]), dtype="float32"
+            )
+
+        slot: int = self.query_slots.get(query_key, self.next_slot)
+
+        # Evict the entry previously held by this slot
+        previous: Optional[Dict[str, Any]] = self.entries[slot]
+        if previous is not None and previous["query_key"] != query_key:
+            self.query_slots.pop(previous["query_key"], None)
+
+        # Entries without an embedding keep a zero row: exact match only
+        if self.embeddings is not None:
+            self.embeddings[slot] = 0.0 if query_vector is None else query_vector
+
+        self.entries[slot] = {"query_key": query_key, "response": response}
+        self.query_slots[query_key] = slot
+
+        if slot == self.next_slot:
+            self.next_slot = (self.next_slot + 1) % self.max_entries
+            self.count = min(self.count + 1, self.max_entries)
+
+
+class AnswerCache:
+    """
+    Caches answers per document, keyed by query text and embedding.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = ANSWER_CACHE_SIMILARITY_THRESHOLD,
+        max_entries: int = ANSWER_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize AnswerCache.
+
+        Args:
+            similarity_threshold (float): Minimum cosine similarity for a hit.
+            max_entries (int): Maximum cached answers per document.
+        """
+
+        self.similarity_threshold: float = similarity_threshold
+        self.max_entries: int = max_entries
+
+        self._documents: Dict[str, _DocumentCache] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def lookup(
+        self,
+        document_id: str,
+        query: str,
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response for the query.
+
+        Args:
+            document_id (str): Document the query targets.
+            query (str): User question.
+            query_embedding (Optional[np.ndarray]): Query embedding; when
+                omitted only exact (normalized) text matches are returned.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached response (answer, confidence,
+                sources) or None on a miss.
+        """
+
+        with self._lock:
+            document_cache: Optional[_DocumentCache] = self._documents.get(document_id)
+
+            if document_cache is None or document_cache.count == 0:
+                return None
+
+            slot: Optional[int] = document_cache.query_slots.get(
+                self._normalize_query(query)
+            )
+
+            if slot is not None:
+                return dict(document_cache.entries[slot]["response"])
+
+            if query_embedding is None or document_cache.embeddings is None:
+                return None
+
+            query_vector: np.ndarray = self._normalize_vector(query_embedding)
+
+            similarities: np.ndarray = (
+                document_cache.embeddings[: document_cache.count] @ query_vector
+            )
+
+            best_slot: int = int(np.argmax(similarities))
+
+            if similarities[best_slot] < self.similarity_threshold:
+                return None
+
+            return dict(document_cache.entries[best_slot]["response"])
+
+    def store(
+        self,
+        document_id: str,
+        query: str,
+        query_embedding: Optional[np.ndarray],
+        response: Dict[str, Any],
+    ) -> None:
+        """
+        Cache a response for the query.
+
+        Args:
+            document_id (str): Document the query targets.
+            query (str): User question.
+            query_embedding (Optional[np.ndarray]): Query embedding; when
+                omitted the response is only found by exact text.
+            response (Dict[str, Any]): Answer, confidence and sources.
+        """
+
+        with self._lock:
+            document_cache: _DocumentCache = self._documents.setdefault(
+                document_id, _DocumentCache(self.max_entries)
+            )
+
+            document_cache.store(
+                self._normalize_query(query),
+                (
+                    self._normalize_vector(query_embedding)
+                    if query_embedding is not None
+                    else None
+                ),
+                dict(response),
+            )
+
+    def invalidate(self, document_id: Optional[str] = None) -> None:
+        """
+        Drop cached answers.
+
+        Args:
+            document_id (Optional[str]): Document to invalidate; all
+                documents when omitted.
+        """
+
+        with self._lock:
+            if document_id is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(document_id, None)
+
+    def _normalize_query(self, query: str) -> str:
+        """
+        Canonical form of query text for exact matching.
+
+        Args:
+            query (str)
+
+        Returns:
+            str
+        """
+
+        return " ".join(query.lower().strip(" ?!.").split())
+
+    def _normalize_vector(self, embedding: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize an embedding for cosine similarity.
+
+        Args:
+            embedding (np.ndarray)
+
+        Returns:
+            np.ndarray
+        """
+
+        vector: np.ndarray = np.asarray(embedding, dtype="float32")
+
+        norm: float = float(np.linalg.norm(vector))
+
+        return vector / norm if norm else vector
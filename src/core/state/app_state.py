@@ -1,13 +1,182 @@
 """
 Application State Module
 
-Stores shared in-memory state across API endpoints.
+Stores shared state across API endpoints.
+
+Document state lives in the configured StateBackend. Each worker
+caches the current document snapshot and swaps in a newer version,
+without blocking queries, when another worker publishes one.
+
+Kept documents are also searchable together as one sharded corpus.
 """
 
-from typing import Optional
+from typing import Optional, Dict, Any, List
+import threading
+import weakref
+from src.core.state.document_state import DocumentState
+from src.core.data.sharded_index import ShardedIndex, IndexShard
 from src.core.data.vector_store import VectorStore
-from src.core.state.memory_manager import MemoryManager
+from src.core.state.state_backend import StateBackend, create_state_backend
+from src.core.state.session_store import SessionMemoryStore
+from src.core.state.answer_cache import AnswerCache
+from src.core.state.metrics import METRICS
+
+STATE_BACKEND_INSTANCE: StateBackend = create_state_backend()
+SESSION_MEMORY_STORE: SessionMemoryStore = SessionMemoryStore(
+    backend=STATE_BACKEND_INSTANCE
+)
+ANSWER_CACHE_INSTANCE: AnswerCache = AnswerCache()
+
+_CURRENT_DOCUMENT: Optional[DocumentState] = None
+_DOCUMENT_LOCK: threading.Lock = threading.Lock()
+
+_CORPUS: ShardedIndex = ShardedIndex([])
+_CORPUS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_document() -> Optional[DocumentState]:
+    """
+    Current document snapshot, reloaded from the backend if it changed.
+
+    Snapshots are immutable once published: callers keep the returned
+    object for the whole request and never see a partially built index.
+    A superseded snapshot is freed when its last reader drops it.
+
+    Returns:
+        Optional[DocumentState]: None when no document was uploaded.
+    """
+
+    global _CURRENT_DOCUMENT
+
+    version: int = STATE_BACKEND_INSTANCE.current_version()
+
+    snapshot: Optional[DocumentState] = _CURRENT_DOCUMENT
+
+    if snapshot is not None and snapshot.version >= version:
+        return snapshot
+
+    # While another request loads the new version, keep serving the
+    # current snapshot instead of waiting for it
+    if not _DOCUMENT_LOCK.acquire(blocking=snapshot is None):
+        return snapshot
+
+    try:
+        if _CURRENT_DOCUMENT is None or _CURRENT_DOCUMENT.version < version:
+            _install_snapshot(STATE_BACKEND_INSTANCE.load_document())
+
+            ANSWER_CACHE_INSTANCE.invalidate()
+
+            # Conversations refer to the previous document; the
+            # publishing worker already cleared the shared copies
+            SESSION_MEMORY_STORE.clear_local()
+
+        return _CURRENT_DOCUMENT
+    finally:
+        _DOCUMENT_LOCK.release()
+
+
+def publish_document(document: DocumentState) -> None:
+    """
+    Make a fully built document current for all workers.
+
+    Args:
+        document (DocumentState): New document state, built off to the
+            side and not modified after publishing.
+    """
+
+    STATE_BACKEND_INSTANCE.save_document(document)
+
+    with _DOCUMENT_LOCK:
+        # A concurrent reload may already have installed this version
+        if _CURRENT_DOCUMENT is None or _CURRENT_DOCUMENT.version < document.version:
+            _install_snapshot(document)
+
+    # Answers and conversations refer to the previous document
+    ANSWER_CACHE_INSTANCE.invalidate()
+
+    SESSION_MEMORY_STORE.clear_all()
+
+
+def _install_snapshot(document: Optional[DocumentState]) -> None:
+    """
+    Swap in a new current snapshot (caller holds _DOCUMENT_LOCK).
+
+    Args:
+        document (Optional[DocumentState])
+    """
+
+    global _CURRENT_DOCUMENT
+
+    if document is not None:
+        # Counts superseded snapshots once in-flight readers release them
+        weakref.finalize(
+            document, METRICS.increment, "document_snapshots_released_total"
+        )
+
+        index = document.vector_store.index
+
+        METRICS.set_gauge("document_index_entries", index.ntotal)
+        METRICS.set_gauge("document_index_vector_bytes", index.ntotal * index.d * 4)
+
+    # Single reference assignment: readers see the old or the new snapshot
+    _CURRENT_DOCUMENT = document
+
+
+def get_corpus() -> ShardedIndex:
+    """
+    Sharded index of all kept documents, synced with the backend.
+
+    Shards already loaded are reused; only documents uploaded (or
+    dropped) since the last call are loaded (or released).
+
+    Returns:
+        ShardedIndex
+    """
+
+    global _CORPUS
+
+    listing: List[Dict[str, Any]] = STATE_BACKEND_INSTANCE.list_documents()
+
+    corpus: ShardedIndex = _CORPUS
+
+    if corpus.versions == {entry["version"] for entry in listing}:
+        return corpus
+
+    with _CORPUS_LOCK:
+        loaded: Dict[int, IndexShard] = {
+            shard.version: shard for shard in _CORPUS.shards
+        }
+
+        shards: List[IndexShard] = []
+
+        for entry in listing:
+            shard: Optional[IndexShard] = loaded.get(entry["version"])
+
+            if shard is None:
+                vector_store: Optional[VectorStore] = (
+                    STATE_BACKEND_INSTANCE.load_vector_store(entry["version"])
+                )
+
+                # Dropped by a newer upload in the meantime
+                if vector_store is None:
+                    continue
+
+                shard = IndexShard(
+                    entry["version"],
+                    entry["document_id"],
+                    entry["created_at"],
+                    vector_store,
+                )
+
+            shards.append(shard)
+
+        # Single reference assignment, as for document snapshots
+        _CORPUS = ShardedIndex(shards)
+
+        METRICS.set_gauge("corpus_shards", len(shards))
+        METRICS.set_gauge(
+            "corpus_index_entries",
+            sum(shard.vector_store.index.ntotal for shard in shards),
+        )
 
-VECTOR_STORE_INSTANCE: Optional[VectorStore] = None
-DOCUMENT_TEXT_STORAGE: str = ""
-MEMORY_MANAGER_INSTANCE: MemoryManager = MemoryManager()
+        return _CORPUS
@@ -0,0 +1,65 @@
+"""
+Document State Module
+
+Groups everything derived from one uploaded document.
+"""
+
+from typing import Dict, Any, List, FrozenSet
+from src.core.data.vector_store import VectorStore
+from src.core.data.token_index import ChunkTokenIndex
+from src.core.data.tokenizer import tokenize
+
+
+class DocumentState:
+    """
+    Indexed document: raw text, structured data, chunk metadata,
+    vector index and chunk token index.
+    """
+
+    def __init__(
+        self,
+        document_id: str,
+        document_text: str,
+        structured_data: Dict[str, Any],
+        structured_context: str,
+        vector_store: VectorStore,
+        version: int = 0,
+    ) -> None:
+        """
+        Initialize DocumentState.
+
+        Args:
+            document_id (str): Content hash of the document text.
+            document_text (str): Raw extracted text.
+            structured_data (Dict[str, Any]): LLM-extracted structured JSON.
+            structured_context (str): Field chunks joined, used as the
+                stable prompt prefix.
+            vector_store (VectorStore): Index of chunks (metadata included).
+            version (int): Backend version, assigned when published.
+        """
+
+        self.document_id: str = document_id
+        self.document_text: str = document_text
+        self.structured_data: Dict[str, Any] = structured_data
+        self.structured_context: str = structured_context
+        self.vector_store: VectorStore = vector_store
+        self.version: int = version
+
+        # Derived from chunk metadata, so rebuilt wherever the state is loaded
+        self.token_index: ChunkTokenIndex = ChunkTokenIndex(self.chunks)
+
+        # Every word of the document, for the out-of-domain prefilter
+        self.vocabulary: FrozenSet[str] = frozenset(tokenize(document_text)) | set(
+            self.token_index.postings
+        )
+
+    @property
+    def chunks(self) -> List[Dict[str, str]]:
+        """
+        Chunk metadata aligned with the vector index.
+
+        Returns:
+            List[Dict[str, str]]
+        """
+
+        return self.vector_store.metadata_store
@@ -2,10 +2,22 @@
 Memory Manager Module
 
 Handles short-term conversational memory (STM).
+
+Retained turns are bounded by an estimated-token budget; turns
+evicted from it are compacted into a rolling summary.
 """
 
-from typing import List, Dict
-from src.config.settings import MAX_SHORT_TERM_MEMORY
+from typing import List, Dict, Any, Deque, Optional, Set, Callable
+from collections import deque
+import uuid
+from src.config.settings import (
+    MAX_SHORT_TERM_MEMORY,
+    MEMORY_TOKEN_BUDGET,
+    MEMORY_SUMMARY_TOKEN_BUDGET,
+    MEMORY_RECENT_TURNS,
+)
+from src.core.data.token_estimator import estimate_tokens
+from src.core.data.tokenizer import content_tokens
 
 
 class MemoryManager:
@@ -13,11 +25,36 @@ class MemoryManager:
     Manages short-term conversational memory.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        token_budget: int = MEMORY_TOKEN_BUDGET,
+        summary_token_budget: int = MEMORY_SUMMARY_TOKEN_BUDGET,
+    ) -> None:
         """
         Initialize memory storage.
+
+        Args:
+            token_budget (int): Token budget for retained turns.
+            summary_token_budget (int): Token budget for the rolling summary.
         """
-        self.memory: List[Dict[str, str]] = []
+
+        self.token_budget: int = token_budget
+        self.summary_token_budget: int = summary_token_budget
+
+        # Turns are formatted once, when added
+        self.memory: Deque[Dict[str, Any]] = deque()
+        self.memory_tokens: int = 0
+
+        self.summary_lines: Deque[Dict[str, Any]] = deque()
+        self.summary_tokens: int = 0
+        self._summary_text: str = ""
+
+        # Replaced by a globally unique id on every change, so copies
+        # are stale exactly when their ids differ; empty until changed
+        self.revision: str = ""
+
+        # Called after every change (e.g. to persist the session)
+        self.on_update: Optional[Callable[[], None]] = None
 
     def add_interaction(self, user_query: str, assistant_response: str) -> None:
         """
@@ -28,30 +65,193 @@ class MemoryManager:
             assistant_response (str): Assistant answer.
         """
 
-        self.memory.append({"user": user_query, "assistant": assistant_response})
+        formatted: str = f"User: {user_query}\nAssistant: {assistant_response}"
+
+        turn: Dict[str, Any] = {
+            "user": user_query,
+            "assistant": assistant_response,
+            "formatted": formatted,
+            "tokens": estimate_tokens(formatted),
+            "keywords": content_tokens(user_query),
+        }
+
+        self.memory.append(turn)
+        self.memory_tokens += turn["tokens"]
 
-        # Enforce memory limit
-        if len(self.memory) > MAX_SHORT_TERM_MEMORY:
-            self.memory.pop(0)
+        # Enforce turn and token limits, always keeping the latest turn
+        while len(self.memory) > 1 and (
+            len(self.memory) > MAX_SHORT_TERM_MEMORY
+            or self.memory_tokens > self.token_budget
+        ):
+            evicted: Dict[str, Any] = self.memory.popleft()
+            self.memory_tokens -= evicted["tokens"]
+            self._add_to_summary(evicted)
 
-    def get_memory_context(self) -> str:
+        self._mark_updated()
+
+    def get_memory_context(self, query: Optional[str] = None) -> str:
         """
         Build formatted conversation history for LLM.
 
+        Args:
+            query (Optional[str]): Current question. When given, only the
+                most recent turns and older turns sharing keywords with it
+                are included.
+
         Returns:
             str: Conversation context string.
         """
 
-        conversation_lines: List[str] = []
+        turns: List[Dict[str, Any]] = list(self.memory)
+
+        if query is not None:
+            query_keywords: Set[str] = content_tokens(query)
+            recent_start: int = len(turns) - MEMORY_RECENT_TURNS
+
+            turns = [
+                turn
+                for idx, turn in enumerate(turns)
+                if idx >= recent_start or turn["keywords"] & query_keywords
+            ]
 
-        for interaction in self.memory:
-            conversation_lines.append(f"User: {interaction['user']}")
-            conversation_lines.append(f"Assistant: {interaction['assistant']}")
+        sections: List[str] = []
 
-        return "\n".join(conversation_lines)
+        if self._summary_text:
+            sections.append(self._summary_text)
+
+        sections.extend(turn["formatted"] for turn in turns)
+
+        return "\n".join(sections)
+
+    def token_count(self) -> int:
+        """
+        Estimated tokens held by retained turns and the summary.
+
+        Returns:
+            int
+        """
+
+        return self.memory_tokens + self.summary_tokens
 
     def clear_memory(self) -> None:
         """
         Clear entire memory.
         """
         self.memory.clear()
+        self.memory_tokens = 0
+
+        self.summary_lines.clear()
+        self.summary_tokens = 0
+        self._summary_text = ""
+
+        self._mark_updated()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize memory for a shared state backend.
+
+        Returns:
+            Dict[str, Any]: Turns, summary lines and revision.
+        """
+
+        return {
+            "turns": [
+                {"user": turn["user"], "assistant": turn["assistant"]}
+                for turn in self.memory
+            ],
+            "summary": [line["text"] for line in self.summary_lines],
+            "revision": self.revision,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryManager":
+        """
+        Rebuild memory serialized with to_dict().
+
+        Args:
+            data (Dict[str, Any])
+
+        Returns:
+            MemoryManager
+        """
+
+        memory_manager: MemoryManager = cls()
+
+        for text in data.get("summary", []):
+            memory_manager.summary_lines.append(
+                {"text": text, "tokens": estimate_tokens(text)}
+            )
+            memory_manager.summary_tokens += estimate_tokens(text)
+
+        memory_manager._refresh_summary_text()
+
+        for turn in data.get("turns", []):
+            memory_manager.add_interaction(turn["user"], turn["assistant"])
+
+        memory_manager.revision = data.get("revision", "")
+
+        return memory_manager
+
+    def _add_to_summary(self, turn: Dict[str, Any]) -> None:
+        """
+        Compact an evicted turn into the rolling summary.
+
+        Args:
+            turn (Dict[str, Any]): Evicted turn.
+        """
+
+        answer_sentence: str = turn["assistant"].split(". ")[0]
+
+        line: str = (
+            f"- Asked: {self._truncate(turn['user'], 80)} "
+            f"| Answered: {self._truncate(answer_sentence, 120)}"
+        )
+
+        summary_line: Dict[str, Any] = {"text": line, "tokens": estimate_tokens(line)}
+
+        self.summary_lines.append(summary_line)
+        self.summary_tokens += summary_line["tokens"]
+
+        while self.summary_tokens > self.summary_token_budget and self.summary_lines:
+            dropped: Dict[str, Any] = self.summary_lines.popleft()
+            self.summary_tokens -= dropped["tokens"]
+
+        self._refresh_summary_text()
+
+    def _refresh_summary_text(self) -> None:
+        """
+        Rebuild the cached summary text after the summary changed.
+        """
+
+        self._summary_text = (
+            "Summary of earlier conversation:\n"
+            + "\n".join(line["text"] for line in self.summary_lines)
+            if self.summary_lines
+            else ""
+        )
+
+    def _mark_updated(self) -> None:
+        """
+        Assign a new revision and notify the update hook.
+        """
+
+        self.revision = uuid.uuid4().hex
+
+        if self.on_update is not None:
+            self.on_update()
+
+    def _truncate(self, text: str, max_chars: int) -> str:
+        """
+        Shorten text to max_chars, marking the cut with an ellipsis.
+
+        Args:
+            text (str)
+            max_chars (int)
+
+        Returns:
+            str
+        """
+
+        text = " ".join(text.split())
+
+        return text if len(text) <= max_chars else text[: max_chars - 3] + "..."
@@ -0,0 +1,569 @@
+"""
+Metrics Module
+
+Process-wide counters, gauges and latency histograms shared across
+API endpoints and services.
+
+Recording is a dictionary update under a lock; nothing is formatted
+until /metrics is scraped. With METRICS_ENABLED off, every recording
+call returns before building its key.
+
+With several workers, each one writes its metrics to a file in
+METRICS_MULTIPROCESS_DIR every METRICS_FLUSH_INTERVAL_SECONDS, and a
+scrape served by any worker merges all of them: counters and
+histograms are summed, gauges report the most recently set value.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+import atexit
+import bisect
+import contextlib
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from src.config.settings import (
+    METRICS_ENABLED,
+    METRICS_LATENCY_BUCKETS,
+    METRICS_MULTIPROCESS_DIR,
+    METRICS_FLUSH_INTERVAL_SECONDS,
+)
+
+
+def metric_key(name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build a metric key such as 'name{label="value"}'.
+
+    Args:
+        name (str): Metric name.
+        labels (Optional[Dict[str, str]]): Metric labels.
+
+    Returns:
+        str: Metric key.
+    """
+
+    if not labels:
+        return name
+
+    label_str: str = ",".join(
+        f'{label}="{_escape(str(value))}"' for label, value in sorted(labels.items())
+    )
+
+    return f"{name}{{{label_str}}}"
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+
+    Args:
+        value (str)
+
+    Returns:
+        str
+    """
+
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _split_key(key: str) -> Tuple[str, str]:
+    """
+    Split a metric key into its name and label string.
+
+    Args:
+        key (str): Key built by metric_key.
+
+    Returns:
+        Tuple[str, str]: (name, 'label="value",...'), labels empty if none.
+    """
+
+    name, _, labels = key.partition("{")
+
+    return name, labels[:-1]
+
+
+def _format_value(value: float) -> str:
+    """
+    Sample value in the Prometheus text format.
+
+    Args:
+        value (float)
+
+    Returns:
+        str
+    """
+
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Timer:
+    """
+    Context manager observing its own duration into a histogram.
+    """
+
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        labels: Optional[Dict[str, str]],
+    ) -> None:
+        self.registry: MetricsRegistry = registry
+        self.name: str = name
+        self.labels: Optional[Dict[str, str]] = labels
+        self.start: float = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        self.registry.observe(self.name, time.perf_counter() - self.start, self.labels)
+
+        return False
+
+
+# Handed out by a disabled registry: times nothing
+_NULL_TIMER: contextlib.nullcontext = contextlib.nullcontext()
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and histograms.
+
+    Histograms keep count and sum alongside their buckets, so they are
+    also reported as summaries (count/sum) in the JSON snapshot.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = METRICS_ENABLED,
+        buckets: Optional[List[float]] = None,
+        shared_dir: str = METRICS_MULTIPROCESS_DIR,
+        flush_interval_seconds: float = METRICS_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Initialize empty metric storage.
+
+        Args:
+            enabled (bool): Record metrics; when False recording is a no-op.
+            buckets (Optional[List[float]]): Histogram bucket upper bounds,
+                ascending (METRICS_LATENCY_BUCKETS by default).
+            shared_dir (str): Directory the metrics of all worker
+                processes are merged through once start_sharing() is
+                called; "" keeps them per process.
+            flush_interval_seconds (float): Interval between writes of
+                this process's metrics to shared_dir.
+        """
+
+        self.enabled: bool = enabled
+        self.buckets: List[float] = sorted(buckets or METRICS_LATENCY_BUCKETS)
+        self.shared_dir: str = shared_dir
+        self.flush_interval_seconds: float = flush_interval_seconds
+
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._gauge_times: Dict[str, float] = {}
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        # File of this process in shared_dir, set by start_sharing()
+        self._worker_path: Optional[str] = None
+        self._sharing_pid: Optional[int] = None
+
+    def increment(
+        self,
+        name: str,
+        value: float = 1.0,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name (str): Counter name.
+            value (float): Amount to add.
+            labels (Optional[Dict[str, str]]): Metric labels.
+        """
+
+        if not self.enabled:
+            return
+
+        key: str = metric_key(name, labels)
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set_gauge(
+        self, name: str, value: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Set a gauge (e.g. an index size) to its current value.
+
+        Args:
+            name (str): Gauge name.
+            value (float): Current value.
+            labels (Optional[Dict[str, str]]): Metric labels.
+        """
+
+        if not self.enabled:
+            return
+
+        key: str = metric_key(name, labels)
+
+        with self._lock:
+            self._gauges[key] = value
+            self._gauge_times[key] = time.time()
+
+    def observe(
+        self, name: str, value: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Record an observation (e.g. a latency in seconds).
+
+        Args:
+            name (str): Histogram name.
+            value (float): Observed value.
+            labels (Optional[Dict[str, str]]): Metric labels.
+        """
+
+        if not self.enabled:
+            return
+
+        key: str = metric_key(name, labels)
+
+        # Index of the first bucket whose upper bound holds the value;
+        # len(buckets) is the +Inf bucket
+        bucket: int = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            summary: Optional[Dict[str, Any]] = self._summaries.get(key)
+
+            if summary is None:
+                summary = self._summaries[key] = {
+                    "count": 0.0,
+                    "sum": 0.0,
+                    "buckets": [0] * (len(self.buckets) + 1),
+                }
+
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["buckets"][bucket] += 1
+
+    def timer(self, name: str, labels: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Context manager observing the duration of its block.
+
+        Args:
+            name (str): Histogram name.
+            labels (Optional[Dict[str, str]]): Metric labels.
+
+        Returns:
+            Any: Timer context manager (a shared no-op when disabled).
+        """
+
+        if not self.enabled:
+            return _NULL_TIMER
+
+        return _Timer(self, name, labels)
+
+    def mean(
+        self, name: str, labels: Optional[Dict[str, str]] = None
+    ) -> Optional[float]:
+        """
+        Mean of a histogram's observations.
+
+        Args:
+            name (str): Histogram name.
+            labels (Optional[Dict[str, str]]): Metric labels.
+
+        Returns:
+            Optional[float]: Mean, or None if nothing was observed.
+        """
+
+        with self._lock:
+            summary: Optional[Dict[str, Any]] = self._summaries.get(
+                metric_key(name, labels)
+            )
+
+            if not summary or not summary["count"]:
+                return None
+
+            return summary["sum"] / summary["count"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copy of all metrics (of all workers once sharing).
+
+        Returns:
+            Dict[str, Any]: Counters, gauges and summaries (count/sum).
+        """
+
+        counters, gauges, histograms = self._collect()
+
+        return {
+            "counters": counters,
+            "gauges": gauges,
+            "summaries": {
+                name: {"count": summary["count"], "sum": summary["sum"]}
+                for name, summary in histograms.items()
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """
+        All metrics (of all workers once sharing) in the Prometheus text
+        exposition format (0.0.4).
+
+        Returns:
+            str
+        """
+
+        counters, gauges, histograms = self._collect()
+
+        lines: List[str] = []
+
+        for metric_type, samples in (("counter", counters), ("gauge", gauges)):
+            for name, keys in _group_by_name(samples).items():
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.extend(f"{key} {_format_value(samples[key])}" for key in keys)
+
+        bounds: List[str] = [_format_value(bound) for bound in self.buckets]
+        bounds.append("+Inf")
+
+        for name, keys in _group_by_name(histograms).items():
+            lines.append(f"# TYPE {name} histogram")
+
+            for key in keys:
+                count: float = histograms[key]["count"]
+                total: float = histograms[key]["sum"]
+                buckets: List[int] = histograms[key]["buckets"]
+                labels: str = _split_key(key)[1]
+                prefix: str = f"{labels}," if labels else ""
+                suffix: str = f"{{{labels}}}" if labels else ""
+
+                cumulative: int = 0
+
+                for bound, bucket_count in zip(bounds, buckets):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+
+                lines.append(f"{name}_sum{suffix} {_format_value(total)}")
+                lines.append(f"{name}_count{suffix} {_format_value(count)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """
+        Clear all metrics of this process.
+        """
+
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._gauge_times.clear()
+            self._summaries.clear()
+
+        if self._sharing():
+            self.flush()
+
+    def start_sharing(self) -> None:
+        """
+        Write this process's metrics to shared_dir periodically and at
+        exit, and report the merged metrics of all processes there.
+
+        Called once per worker process; a no-op when metrics are
+        disabled or shared_dir is empty.
+        """
+
+        if not self.enabled or not self.shared_dir or self._sharing():
+            return
+
+        os.makedirs(self.shared_dir, exist_ok=True)
+
+        # Unique per process lifetime: a reused pid never overwrites the
+        # counters of an exited worker
+        self._worker_path = os.path.join(
+            self.shared_dir, f"worker-{os.getpid()}-{uuid.uuid4().hex[:8]}.json"
+        )
+        self._sharing_pid = os.getpid()
+
+        self.flush()
+
+        threading.Thread(
+            target=self._flush_periodically, name="metrics-flush", daemon=True
+        ).start()
+
+        atexit.register(self.flush)
+
+    def flush(self) -> None:
+        """
+        Write this process's metrics to its file in shared_dir.
+        """
+
+        with self._lock:
+            state: Dict[str, Any] = self._export()
+
+        # Written under a temporary name, then renamed, so that readers
+        # never see a partial file
+        temp_path: str = f"{self._worker_path}.tmp"
+
+        with open(temp_path, "w") as file:
+            json.dump(state, file)
+
+        os.replace(temp_path, self._worker_path)
+
+    def _sharing(self) -> bool:
+        """
+        Whether this process shares its metrics (a forked child does
+        not until it calls start_sharing itself).
+
+        Returns:
+            bool
+        """
+
+        return self._sharing_pid == os.getpid()
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush loop of the background thread started by start_sharing.
+        """
+
+        while True:
+            time.sleep(self.flush_interval_seconds)
+
+            try:
+                self.flush()
+            except OSError:
+                # e.g. the directory was removed; retried next interval
+                continue
+
+    def _export(self) -> Dict[str, Any]:
+        """
+        Serializable copy of this process's metrics (caller holds _lock).
+
+        Returns:
+            Dict[str, Any]: Counters, gauges with the time they were set,
+                and histograms.
+        """
+
+        return {
+            "counters": dict(self._counters),
+            "gauges": {
+                key: [value, self._gauge_times[key]]
+                for key, value in self._gauges.items()
+            },
+            "histograms": {
+                key: {
+                    "count": summary["count"],
+                    "sum": summary["sum"],
+                    "buckets": list(summary["buckets"]),
+                }
+                for key, summary in self._summaries.items()
+            },
+        }
+
+    def _collect(
+        self,
+    ) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, Dict[str, Any]]]:
+        """
+        Metrics to report: this process's, or all workers' once sharing.
+
+        Returns:
+            Tuple[Dict[str, float], Dict[str, float], Dict[str, Dict[str, Any]]]:
+                Counters, gauges and histograms (count, sum, buckets).
+        """
+
+        if not self._sharing():
+            with self._lock:
+                return _merge([self._export()], len(self.buckets) + 1)
+
+        # This worker's file is brought up to date; the others are at
+        # most flush_interval_seconds old
+        self.flush()
+
+        states: List[Dict[str, Any]] = []
+
+        for path in glob.glob(os.path.join(self.shared_dir, "worker-*.json")):
+            try:
+                with open(path) as file:
+                    states.append(json.load(file))
+            except (OSError, ValueError):
+                continue
+
+        return _merge(states, len(self.buckets) + 1)
+
+
+def _merge(
+    states: List[Dict[str, Any]], bucket_count: int
+) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, Dict[str, Any]]]:
+    """
+    Merge exported metrics of several processes.
+
+    Counters and histograms are summed; a gauge takes the value set
+    most recently in any process.
+
+    Args:
+        states (List[Dict[str, Any]]): Exports of MetricsRegistry._export.
+        bucket_count (int): Histogram bucket count (including +Inf);
+            histograms written with other buckets are skipped.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, float], Dict[str, Dict[str, Any]]]:
+            Counters, gauges and histograms (count, sum, buckets).
+    """
+
+    counters: Dict[str, float] = {}
+    gauges: Dict[str, Tuple[float, float]] = {}
+    histograms: Dict[str, Dict[str, Any]] = {}
+
+    for state in states:
+        for key, value in state["counters"].items():
+            counters[key] = counters.get(key, 0.0) + value
+
+        for key, (value, set_at) in state["gauges"].items():
+            if key not in gauges or set_at > gauges[key][1]:
+                gauges[key] = (value, set_at)
+
+        for key, summary in state["histograms"].items():
+            if len(summary["buckets"]) != bucket_count:
+                continue
+
+            merged: Dict[str, Any] = histograms.setdefault(
+                key, {"count": 0.0, "sum": 0.0, "buckets": [0] * bucket_count}
+            )
+
+            merged["count"] += summary["count"]
+            merged["sum"] += summary["sum"]
+            merged["buckets"] = [
+                total + count
+                for total, count in zip(merged["buckets"], summary["buckets"])
+            ]
+
+    return counters, {key: value for key, (value, _) in gauges.items()}, histograms
+
+
+def _group_by_name(samples: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Group metric keys by metric name, both sorted.
+
+    Args:
+        samples (Dict[str, Any]): Metrics by key.
+
+    Returns:
+        Dict[str, List[str]]: Metric name -> its keys.
+    """
+
+    groups: Dict[str, List[str]] = {}
+
+    for key in sorted(samples):
+        groups.setdefault(_split_key(key)[0], []).append(key)
+
+    return dict(sorted(groups.items()))
+
+
+METRICS: MetricsRegistry = MetricsRegistry()
@@ -0,0 +1,224 @@
+"""
+Session Store Module
+
+Keeps one MemoryManager per client session, evicting idle
+sessions after a TTL and least recently used sessions once the
+session count or total memory exceeds its cap.
+
+With a shared state backend, sessions are persisted on every change
+and reloaded when another worker has updated them. Backend I/O runs
+outside the store-wide lock, serialized per session only.
+"""
+
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import threading
+import time
+from src.config.settings import (
+    SESSION_TTL_SECONDS,
+    MAX_SESSIONS,
+    MAX_TOTAL_MEMORY_TOKENS,
+)
+from src.core.state.memory_manager import MemoryManager
+from src.core.state.state_backend import StateBackend
+
+# Minimum interval between TTL sweeps of the shared backend
+BACKEND_EVICTION_INTERVAL_SECONDS: float = 60.0
+
+
+class SessionMemoryStore:
+    """
+    Session-scoped conversational memory with TTL and LRU eviction.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_sessions: int = MAX_SESSIONS,
+        max_total_tokens: int = MAX_TOTAL_MEMORY_TOKENS,
+        backend: Optional[StateBackend] = None,
+    ) -> None:
+        """
+        Initialize SessionMemoryStore.
+
+        Args:
+            ttl_seconds (float): Idle time after which a session is evicted.
+            max_sessions (int): Maximum number of live sessions.
+            max_total_tokens (int): Maximum estimated tokens across sessions.
+            backend (Optional[StateBackend]): Backend sessions are shared
+                through; process-local when omitted or not shared.
+        """
+
+        self.backend: Optional[StateBackend] = (
+            backend if backend is not None and backend.shared else None
+        )
+        self._last_backend_eviction: float = 0.0
+
+        self.ttl_seconds: float = ttl_seconds
+        self.max_sessions: int = max_sessions
+        self.max_total_tokens: int = max_total_tokens
+
+        # Ordered from least to most recently used
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, session_id: str) -> MemoryManager:
+        """
+        Get (or create) the memory of a session.
+
+        Args:
+            session_id (str): Client session identifier.
+
+        Returns:
+            MemoryManager: Session memory.
+        """
+
+        now: float = time.monotonic()
+
+        with self._lock:
+            self._evict_expired(now)
+
+            session: Dict[str, Any] = self._sessions.get(session_id)
+
+            if session is None:
+                session = {
+                    "memory": MemoryManager(),
+                    "last_access": now,
+                    "lock": threading.Lock(),
+                }
+                self._sessions[session_id] = session
+            else:
+                session["last_access"] = now
+                self._sessions.move_to_end(session_id)
+
+            self._evict_over_capacity(session_id)
+
+            evict_backend: bool = (
+                self.backend is not None
+                and now - self._last_backend_eviction
+                > BACKEND_EVICTION_INTERVAL_SECONDS
+            )
+
+            if evict_backend:
+                self._last_backend_eviction = now
+
+        if self.backend is None:
+            return session["memory"]
+
+        if evict_backend:
+            self.backend.evict_sessions(self.ttl_seconds)
+
+        # Requests of other sessions are not held up by this one's reload
+        with session["lock"]:
+            self._sync_from_backend(session_id, session)
+
+            return session["memory"]
+
+    def clear(self, session_id: str) -> None:
+        """
+        Drop a session's memory.
+
+        Args:
+            session_id (str): Client session identifier.
+        """
+
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+        if self.backend is not None:
+            self.backend.delete_session(session_id)
+
+    def clear_all(self) -> None:
+        """
+        Drop all sessions.
+        """
+
+        with self._lock:
+            self._sessions.clear()
+
+        if self.backend is not None:
+            self.backend.clear_sessions()
+
+    def clear_local(self) -> None:
+        """
+        Drop this worker's copies of all sessions, leaving the shared
+        backend untouched (e.g. after another worker published a new
+        document and already cleared it).
+        """
+
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict_expired(self, now: float) -> None:
+        """
+        Evict sessions idle for longer than the TTL.
+
+        Args:
+            now (float): Current monotonic time.
+        """
+
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+
+            if now - oldest["last_access"] < self.ttl_seconds:
+                break
+
+            self._sessions.pop(oldest_id)
+
+    def _evict_over_capacity(self, active_session_id: str) -> None:
+        """
+        Evict least recently used sessions beyond the session and token caps.
+
+        Args:
+            active_session_id (str): Session being served; never evicted.
+        """
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+        total_tokens: int = sum(
+            session["memory"].token_count() for session in self._sessions.values()
+        )
+
+        while total_tokens > self.max_total_tokens and len(self._sessions) > 1:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+
+            if oldest_id == active_session_id:
+                break
+
+            total_tokens -= oldest["memory"].token_count()
+            self._sessions.pop(oldest_id)
+
+    def _sync_from_backend(self, session_id: str, session: Dict[str, Any]) -> None:
+        """
+        Reload a session updated by another worker and persist
+        future changes to the backend.
+
+        Args:
+            session_id (str): Client session identifier.
+            session (Dict[str, Any]): Local session entry.
+        """
+
+        data: Optional[Dict[str, Any]] = self.backend.load_session(session_id)
+
+        memory: MemoryManager = session["memory"]
+
+        if data is None:
+            # Changed memory is always persisted, so a missing row means
+            # the session was cleared (or evicted) by another worker
+            if memory.revision:
+                memory = MemoryManager()
+                session["memory"] = memory
+        elif data.get("revision") != memory.revision:
+            memory = MemoryManager.from_dict(data)
+            session["memory"] = memory
+
+        if memory.on_update is None:
+            backend: StateBackend = self.backend
+
+            memory.on_update = lambda: backend.save_session(
+                session_id, memory.to_dict()
+            )
@@ -0,0 +1,490 @@
+"""
+State Backend Module
+
+Storage for document state and session memory, so that several
+uvicorn workers (or replicas sharing a volume) serve the same data.
+
+- InMemoryStateBackend: process-local, the default
+- SQLiteStateBackend: SQLite database plus on-disk FAISS index files,
+  memory-mapped by every worker
+"""
+
+from typing import Dict, Any, List, Optional, Iterator
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import json
+import os
+import sqlite3
+import threading
+import time
+from src.config.settings import (
+    STATE_BACKEND,
+    STATE_DB_PATH,
+    STATE_INDEX_DIR,
+    INDEX_MMAP_ENABLED,
+    CORPUS_MAX_DOCUMENTS,
+)
+from src.core.data.vector_store import VectorStore
+from src.core.state.document_state import DocumentState
+
+# Files making up one persisted index (FAISS index, mapped metadata
+# and metadata columns)
+INDEX_FILE_SUFFIXES: List[str] = [
+    "",
+    ".meta",
+    ".offsets.npy",
+    ".columns.npy",
+    ".columns.json",
+]
+
+
+class StateBackend(ABC):
+    """
+    Interface for document and session state storage.
+    """
+
+    @abstractmethod
+    def save_document(self, document: DocumentState) -> int:
+        """
+        Persist a document and make it the current one.
+
+        Args:
+            document (DocumentState): Fully built document state.
+
+        Returns:
+            int: Version assigned to the document.
+        """
+
+    @abstractmethod
+    def current_version(self) -> int:
+        """
+        Version of the current document (0 when none was uploaded).
+
+        Returns:
+            int
+        """
+
+    @abstractmethod
+    def load_document(self) -> Optional[DocumentState]:
+        """
+        Load the current document.
+
+        Returns:
+            Optional[DocumentState]
+        """
+
+    @abstractmethod
+    def list_documents(self) -> List[Dict[str, Any]]:
+        """
+        Documents kept for corpus search (the newest
+        CORPUS_MAX_DOCUMENTS, the current one included).
+
+        Returns:
+            List[Dict[str, Any]]: version, document_id and created_at
+                (Unix seconds) per document.
+        """
+
+    @abstractmethod
+    def load_vector_store(self, version: int) -> Optional[VectorStore]:
+        """
+        Load the index of a kept document.
+
+        Args:
+            version (int)
+
+        Returns:
+            Optional[VectorStore]: None when the version is no longer kept.
+        """
+
+    @abstractmethod
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load serialized session memory.
+
+        Args:
+            session_id (str)
+
+        Returns:
+            Optional[Dict[str, Any]]
+        """
+
+    @abstractmethod
+    def save_session(self, session_id: str, data: Dict[str, Any]) -> None:
+        """
+        Persist serialized session memory.
+
+        Args:
+            session_id (str)
+            data (Dict[str, Any])
+        """
+
+    @abstractmethod
+    def delete_session(self, session_id: str) -> None:
+        """
+        Delete a session.
+
+        Args:
+            session_id (str)
+        """
+
+    @abstractmethod
+    def clear_sessions(self) -> None:
+        """
+        Delete all sessions.
+        """
+
+    def evict_sessions(self, idle_seconds: float) -> None:
+        """
+        Delete sessions not updated within idle_seconds.
+
+        Args:
+            idle_seconds (float)
+        """
+
+    @property
+    def shared(self) -> bool:
+        """
+        Whether state is shared with other processes.
+
+        Returns:
+            bool
+        """
+
+        return False
+
+
+class InMemoryStateBackend(StateBackend):
+    """
+    Process-local state; sessions live only in SessionMemoryStore.
+    """
+
+    def __init__(self) -> None:
+        self._document: Optional[DocumentState] = None
+        self._version: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+        # version -> (document_id, created_at, vector_store); only the
+        # index is kept, so superseded snapshots are still released
+        self._corpus: Dict[int, tuple] = {}
+
+    def save_document(self, document: DocumentState) -> int:
+        with self._lock:
+            version: int = self._version + 1
+            document.version = version
+
+            # Document before version, so readers never see a version
+            # whose document is not yet stored
+            self._corpus[version] = (
+                document.document_id,
+                time.time(),
+                document.vector_store,
+            )
+
+            for old_version in sorted(self._corpus)[:-CORPUS_MAX_DOCUMENTS]:
+                del self._corpus[old_version]
+
+            self._document = document
+            self._version = version
+
+            return version
+
+    def current_version(self) -> int:
+        return self._version
+
+    def load_document(self) -> Optional[DocumentState]:
+        return self._document
+
+    def list_documents(self) -> List[Dict[str, Any]]:
+        return [
+            {"version": version, "document_id": document_id, "created_at": created_at}
+            for version, (document_id, created_at, _) in list(self._corpus.items())
+        ]
+
+    def load_vector_store(self, version: int) -> Optional[VectorStore]:
+        entry: Optional[tuple] = self._corpus.get(version)
+
+        return entry[2] if entry is not None else None
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    def save_session(self, session_id: str, data: Dict[str, Any]) -> None:
+        pass
+
+    def delete_session(self, session_id: str) -> None:
+        pass
+
+    def clear_sessions(self) -> None:
+        pass
+
+
+class SQLiteStateBackend(StateBackend):
+    """
+    Shared local state: SQLite (WAL mode) for documents, chunk
+    metadata and sessions; FAISS index files on disk.
+    """
+
+    def __init__(self, db_path: str = STATE_DB_PATH, index_dir: str = STATE_INDEX_DIR):
+        """
+        Initialize SQLiteStateBackend.
+
+        Args:
+            db_path (str): SQLite database file.
+            index_dir (str): Directory for FAISS index files.
+        """
+
+        self.db_path: str = db_path
+        self.index_dir: str = index_dir
+
+        # One connection per thread, reused across calls (every /ask
+        # checks the current version)
+        self._local: threading.local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        os.makedirs(index_dir, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    version INTEGER PRIMARY KEY AUTOINCREMENT,
+                    document_id TEXT NOT NULL,
+                    document_text TEXT NOT NULL,
+                    structured_data TEXT NOT NULL,
+                    structured_context TEXT NOT NULL,
+                    index_path TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """)
+
+    @property
+    def shared(self) -> bool:
+        return True
+
+    def save_document(self, document: DocumentState) -> int:
+        # Write index files under a temporary name, then rename, so a
+        # reader never opens a partially written index
+        temp_path: str = os.path.join(
+            self.index_dir, f"pending-{os.getpid()}-{time.time_ns()}.faiss"
+        )
+        document.vector_store.save(temp_path)
+
+        with self._connect() as connection:
+            cursor = connection.execute(
+                """
+                INSERT INTO documents (document_id, document_text, structured_data,
+                    structured_context, index_path, created_at)
+                VALUES (?, ?, ?, ?, '', ?)
+                """,
+                (
+                    document.document_id,
+                    document.document_text,
+                    json.dumps(document.structured_data),
+                    document.structured_context,
+                    time.time(),
+                ),
+            )
+            version: int = cursor.lastrowid
+
+            index_path: str = os.path.join(self.index_dir, f"{version}.faiss")
+
+            for suffix in INDEX_FILE_SUFFIXES:
+                os.replace(temp_path + suffix, index_path + suffix)
+
+            connection.execute(
+                "UPDATE documents SET index_path = ? WHERE version = ?",
+                (index_path, version),
+            )
+
+            # Older versions stay searchable as corpus shards, up to
+            # CORPUS_MAX_DOCUMENTS documents
+            oldest_kept: int = version - CORPUS_MAX_DOCUMENTS + 1
+
+            superseded: List[tuple] = connection.execute(
+                "SELECT version, index_path FROM documents WHERE version < ?",
+                (oldest_kept,),
+            ).fetchall()
+
+            connection.execute(
+                "DELETE FROM documents WHERE version < ?", (oldest_kept,)
+            )
+
+        # Unlinking is safe while workers still serve an old version: its
+        # mapped pages are freed when their last reader releases it
+        for _, old_index_path in superseded:
+            for suffix in INDEX_FILE_SUFFIXES:
+                if os.path.exists(old_index_path + suffix):
+                    os.remove(old_index_path + suffix)
+
+        # Serve the published files (shared with other workers) from here too
+        if INDEX_MMAP_ENABLED:
+            document.vector_store = VectorStore.load(index_path)
+
+        document.version = version
+
+        return version
+
+    def current_version(self) -> int:
+        with self._connect() as connection:
+            row = connection.execute("SELECT MAX(version) FROM documents").fetchone()
+
+        return row[0] or 0
+
+    def load_document(self) -> Optional[DocumentState]:
+        # A newer upload may remove the index file between reading its
+        # path and opening it; the newer row is then picked up on retry
+        for _ in range(3):
+            try:
+                return self._load_latest_document()
+            except FileNotFoundError:
+                continue
+
+        return self._load_latest_document()
+
+    def list_documents(self) -> List[Dict[str, Any]]:
+        with self._connect() as connection:
+            rows: List[tuple] = connection.execute(
+                "SELECT version, document_id, created_at FROM documents"
+            ).fetchall()
+
+        return [
+            {"version": version, "document_id": document_id, "created_at": created_at}
+            for version, document_id, created_at in rows
+        ]
+
+    def load_vector_store(self, version: int) -> Optional[VectorStore]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT index_path FROM documents WHERE version = ?", (version,)
+            ).fetchone()
+
+        if row is None or not row[0]:
+            return None
+
+        try:
+            return VectorStore.load(row[0])
+        except (FileNotFoundError, RuntimeError):
+            # Removed by a newer upload since the row was read
+            return None
+
+    def _load_latest_document(self) -> Optional[DocumentState]:
+        """
+        Load the highest document version.
+
+        Returns:
+            Optional[DocumentState]
+        """
+
+        with self._connect() as connection:
+            row = connection.execute("""
+                SELECT version, document_id, document_text, structured_data,
+                    structured_context, index_path
+                FROM documents ORDER BY version DESC LIMIT 1
+                """).fetchone()
+
+        if row is None:
+            return None
+
+        (
+            version,
+            document_id,
+            document_text,
+            structured_data,
+            structured_context,
+            index_path,
+        ) = row
+
+        if not os.path.exists(index_path):
+            raise FileNotFoundError(index_path)
+
+        return DocumentState(
+            document_id=document_id,
+            document_text=document_text,
+            structured_data=json.loads(structured_data),
+            structured_context=structured_context,
+            vector_store=VectorStore.load(index_path),
+            version=version,
+        )
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def save_session(self, session_id: str, data: Dict[str, Any]) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO sessions (session_id, data, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    data = excluded.data, updated_at = excluded.updated_at
+                """,
+                (session_id, json.dumps(data), time.time()),
+            )
+
+    def delete_session(self, session_id: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+
+    def clear_sessions(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM sessions")
+
+    def evict_sessions(self, idle_seconds: float) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM sessions WHERE updated_at < ?",
+                (time.time() - idle_seconds,),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        This thread's connection, committing on exit (rolling back on error).
+
+        Yields:
+            sqlite3.Connection
+        """
+
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30.0)
+            self._local.connection = connection
+
+        with connection:
+            yield connection
+
+
+def create_state_backend(backend_name: str = STATE_BACKEND) -> StateBackend:
+    """
+    Build the configured state backend.
+
+    Args:
+        backend_name (str): "memory" or "sqlite".
+
+    Returns:
+        StateBackend
+    """
+
+    if backend_name == "memory":
+        return InMemoryStateBackend()
+
+    if backend_name == "sqlite":
+        return SQLiteStateBackend()
+
+    raise ValueError(f"Unsupported state backend: {backend_name}")
@@ -6,6 +6,7 @@ import streamlit as st
 import requests
 from typing import Dict
 import os
+import uuid
 
 # Backend URL - configurable for cloud deployment
 API_BASE_URL: str = os.getenv("BACKEND_URL", "http://127.0.0.1:8000")
@@ -32,20 +33,22 @@ def upload_document(file, api_key: str) -> Dict:
     return response.json()
 
 
-def ask_question(query: str, api_key: str) -> Dict:
+def ask_question(query: str, api_key: str, session_id: str) -> Dict:
     """
     Send question to backend API.
 
     Args:
         query (str): User query.
         api_key (str): OpenAI API key.
+        session_id (str): Conversation session identifier.
 
     Returns:
         Dict: API response.
     """
 
     response = requests.post(
-        f"{API_BASE_URL}/ask", params={"query": query, "api_key": api_key}
+        f"{API_BASE_URL}/ask",
+        params={"query": query, "api_key": api_key, "session_id": session_id},
     )
 
     return response.json()
@@ -80,6 +83,12 @@ def main() -> None:
 
     st.set_page_config(page_title="UltraDoc Intelligence RAG", layout="wide")
 
+    # One conversation memory per browser session
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = uuid.uuid4().hex
+
+    session_id: str = st.session_state["session_id"]
+
     st.title("UltraDoc Intelligence – RAG System")
 
     st.sidebar.header("Configuration")
@@ -105,7 +114,7 @@ def main() -> None:
 
     if st.button("Ask") and query and api_key:
         with st.spinner("Generating answer..."):
-            response = ask_question(query, api_key)
+            response = ask_question(query, api_key, session_id)
 
         if "error" in response:
             st.error(response["error"])
@@ -120,7 +129,7 @@ def main() -> None:
             st.text_area("Sources", value=response.get("sources", ""), height=200)
 
     if st.sidebar.button("Clear Conversation Memory"):
-        requests.post(f"{API_BASE_URL}/clear_memory")
+        requests.post(f"{API_BASE_URL}/clear_memory", params={"session_id": session_id})
         st.success("Memory cleared.")
 
     st.divider()